@@ -4,9 +4,10 @@ from .keys import EosKey  # noqa
 from .rpc import EosJsonRpc  # noqa
 from .types import (
     UInt8, UInt16, UInt32, UInt64, Int8, Int16, Int32, Int64, VarUInt, Float32,
-    Float64, TimePointSec, TimePoint, Name, AbiBytes, BaseAbiObject,
-    is_abi_object, EosPermissionLevel, EosKeyWeight, EosPermissionLevelWeight,
-    EosWaitWeight, EosAuthority, AbiActionPayload, EosAction, EosTransaction
+    Float64, TimePointSec, TimePoint, Name, AbiBytes, Symbol, Asset, PublicKey,
+    BaseAbiObject, is_abi_object, add_slots, EosPermissionLevel, EosKeyWeight,
+    EosPermissionLevelWeight, EosWaitWeight, EosAuthority, AbiActionPayload,
+    EosAction, EosTransaction
 )  # noqa
 
 __all__ = [
@@ -26,7 +27,8 @@ __all__ = [
     # base ABI types
     'UInt8', 'UInt16', 'UInt32', 'UInt64', 'Int8', 'Int16', 'Int32', 'Int64',
     'VarUInt', 'Float32', 'Float64', 'TimePointSec', 'TimePoint', 'Name',
-    'AbiBytes', 'BaseAbiObject', 'is_abi_object',
+    'AbiBytes', 'Symbol', 'Asset', 'PublicKey', 'BaseAbiObject',
+    'is_abi_object', 'add_slots',
 
     # authority
     'EosPermissionLevel', 'EosKeyWeight', 'EosPermissionLevelWeight',
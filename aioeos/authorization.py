@@ -0,0 +1,257 @@
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from aioeos.keys import _parse_public_key_cached
+from aioeos.rpc import EosJsonRpc
+from aioeos.types import (
+    EosAuthority, EosKeyWeight, EosPermissionLevel, EosPermissionLevelWeight,
+    EosWaitWeight
+)
+
+
+# max depth of account permissions nesting, same as default on-chain limit
+MAX_AUTHORITY_DEPTH = 6
+
+
+def authority_from_dict(data: dict) -> EosAuthority:
+    """Converts ``required_auth`` object returned by RPC to EosAuthority"""
+    return EosAuthority(
+        threshold=data['threshold'],
+        keys=[
+            EosKeyWeight(key=key['key'], weight=key['weight'])
+            for key in data.get('keys', [])
+        ],
+        accounts=[
+            EosPermissionLevelWeight(
+                permission=EosPermissionLevel(
+                    actor=account['permission']['actor'],
+                    permission=account['permission']['permission']
+                ),
+                weight=account['weight']
+            )
+            for account in data.get('accounts', [])
+        ],
+        waits=[
+            EosWaitWeight(wait_sec=wait['wait_sec'], weight=wait['weight'])
+            for wait in data.get('waits', [])
+        ]
+    )
+
+
+class EosPermissionCache:
+    """
+    Caches account permissions fetched with ``get_account``, so resolving
+    authorities doesn't require a request for each transaction. All
+    permissions of an account are loaded at once.
+
+    :param rpc: RPC client used on cache miss,
+    :param ttl: time in seconds after which account is fetched again
+    """
+
+    def __init__(self, rpc: Optional[EosJsonRpc] = None, *, ttl: float = 60):
+        self.rpc = rpc
+        self.ttl = ttl
+
+        # account name -> (fetch timestamp, permission name -> authority)
+        self._accounts: Dict[str, Tuple[float, Dict[str, EosAuthority]]] = {}
+
+    def put(self, account: str, permission: str, authority: EosAuthority):
+        """Stores permission, entries added this way never expire"""
+        if account not in self._accounts:
+            self._accounts[account] = (float('inf'), {})
+        self._accounts[account][1][permission] = authority
+
+    def get_cached(
+        self, account: str, permission: str
+    ) -> Optional[EosAuthority]:
+        """Returns cached authority of a permission without fetching it"""
+        fetched_at, permissions = self._accounts.get(account, (0, {}))
+        if fetched_at + self.ttl < time.time():
+            return None
+        return permissions.get(permission)
+
+    def invalidate(self, account: str = ''):
+        """Removes account from the cache, removes all accounts by default"""
+        if account:
+            self._accounts.pop(account, None)
+        else:
+            self._accounts.clear()
+
+    async def load(self, account: str):
+        """Fetches all permissions of an account"""
+        assert self.rpc, 'RPC client is required to fetch permissions'
+        data = await self.rpc.get_account(account)
+        self._accounts[account] = (time.time(), {
+            permission['perm_name']: authority_from_dict(
+                permission['required_auth']
+            )
+            for permission in data['permissions']
+        })
+
+    async def get(
+        self, account: str, permission: str
+    ) -> Optional[EosAuthority]:
+        """Returns authority of a permission, fetching account if needed"""
+        authority = self.get_cached(account, permission)
+        if not authority and self.rpc:
+            await self.load(account)
+            authority = self.get_cached(account, permission)
+        return authority
+
+
+class EosAuthorityEvaluator:
+    """
+    Decides locally whether an authority is satisfied by given keys and
+    delay, without ``get_required_keys`` requests. Permissions referenced
+    by the authority are taken from a permission cache, so evaluation works
+    offline if the cache is filled with ``EosPermissionCache.put``.
+
+    Authority entries are visited the same way as the node does it, in
+    order of descending weight, waits before keys before accounts, so keys
+    returned by the evaluator are exactly the ones the node would use.
+
+    :param permissions: permission cache used for account permissions,
+    :param max_depth: max depth of account permissions nesting
+    """
+
+    def __init__(
+        self,
+        permissions: EosPermissionCache,
+        *,
+        max_depth: int = MAX_AUTHORITY_DEPTH
+    ):
+        self.permissions = permissions
+        self.max_depth = max_depth
+
+    def _get_authority(
+        self, authority: Union[EosAuthority, EosPermissionLevel]
+    ) -> Optional[EosAuthority]:
+        if isinstance(authority, EosPermissionLevel):
+            return self.permissions.get_cached(
+                authority.actor, authority.permission
+            )
+        return authority
+
+    async def load(
+        self,
+        authority: Union[EosAuthority, EosPermissionLevel],
+        depth: int = 0
+    ):
+        """Fetches permissions referenced by the authority into the cache"""
+        if depth > self.max_depth:
+            return
+        if isinstance(authority, EosPermissionLevel):
+            fetched = await self.permissions.get(
+                authority.actor, authority.permission
+            )
+            if not fetched:
+                return
+            authority = fetched
+
+        for account in authority.accounts:
+            await self.load(account.permission, depth + 1)
+
+    def _satisfy(
+        self,
+        authority: EosAuthority,
+        keys: Set[bytes],
+        delay_sec: int,
+        depth: int
+    ) -> Optional[Set[bytes]]:
+        """Returns keys used to satisfy authority, None if it's not"""
+        if depth > self.max_depth:
+            return None
+
+        entries: List[Tuple[int, int, object]] = [
+            (wait.weight, 0, wait) for wait in authority.waits
+        ] + [
+            (key.weight, 1, key) for key in authority.keys
+        ] + [
+            (account.weight, 2, account) for account in authority.accounts
+        ]
+        entries.sort(key=lambda entry: (-entry[0], entry[1]))
+
+        total = 0
+        used: Set[bytes] = set()
+        for weight, _, entry in entries:
+            if isinstance(entry, EosWaitWeight):
+                if entry.wait_sec > delay_sec:
+                    continue
+            elif isinstance(entry, EosKeyWeight):
+                public_key = _parse_public_key_cached(entry.key)
+                if public_key not in keys:
+                    continue
+                used.add(public_key)
+            else:
+                assert isinstance(entry, EosPermissionLevelWeight)
+                account_authority = self._get_authority(entry.permission)
+                if not account_authority:
+                    continue
+                account_keys = self._satisfy(
+                    account_authority, keys, delay_sec, depth + 1
+                )
+                if account_keys is None:
+                    continue
+                used |= account_keys
+
+            total += weight
+            if total >= authority.threshold:
+                return used
+        return None
+
+    def evaluate(
+        self,
+        authority: Union[EosAuthority, EosPermissionLevel],
+        available_keys: Iterable[str],
+        *,
+        delay_sec: int = 0
+    ) -> Optional[Set[str]]:
+        """
+        Checks if authority is satisfied by available keys and delay, using
+        only cached permissions. Returns minimal set of keys satisfying the
+        authority, none of them can be removed, or None if authority can't
+        be satisfied.
+        """
+        keys = {_parse_public_key_cached(key): key for key in available_keys}
+        resolved = self._get_authority(authority)
+        if not resolved:
+            return None
+
+        used = self._satisfy(resolved, set(keys), delay_sec, 0)
+        if used is None:
+            return None
+
+        # drop keys one by one as long as the authority stays satisfied
+        for public_key in sorted(used):
+            if public_key not in used:
+                continue
+            smaller = self._satisfy(
+                resolved, used - {public_key}, delay_sec, 0
+            )
+            if smaller is not None:
+                used = smaller
+        return {keys[public_key] for public_key in used}
+
+    async def satisfy(
+        self,
+        authority: Union[EosAuthority, EosPermissionLevel],
+        available_keys: Iterable[str],
+        *,
+        delay_sec: int = 0
+    ) -> Optional[Set[str]]:
+        """Same as ``evaluate``, but fetches missing permissions first"""
+        await self.load(authority)
+        return self.evaluate(authority, available_keys, delay_sec=delay_sec)
+
+    async def is_satisfied(
+        self,
+        authority: Union[EosAuthority, EosPermissionLevel],
+        available_keys: Iterable[str],
+        *,
+        delay_sec: int = 0
+    ) -> bool:
+        """Checks if authority is satisfied by available keys and delay"""
+        keys = await self.satisfy(
+            authority, available_keys, delay_sec=delay_sec
+        )
+        return keys is not None
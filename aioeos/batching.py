@@ -0,0 +1,224 @@
+import asyncio
+from dataclasses import replace
+from typing import (
+    Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple, Type
+)
+
+from aioeos import exceptions, serializer
+from aioeos.packed import get_net_usage, signatures_size
+from aioeos.types import EosAction, EosTransaction
+
+
+# rough CPU cost of a simple action, eg. a token transfer
+DEFAULT_ACTION_CPU_US = 200
+
+_VARUINT = serializer.VarUIntSerializer()
+
+
+class EosBatchResult:
+    """
+    Outcome of pushing a batch of actions.
+
+    :param transaction: pushed transaction,
+    :param response: value returned by the send callable, ``None`` if the
+                     transaction failed,
+    :param error: exception raised by the send callable
+    """
+
+    def __init__(
+        self,
+        transaction: EosTransaction,
+        response: Any = None,
+        error: Optional[Exception] = None
+    ):
+        self.transaction = transaction
+        self.response = response
+        self.error = error
+
+    @property
+    def actions(self) -> List[EosAction]:
+        return self.transaction.actions
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class EosActionBatcher:
+    """
+    Groups actions into transactions, so that each transaction stays within
+    packed size, action count and estimated CPU limits. Sizes are computed
+    from serialized actions, so action payloads have to be binary or ABI
+    objects.
+
+    When a batch fails with one of ``isolated_exceptions``, usually because
+    a single action asserted, it's split in halves which are pushed
+    separately, until the failing actions end up in their own transactions.
+    This way a single bad action doesn't fail the rest of its batch. Other
+    exceptions fail the whole batch, without retrying it.
+
+    :param max_size: max size of packed transaction in bytes,
+    :param max_actions: max number of actions in a transaction,
+    :param max_cpu_us: max estimated CPU usage of a transaction,
+    :param max_net_usage_words: max NET usage of a transaction, including
+                                signatures,
+    :param signature_count: number of signatures of each transaction,
+    :param cpu_estimator: returns estimated CPU usage of an action in
+                          microseconds, constant by default,
+    :param template: transaction used as a base for batches, eg. with
+                     TAPOS fields set,
+    :param isolated_exceptions: exceptions which cause a batch to be split
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 32 * 1024,
+        max_actions: int = 100,
+        max_cpu_us: int = 20000,
+        max_net_usage_words: Optional[int] = None,
+        signature_count: int = 1,
+        cpu_estimator: Optional[Callable[[EosAction], int]] = None,
+        template: Optional[EosTransaction] = None,
+        isolated_exceptions: Tuple[Type[Exception], ...] = (
+            exceptions.EosAssertMessageException,
+        )
+    ):
+        assert max_actions > 0, 'Batch has to fit at least one action'
+        self.max_size = max_size
+        self.max_actions = max_actions
+        self.max_cpu_us = max_cpu_us
+        self.max_net_usage_words = max_net_usage_words
+        self.signature_count = signature_count
+        self.cpu_estimator = cpu_estimator or (
+            lambda action: DEFAULT_ACTION_CPU_US
+        )
+        self.template = template
+        self.isolated_exceptions = isolated_exceptions
+
+        # empty transaction without the action count
+        self._base_size = len(
+            serializer.serialize(self.make_transaction([]))
+        ) - 1
+
+    def packed_size(self, actions: List[EosAction]) -> int:
+        """Returns size of packed transaction containing given actions"""
+        return self._packed_size(
+            len(actions), sum(self.action_size(x) for x in actions)
+        )
+
+    def _packed_size(self, count: int, actions_size: int) -> int:
+        return (
+            self._base_size + len(_VARUINT.serialize(count)) + actions_size
+        )
+
+    def net_usage_words(self, actions: List[EosAction]) -> int:
+        """Returns NET usage in words of transaction with given actions"""
+        return self._net_usage_words(self.packed_size(actions))
+
+    def _net_usage_words(self, packed_size: int) -> int:
+        delay_sec = self.template.delay_sec if self.template else 0
+        usage = get_net_usage(
+            packed_size, signatures_size(self.signature_count), delay_sec
+        )
+        return (usage + 7) // 8
+
+    def _fits(self, count: int, actions_size: int, cpu: int) -> bool:
+        packed_size = self._packed_size(count, actions_size)
+        return (
+            count <= self.max_actions
+            and packed_size <= self.max_size
+            and cpu <= self.max_cpu_us
+            and (
+                self.max_net_usage_words is None
+                or self._net_usage_words(packed_size)
+                <= self.max_net_usage_words
+            )
+        )
+
+    def action_size(self, action: EosAction) -> int:
+        """Returns size of packed action"""
+        return len(serializer.serialize(action, EosAction))
+
+    def make_transaction(self, actions: List[EosAction]) -> EosTransaction:
+        """
+        Creates transaction with given actions, from template if it's set.
+        Otherwise transaction gets the default expiration.
+        """
+        if not self.template:
+            return EosTransaction(actions=list(actions))
+        return replace(self.template, actions=list(actions))
+
+    def plan(self, actions: Iterable[EosAction]) -> Iterator[EosTransaction]:
+        """
+        Lazily groups actions into transactions, keeping their order. Action
+        which doesn't fit the limits on its own gets a transaction of its
+        own.
+        """
+        batch: List[EosAction] = []
+        size = 0
+        cpu = 0
+        for action in actions:
+            action_size = self.action_size(action)
+            action_cpu = self.cpu_estimator(action)
+            if batch and not self._fits(
+                len(batch) + 1, size + action_size, cpu + action_cpu
+            ):
+                yield self.make_transaction(batch)
+                batch, size, cpu = [], 0, 0
+            batch.append(action)
+            size += action_size
+            cpu += action_cpu
+        if batch:
+            yield self.make_transaction(batch)
+
+    async def send(
+        self,
+        actions: Iterable[EosAction],
+        send: Callable[[EosTransaction], Awaitable[Any]],
+        *,
+        concurrency: int = 1
+    ) -> List[EosBatchResult]:
+        """
+        Groups actions into transactions and pushes them with given
+        callable, eg. ``EosTransactionSender.send`` with keys bound. Returns
+        results in the order of actions, failed actions are isolated in
+        their own results. Exceptions raised by the callable are returned in
+        results, so one failing batch doesn't stop the others.
+        """
+        assert concurrency > 0, 'Concurrency has to be a positive number'
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send_batch(transaction):
+            async with semaphore:
+                return await self._send_isolated(transaction, send)
+
+        results = await asyncio.gather(*(
+            send_batch(transaction) for transaction in self.plan(actions)
+        ))
+        return [result for batch in results for result in batch]
+
+    async def _send_isolated(
+        self,
+        transaction: EosTransaction,
+        send: Callable[[EosTransaction], Awaitable[Any]]
+    ) -> List[EosBatchResult]:
+        try:
+            response = await send(transaction)
+        except Exception as e:
+            if (
+                not isinstance(e, self.isolated_exceptions)
+                or len(transaction.actions) == 1
+            ):
+                return [EosBatchResult(transaction, error=e)]
+
+            middle = len(transaction.actions) // 2
+            return [
+                *await self._send_isolated(
+                    self.make_transaction(transaction.actions[:middle]), send
+                ),
+                *await self._send_isolated(
+                    self.make_transaction(transaction.actions[middle:]), send
+                )
+            ]
+        return [EosBatchResult(transaction, response)]
@@ -0,0 +1,499 @@
+"""
+Generates ABI classes and action helpers from contract ABIs. Classes can be
+created at runtime with ``EosAbi``, or written down as a Python module in the
+style of ``aioeos.contracts``::
+
+    python -m aioeos.codegen eosio.token.abi -o eosio_token.py
+    python -m aioeos.codegen eosio.token --url https://... -o eosio_token.py
+
+Source can be an ABI file in JSON or binary format, or name of the contract
+account, in which case ABI is fetched with ``get_abi``.
+"""
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass, Field, fields, make_dataclass
+import json
+from keyword import iskeyword
+import os
+import re
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+
+from aioeos import exceptions, serializer, types
+from aioeos.rpc import EosJsonRpc
+from aioeos.types.transaction import EosExtension
+
+
+# ABI built-in types which have a serializer
+ABI_TYPES: Dict[str, Any] = {
+    'bool': bool,
+    'int8': types.Int8,
+    'uint8': types.UInt8,
+    'int16': types.Int16,
+    'uint16': types.UInt16,
+    'int32': types.Int32,
+    'uint32': types.UInt32,
+    'int64': types.Int64,
+    'uint64': types.UInt64,
+    'varuint32': types.VarUInt,
+    'float32': types.Float32,
+    'float64': types.Float64,
+    'time_point': types.TimePoint,
+    'time_point_sec': types.TimePointSec,
+    'name': types.Name,
+    'bytes': types.AbiBytes,
+    'string': str,
+    'symbol': types.Symbol,
+    'asset': types.Asset,
+    'public_key': types.PublicKey
+}
+
+# structs commonly defined by system contracts, replaced with aioeos types
+BUILTIN_STRUCTS: Dict[str, Type] = {
+    'permission_level': types.EosPermissionLevel,
+    'key_weight': types.EosKeyWeight,
+    'permission_level_weight': types.EosPermissionLevelWeight,
+    'wait_weight': types.EosWaitWeight,
+    'authority': types.EosAuthority,
+    'action': types.EosAction,
+    'extension': EosExtension,
+    'transaction': types.EosTransaction
+}
+
+
+@dataclass
+class AbiTypeDef(types.BaseAbiObject):
+    new_type_name: str
+    type: str
+
+
+@dataclass
+class AbiFieldDef(types.BaseAbiObject):
+    name: str
+    type: str
+
+
+@dataclass
+class AbiStructDef(types.BaseAbiObject):
+    name: str
+    base: str
+    fields: List[AbiFieldDef]
+
+
+@dataclass
+class AbiActionDef(types.BaseAbiObject):
+    name: types.Name
+    type: str
+    ricardian_contract: str
+
+
+@dataclass
+class AbiTableDef(types.BaseAbiObject):
+    name: types.Name
+    index_type: str
+    key_names: List[str]
+    key_types: List[str]
+    type: str
+
+
+@dataclass
+class AbiDef(types.BaseAbiObject):
+    """
+    Leading part of binary ABI, ricardian clauses, error messages and
+    extensions are not needed to generate classes
+    """
+    version: str
+    types: List[AbiTypeDef]
+    structs: List[AbiStructDef]
+    actions: List[AbiActionDef]
+    tables: List[AbiTableDef]
+
+
+def load_abi(abi: Union[bytes, dict]) -> dict:
+    """
+    Returns ABI in JSON format, given binary ABI, ABI in JSON format or
+    ``get_abi`` response
+    """
+    if isinstance(abi, bytes):
+        return asdict(serializer.deserialize(abi, AbiDef)[1])
+    return abi.get('abi', abi)
+
+
+def to_identifier(name: str) -> str:
+    """Converts ABI name to Python identifier, eg. ``from`` to ``from_``"""
+    name = name.replace('.', '_')
+    return f'{name}_' if iskeyword(name) else name
+
+
+def to_class_name(name: str) -> str:
+    """Converts ABI struct name to class name, eg. ``key_weight``"""
+    return ''.join(part.capitalize() for part in re.split(r'[._]', name))
+
+
+class EosAbi:
+    """
+    Contract ABI, creates ABI classes for its structs. Structs which use
+    types not supported by the serializer are skipped, together with their
+    actions.
+
+    :param abi: ABI in JSON format, binary ABI or ``get_abi`` response,
+    :param account: name of the contract account
+    """
+
+    def __init__(self, abi: Union[bytes, dict], account: str = ''):
+        if isinstance(abi, dict) and not account:
+            account = abi.get('account_name', '')
+        abi = load_abi(abi)
+        self.account = account
+        self.typedefs = {
+            typedef['new_type_name']: typedef['type']
+            for typedef in abi.get('types', [])
+        }
+        self.structs = {struct['name']: struct for struct in abi['structs']}
+        self.actions = {
+            action['name']: action['type'] for action in abi['actions']
+        }
+        self.tables = {
+            table['name']: table['type'] for table in abi.get('tables', [])
+        }
+
+        # struct name -> reason why it was skipped
+        self.unsupported: Dict[str, str] = {}
+        self._classes: Dict[str, Type] = {}
+        self._resolving: Set[str] = set()
+
+    def resolve(self, type_name: str) -> Any:
+        """Returns Python type for ABI type name"""
+        if type_name.endswith('[]'):
+            return List[self.resolve(type_name[:-2])]  # type: ignore
+        if type_name in self.typedefs:
+            return self.resolve(self.typedefs[type_name])
+        if type_name in ABI_TYPES:
+            return ABI_TYPES[type_name]
+        if type_name in self.structs:
+            return self.get_class(type_name)
+        raise exceptions.EosSerializerUnsupportedTypeException(type_name)
+
+    def get_class(self, struct_name: str) -> Type:
+        """Returns ABI class of given struct, creating it on first use"""
+        if struct_name in self._classes:
+            return self._classes[struct_name]
+        if struct_name in self.unsupported or struct_name in self._resolving:
+            raise exceptions.EosSerializerUnsupportedTypeException(
+                struct_name
+            )
+
+        struct = self.structs[struct_name]
+        builtin = BUILTIN_STRUCTS.get(struct_name)
+        if builtin and len(self._field_defs(struct)) == len(fields(builtin)):
+            self._classes[struct_name] = builtin
+            return builtin
+
+        self._resolving.add(struct_name)
+        try:
+            base = self.resolve(struct['base']) if struct['base'] else None
+            class_fields = [
+                self._make_field(field) for field in struct['fields']
+            ]
+        except exceptions.EosSerializerUnsupportedTypeException as e:
+            self.unsupported[struct_name] = f'unsupported type {e.args[0]}'
+            raise
+        finally:
+            self._resolving.discard(struct_name)
+
+        class_name = to_class_name(struct_name)
+        used_names = {cls.__name__ for cls in self._classes.values()}
+        while class_name in used_names or hasattr(types, class_name):
+            class_name += '_'
+
+        try:
+            abi_class: Type = types.add_slots(make_dataclass(
+                class_name,
+                class_fields,
+                bases=(base or types.BaseAbiObject,)
+            ))
+        except TypeError as e:
+            # binary extension of base struct followed by regular fields
+            self.unsupported[struct_name] = str(e)
+            raise exceptions.EosSerializerUnsupportedTypeException(
+                struct_name
+            ) from e
+        self._classes[struct_name] = abi_class
+        return abi_class
+
+    def _make_field(self, field: dict) -> tuple:
+        name = to_identifier(field['name'])
+        # binary extensions, suffixed with $, may be missing in old data
+        if field['type'].endswith('$'):
+            return (
+                name,
+                self.resolve(field['type'][:-1]),
+                types.binary_extension()
+            )
+        return name, self.resolve(field['type'])
+
+    def _field_defs(self, struct: dict) -> List[dict]:
+        base = self.structs.get(struct['base'])
+        return (self._field_defs(base) if base else []) + struct['fields']
+
+    @property
+    def classes(self) -> Dict[str, Type]:
+        """
+        ABI classes of all supported structs, ordered so that each class
+        comes after the classes it depends on
+        """
+        for struct_name in self.structs:
+            try:
+                self.get_class(struct_name)
+            except exceptions.EosSerializerUnsupportedTypeException:
+                pass
+        return dict(self._classes)
+
+    def payload_types(self) -> Dict[Tuple[str, str], Type]:
+        """ABI classes of action payloads, eg. for ``EosTransactionView``"""
+        classes = self.classes
+        return {
+            (self.account, action): classes[struct_name]
+            for action, struct_name in self.actions.items()
+            if struct_name in classes
+        }
+
+    def table_types(self) -> Dict[str, Type]:
+        """ABI classes of table rows"""
+        classes = self.classes
+        return {
+            table: classes[struct_name]
+            for table, struct_name in self.tables.items()
+            if struct_name in classes
+        }
+
+    def action(self, name: str, authorization=[], **values):
+        """
+        Creates action of this contract, values are fields of action payload
+        """
+        return types.EosAction(
+            account=self.account,
+            name=name,
+            authorization=authorization,
+            data=self.get_class(self.actions[name])(**values)
+        )
+
+    def render(self) -> str:
+        """Returns source of Python module with classes and action helpers"""
+        return _ModuleRenderer(self).render()
+
+
+class _ModuleRenderer:
+    def __init__(self, abi: EosAbi):
+        self.abi = abi
+        self.classes = abi.classes
+        self.generated = {
+            struct_name: cls for struct_name, cls in self.classes.items()
+            if cls not in BUILTIN_STRUCTS.values()
+        }
+        self.imports = {'BaseAbiObject', 'EosAction', 'add_slots'}
+        self.uses_list = False
+
+    def render_type(self, abi_type: Any) -> str:
+        if getattr(abi_type, '_name', None) == 'List':
+            self.uses_list = True
+            return f'List[{self.render_type(abi_type.__args__[0])}]'
+        if abi_type not in (bool, str) and (
+            abi_type not in self.generated.values()
+        ):
+            self.imports.add(abi_type.__name__)
+        return abi_type.__name__
+
+    def render_field(self, field: Field) -> str:
+        line = f'    {field.name}: {self.render_type(field.type)}'
+        if field.metadata.get('binary_extension'):
+            self.imports.add('binary_extension')
+            line += ' = binary_extension()'
+        return line
+
+    def render_class(self, abi_class: Type) -> str:
+        base = abi_class.__bases__[0]
+        own_fields = [
+            field for field in fields(abi_class)
+            if field.name not in getattr(base, '__dataclass_fields__', {})
+        ]
+        lines = [
+            '@add_slots',
+            '@dataclass',
+            f'class {abi_class.__name__}({self.render_type(base)}):',
+            *(self.render_field(field) for field in own_fields)
+        ]
+        if not own_fields:
+            lines.append('    pass')
+        return '\n'.join(lines)
+
+    def render_helper(self, action: str, abi_class: Type) -> str:
+        names = [field.name for field in fields(abi_class)]
+        params = [
+            f'{field.name}=None'
+            if field.metadata.get('binary_extension') else field.name
+            for field in fields(abi_class)
+        ]
+        signature = _wrap(
+            f'def {to_identifier(action)}(',
+            [*params, 'authorization=[]'],
+            ') -> EosAction:'
+        )
+        data = _wrap(
+            f'        data={abi_class.__name__}(',
+            [f'{name}={name}' for name in names],
+            ')'
+        )
+        return '\n'.join((
+            signature,
+            '    return EosAction(',
+            f'        account={self.abi.account!r},',
+            f'        name={action!r},',
+            '        authorization=authorization,',
+            data,
+            '    )'
+        ))
+
+    def render(self) -> str:
+        classes = [
+            self.render_class(cls) for cls in self.generated.values()
+        ]
+        helpers = [
+            self.render_helper(action, self.classes[struct_name])
+            for action, struct_name in self.abi.actions.items()
+            if struct_name in self.classes
+        ]
+        payload_types = [
+            f'    ({self.abi.account!r}, {action!r}): '
+            f'{self.classes[struct_name].__name__},'
+            for action, struct_name in self.abi.actions.items()
+            if struct_name in self.classes
+        ]
+        table_types = [
+            f'    {table!r}: {cls.__name__},'
+            for table, cls in self.abi.table_types().items()
+        ]
+        compiled = _wrap(
+            'for abi_class in (',
+            [cls.__name__ for cls in self.generated.values()] + [''],
+            '):'
+        ) if self.generated else ''
+
+        header = [
+            '"""',
+            f'Helpers for creating actions on {self.abi.account} contract',
+            'Generated from its ABI by ``aioeos.codegen``.',
+            '"""',
+            *(
+                f'# skipped {name}: {reason}'
+                for name, reason in self.abi.unsupported.items()
+            ),
+            'from dataclasses import dataclass'
+        ]
+        if self.uses_list:
+            header.append('from typing import List')
+        header.append('')
+        if compiled:
+            header.append('from aioeos import serializer')
+        header.append(_wrap(
+            'from aioeos.types import (',
+            sorted(self.imports),
+            ')',
+            force=True
+        ))
+
+        sections = [
+            '\n'.join(header),
+            *classes,
+            *helpers,
+            '\n'.join((
+                '# ABI classes of action payloads, eg. for EosTransactionView',
+                'PAYLOAD_TYPES = {', *payload_types, '}',
+                '',
+                '# ABI classes of table rows',
+                'TABLE_TYPES = {', *table_types, '}'
+            ))
+        ]
+        if compiled:
+            sections.append('\n'.join((
+                '# serializers are compiled upfront',
+                compiled,
+                '    serializer.get_abi_type_serializer(abi_class)'
+            )))
+        return '\n\n\n'.join(sections) + '\n'
+
+
+def _wrap(
+    prefix: str, items: List[str], suffix: str, force: bool = False
+) -> str:
+    """
+    Renders a bracketed list of items, on one line if it fits, otherwise
+    items are packed on indented lines
+    """
+    items = [item for item in items if item]
+    line = prefix + ', '.join(items) + suffix
+    if len(line) <= 79 and not force:
+        return line
+
+    lead = prefix[:len(prefix) - len(prefix.lstrip())]
+    indent = f'{lead}    '
+    lines = [prefix]
+    current = indent
+    for item in items:
+        if current != indent and len(f'{current}{item},') > 79:
+            lines.append(current.rstrip())
+            current = indent
+        current += f'{item}, '
+    lines.append(current.rstrip().rstrip(','))
+    lines.append(f'{lead}{suffix}')
+    return '\n'.join(lines)
+
+
+async def fetch_abi(url: str, account: str) -> dict:
+    """Fetches ABI of given account in JSON format"""
+    return await EosJsonRpc(url).get_abi(account)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog='python -m aioeos.codegen',
+        description='Generates ABI classes and action helpers from ABI'
+    )
+    parser.add_argument(
+        'source', help='ABI file, in JSON or binary format, or account name'
+    )
+    parser.add_argument(
+        '--account',
+        help='contract account, defaults to account or file name'
+    )
+    parser.add_argument(
+        '--url',
+        default='http://127.0.0.1:8888',
+        help='node used to fetch ABI of an account'
+    )
+    parser.add_argument('-o', '--output', help='output file, stdout if unset')
+    args = parser.parse_args(argv)
+
+    abi: Union[bytes, dict]
+    if os.path.isfile(args.source):
+        with open(args.source, 'rb') as f:
+            abi = f.read()
+        if abi.lstrip().startswith(b'{'):
+            abi = json.loads(abi)
+        account = re.sub(r'\.(abi|json)$', '', os.path.basename(args.source))
+    else:
+        abi = asyncio.run(fetch_abi(args.url, args.source))
+        account = args.source
+        if not abi.get('abi'):
+            parser.error(f'account {account} has no ABI')
+
+    source = EosAbi(abi, args.account or account).render()
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == '__main__':
+    main()
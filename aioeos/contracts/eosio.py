@@ -1,7 +1,116 @@
 """Helpers for creating actions on eosio contract"""
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional
 
-from aioeos.types import EosAction, EosAuthority
+from aioeos.types import (
+    Asset, BaseAbiObject, EosAction, EosAuthority, Int64, Name, UInt32,
+    add_slots
+)
+
+
+@add_slots
+@dataclass
+class NewAccount(BaseAbiObject):
+    creator: Name
+    name: Name
+    owner: EosAuthority
+    active: EosAuthority
+
+
+@add_slots
+@dataclass
+class BuyRamBytes(BaseAbiObject):
+    payer: Name
+    receiver: Name
+    bytes: UInt32
+
+
+@add_slots
+@dataclass
+class BuyRam(BaseAbiObject):
+    payer: Name
+    receiver: Name
+    quant: Asset
+
+
+@add_slots
+@dataclass
+class SellRam(BaseAbiObject):
+    account: Name
+    bytes: Int64
+
+
+@add_slots
+@dataclass
+class DelegateBw(BaseAbiObject):
+    from_: Name
+    receiver: Name
+    stake_net_quantity: Asset
+    stake_cpu_quantity: Asset
+    transfer: bool
+
+
+@add_slots
+@dataclass
+class UndelegateBw(BaseAbiObject):
+    from_: Name
+    receiver: Name
+    unstake_net_quantity: Asset
+    unstake_cpu_quantity: Asset
+
+
+@add_slots
+@dataclass
+class Refund(BaseAbiObject):
+    owner: Name
+
+
+@add_slots
+@dataclass
+class UpdateAuth(BaseAbiObject):
+    account: Name
+    permission: Name
+    parent: Name
+    auth: EosAuthority
+
+
+@add_slots
+@dataclass
+class DeleteAuth(BaseAbiObject):
+    account: Name
+    permission: Name
+
+
+@add_slots
+@dataclass
+class LinkAuth(BaseAbiObject):
+    account: Name
+    code: Name
+    type: Name
+    requirement: Name
+
+
+@add_slots
+@dataclass
+class UnlinkAuth(BaseAbiObject):
+    account: Name
+    code: Name
+    type: Name
+
+
+@add_slots
+@dataclass
+class VoteProducer(BaseAbiObject):
+    voter: Name
+    proxy: Name
+    producers: List[Name]
+
+
+@add_slots
+@dataclass
+class RegProxy(BaseAbiObject):
+    proxy: Name
+    isproxy: bool
 
 
 def newaccount(
@@ -16,12 +125,12 @@ def newaccount(
         account='eosio',
         name='newaccount',
         authorization=authorization,
-        data={
-            'creator': creator,
-            'name': account_name,
-            'owner': owner,
-            'active': active if active else owner
-        }
+        data=NewAccount(
+            creator=creator,
+            name=account_name,
+            owner=owner,
+            active=active if active else owner
+        )
     )
 
 
@@ -30,11 +139,16 @@ def buyrambytes(payer, receiver, amount, authorization=[]) -> EosAction:
         account='eosio',
         name='buyrambytes',
         authorization=authorization,
-        data={
-            'payer': payer,
-            'receiver': receiver,
-            'bytes': amount
-        }
+        data=BuyRamBytes(payer=payer, receiver=receiver, bytes=amount)
+    )
+
+
+def buyram(payer, receiver, quantity, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='buyram',
+        authorization=authorization,
+        data=BuyRam(payer=payer, receiver=receiver, quant=quantity)
     )
 
 
@@ -43,10 +157,7 @@ def sellram(account, amount, authorization=[]) -> EosAction:
         account='eosio',
         name='sellram',
         authorization=authorization,
-        data={
-            'account': account,
-            'bytes': amount
-        }
+        data=SellRam(account=account, bytes=amount)
     )
 
 
@@ -58,13 +169,13 @@ def delegatebw(
         account='eosio',
         name='delegatebw',
         authorization=authorization,
-        data={
-            'from': from_account,
-            'receiver': receiver,
-            'stake_net_quantity': stake_net_quantity,
-            'stake_cpu_quantity': stake_cpu_quantity,
-            'transfer': transfer
-        }
+        data=DelegateBw(
+            from_=from_account,
+            receiver=receiver,
+            stake_net_quantity=stake_net_quantity,
+            stake_cpu_quantity=stake_cpu_quantity,
+            transfer=transfer
+        )
     )
 
 
@@ -76,10 +187,90 @@ def undelegatebw(
         account='eosio',
         name='undelegatebw',
         authorization=authorization,
-        data={
-            'from': from_account,
-            'receiver': receiver,
-            'unstake_net_quantity': unstake_net_quantity,
-            'unstake_cpu_quantity': unstake_cpu_quantity,
-        }
+        data=UndelegateBw(
+            from_=from_account,
+            receiver=receiver,
+            unstake_net_quantity=unstake_net_quantity,
+            unstake_cpu_quantity=unstake_cpu_quantity
+        )
+    )
+
+
+def refund(owner, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='refund',
+        authorization=authorization,
+        data=Refund(owner=owner)
+    )
+
+
+def updateauth(
+    account, permission, parent, auth: EosAuthority, authorization=[]
+) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='updateauth',
+        authorization=authorization,
+        data=UpdateAuth(
+            account=account, permission=permission, parent=parent, auth=auth
+        )
+    )
+
+
+def deleteauth(account, permission, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='deleteauth',
+        authorization=authorization,
+        data=DeleteAuth(account=account, permission=permission)
+    )
+
+
+def linkauth(
+    account, code, action_type, requirement, authorization=[]
+) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='linkauth',
+        authorization=authorization,
+        data=LinkAuth(
+            account=account,
+            code=code,
+            type=action_type,
+            requirement=requirement
+        )
+    )
+
+
+def unlinkauth(account, code, action_type, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='unlinkauth',
+        authorization=authorization,
+        data=UnlinkAuth(account=account, code=code, type=action_type)
+    )
+
+
+def voteproducer(
+    voter, producers: List[str], proxy='', authorization=[]
+) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='voteproducer',
+        authorization=authorization,
+        # producers have to be sorted, for valid names alphabetical order is
+        # the same as order of their numeric values
+        data=VoteProducer(
+            voter=voter, proxy=proxy, producers=sorted(producers)
+        )
+    )
+
+
+def regproxy(proxy, isproxy=True, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio',
+        name='regproxy',
+        authorization=authorization,
+        data=RegProxy(proxy=proxy, isproxy=isproxy)
     )
@@ -0,0 +1,136 @@
+"""Helpers for creating actions on eosio.msig contract"""
+from dataclasses import dataclass
+from typing import List
+
+from aioeos.types import (
+    BaseAbiObject, EosAction, EosPermissionLevel, EosTransaction, Name,
+    add_slots
+)
+
+
+@add_slots
+@dataclass
+class Propose(BaseAbiObject):
+    proposer: Name
+    proposal_name: Name
+    requested: List[EosPermissionLevel]
+    trx: EosTransaction
+
+
+@add_slots
+@dataclass
+class Approve(BaseAbiObject):
+    proposer: Name
+    proposal_name: Name
+    level: EosPermissionLevel
+
+
+@add_slots
+@dataclass
+class Unapprove(BaseAbiObject):
+    proposer: Name
+    proposal_name: Name
+    level: EosPermissionLevel
+
+
+@add_slots
+@dataclass
+class Cancel(BaseAbiObject):
+    proposer: Name
+    proposal_name: Name
+    canceler: Name
+
+
+@add_slots
+@dataclass
+class Exec(BaseAbiObject):
+    proposer: Name
+    proposal_name: Name
+    executer: Name
+
+
+@add_slots
+@dataclass
+class Invalidate(BaseAbiObject):
+    account: Name
+
+
+def propose(
+    proposer,
+    proposal_name,
+    requested: List[EosPermissionLevel],
+    trx: EosTransaction,
+    authorization=[]
+) -> EosAction:
+    """
+    Proposes a transaction, its action payloads have to be in binary format
+    or ABI objects
+    """
+    return EosAction(
+        account='eosio.msig',
+        name='propose',
+        authorization=authorization,
+        data=Propose(
+            proposer=proposer,
+            proposal_name=proposal_name,
+            requested=requested,
+            trx=trx
+        )
+    )
+
+
+def approve(
+    proposer, proposal_name, level: EosPermissionLevel, authorization=[]
+) -> EosAction:
+    return EosAction(
+        account='eosio.msig',
+        name='approve',
+        authorization=authorization,
+        data=Approve(
+            proposer=proposer, proposal_name=proposal_name, level=level
+        )
+    )
+
+
+def unapprove(
+    proposer, proposal_name, level: EosPermissionLevel, authorization=[]
+) -> EosAction:
+    return EosAction(
+        account='eosio.msig',
+        name='unapprove',
+        authorization=authorization,
+        data=Unapprove(
+            proposer=proposer, proposal_name=proposal_name, level=level
+        )
+    )
+
+
+def cancel(proposer, proposal_name, canceler, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio.msig',
+        name='cancel',
+        authorization=authorization,
+        data=Cancel(
+            proposer=proposer, proposal_name=proposal_name, canceler=canceler
+        )
+    )
+
+
+def exec(proposer, proposal_name, executer, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio.msig',
+        name='exec',
+        authorization=authorization,
+        data=Exec(
+            proposer=proposer, proposal_name=proposal_name, executer=executer
+        )
+    )
+
+
+def invalidate(account, authorization=[]) -> EosAction:
+    return EosAction(
+        account='eosio.msig',
+        name='invalidate',
+        authorization=authorization,
+        data=Invalidate(account=account)
+    )
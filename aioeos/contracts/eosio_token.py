@@ -1,5 +1,54 @@
 """Helpers for creating actions on eosio.token contract"""
+from dataclasses import dataclass
+
 from aioeos import types
+from aioeos.types import Asset, BaseAbiObject, Name, Symbol, add_slots
+
+
+@add_slots
+@dataclass
+class Transfer(BaseAbiObject):
+    from_: Name
+    to: Name
+    quantity: Asset
+    memo: str
+
+
+@add_slots
+@dataclass
+class Create(BaseAbiObject):
+    issuer: Name
+    maximum_supply: Asset
+
+
+@add_slots
+@dataclass
+class Issue(BaseAbiObject):
+    to: Name
+    quantity: Asset
+    memo: str
+
+
+@add_slots
+@dataclass
+class Retire(BaseAbiObject):
+    quantity: Asset
+    memo: str
+
+
+@add_slots
+@dataclass
+class Open(BaseAbiObject):
+    owner: Name
+    symbol: Symbol
+    ram_payer: Name
+
+
+@add_slots
+@dataclass
+class Close(BaseAbiObject):
+    owner: Name
+    symbol: Symbol
 
 
 def transfer(
@@ -13,12 +62,45 @@ def transfer(
         account='eosio.token',
         name='transfer',
         authorization=authorization,
-        data={
-            'from': from_addr,
-            'to': to_addr,
-            'quantity': quantity,
-            'memo': memo
-        }
+        data=Transfer(
+            from_=from_addr, to=to_addr, quantity=quantity, memo=memo
+        )
+    )
+
+
+def create(issuer, maximum_supply, authorization=[]) -> types.EosAction:
+    return types.EosAction(
+        account='eosio.token',
+        name='create',
+        authorization=authorization,
+        data=Create(issuer=issuer, maximum_supply=maximum_supply)
+    )
+
+
+def issue(to, quantity, memo='', authorization=[]) -> types.EosAction:
+    return types.EosAction(
+        account='eosio.token',
+        name='issue',
+        authorization=authorization,
+        data=Issue(to=to, quantity=quantity, memo=memo)
+    )
+
+
+def retire(quantity, memo='', authorization=[]) -> types.EosAction:
+    return types.EosAction(
+        account='eosio.token',
+        name='retire',
+        authorization=authorization,
+        data=Retire(quantity=quantity, memo=memo)
+    )
+
+
+def open(owner, symbol, ram_payer, authorization=[]) -> types.EosAction:
+    return types.EosAction(
+        account='eosio.token',
+        name='open',
+        authorization=authorization,
+        data=Open(owner=owner, symbol=symbol, ram_payer=ram_payer)
     )
 
 
@@ -27,8 +109,5 @@ def close(owner, symbol, authorization=[]) -> types.EosAction:
         account='eosio.token',
         name='close',
         authorization=authorization,
-        data={
-            'owner': owner,
-            'symbol': symbol
-        }
+        data=Close(owner=owner, symbol=symbol)
     )
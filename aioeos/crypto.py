@@ -0,0 +1,301 @@
+"""
+Elliptic curve backends used by ``EosKey``.
+
+Pure Python ``ecdsa`` package is always available. If ``coincurve`` (Python
+bindings for libsecp256k1, installed with ``aioeos[secp256k1]`` extra) is
+installed, it's selected at import time as it's orders of magnitude faster.
+``AIOEOS_CRYPTO_BACKEND`` environment variable can be set to ``ecdsa`` or
+``secp256k1`` to choose backend explicitly. Both backends produce identical
+signatures.
+"""
+from abc import ABC, abstractmethod
+from functools import lru_cache
+import hashlib
+import os
+import secrets
+from typing import Dict, Optional, Tuple
+
+import ecdsa
+
+
+class BaseCryptoBackend(ABC):
+    """
+    Operations on secp256k1 curve. Private keys are 32 byte strings, public
+    keys are 33 byte strings in compressed format, signatures are 64 byte
+    strings containing ``r`` and ``s`` values.
+    """
+    name = ''
+    order = ecdsa.SECP256k1.order
+
+    @abstractmethod
+    def generate_private_key(self) -> bytes:
+        """Returns new random private key"""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def public_key(self, private_key: bytes) -> bytes:
+        """Derives public key from private key"""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def nonce_point(self, k: int) -> Tuple[int, int]:
+        """Returns affine coordinates of ``k * G``"""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def verify(
+        self, public_key: bytes, signature: bytes, digest: bytes
+    ) -> bool:
+        """Verifies signature of a digest"""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def recover(
+        self, signature: bytes, recovery_param: int, digest: bytes
+    ) -> Optional[bytes]:
+        """
+        Recovers public key from signature and recovery parameter, returns
+        None if signature is not valid for the recovered key.
+        """
+        pass  # pragma: no cover
+
+    def precompute(self, public_key: bytes):
+        """
+        Prepares backend for signing and verifying many signatures with given
+        key, does nothing unless backend benefits from it.
+        """
+
+    def sign(self, private_key: bytes, digest: bytes) -> Tuple[int, bytes]:
+        """
+        Signs digest, returns a tuple containing recovery parameter and
+        signature. Nonce is generated deterministically, using RFC6979 on
+        a hash of the digest and attempt counter, until signature is
+        canonical.
+        """
+        order = self.order
+        secret_multiplier = ecdsa.util.string_to_number(private_key)
+        number = ecdsa.util.string_to_number(digest)
+
+        cnt = 0
+        # repeat until the signature is canonical
+        is_canonical = False
+        while not is_canonical:
+            # get deterministic k
+            sha_digest = hashlib.sha256(
+                digest + bytes([cnt] if cnt else [])
+            ).digest()
+
+            k = ecdsa.rfc6979.generate_k(
+                order, secret_multiplier, hashlib.sha256, sha_digest
+            )
+
+            # nonce point also determines the recovery parameter
+            x, y = self.nonce_point(k)
+            r = x % order
+            s = (
+                ecdsa.numbertheory.inverse_mod(k, order)
+                * (number + secret_multiplier * r)
+            ) % order
+
+            der_signature = ecdsa.util.sigencode_der(r, s, order)
+            is_canonical = (
+                der_signature[3] == 32
+                and der_signature[5 + der_signature[3]] == 32
+            )
+            # try another one if not canonical
+            cnt += 1
+
+        # recovery parameter is given by parity of nonce point's y coordinate
+        # and whether its x coordinate overflowed the curve order
+        recovery_param = (y & 1) | (2 if x >= order else 0)
+        return recovery_param, ecdsa.util.sigencode_string(r, s, order)
+
+
+class EcdsaBackend(BaseCryptoBackend):
+    """
+    Pure Python backend built on ``ecdsa`` package. Precomputation builds
+    multiplication table for the generator point used for nonces and for
+    public key points used for verification.
+    """
+    name = 'ecdsa'
+
+    def __init__(self):
+        # public key -> verifying key with precomputed multiplication table
+        self._precomputed: Dict[bytes, ecdsa.VerifyingKey] = {}
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _verifying_key(public_key: bytes) -> ecdsa.VerifyingKey:
+        return ecdsa.VerifyingKey.from_string(
+            public_key, curve=ecdsa.SECP256k1
+        )
+
+    def precompute(self, public_key: bytes):
+        if public_key in self._precomputed:
+            return
+
+        # multiplying the generator builds its table if it's not there yet
+        ecdsa.SECP256k1.generator * 1
+        verifying_key = ecdsa.VerifyingKey.from_string(
+            public_key, curve=ecdsa.SECP256k1
+        )
+        verifying_key.precompute()
+        self._precomputed[public_key] = verifying_key
+
+    def generate_private_key(self) -> bytes:
+        entropy = ecdsa.util.PRNG(secrets.randbits(512))
+        return ecdsa.SigningKey.generate(
+            entropy=entropy, curve=ecdsa.SECP256k1
+        ).to_string()
+
+    def public_key(self, private_key: bytes) -> bytes:
+        signing_key = ecdsa.SigningKey.from_string(
+            private_key, curve=ecdsa.SECP256k1
+        )
+        return signing_key.get_verifying_key().to_string(
+            encoding='compressed'
+        )
+
+    def nonce_point(self, k: int) -> Tuple[int, int]:
+        point = ecdsa.SECP256k1.generator * k
+        return point.x(), point.y()
+
+    def verify(
+        self, public_key: bytes, signature: bytes, digest: bytes
+    ) -> bool:
+        verifying_key = (
+            self._precomputed.get(public_key)
+            or self._verifying_key(public_key)
+        )
+        try:
+            return verifying_key.verify_digest(
+                signature, digest, sigdecode=ecdsa.util.sigdecode_string
+            )
+        except ecdsa.keys.BadSignatureError:
+            return False
+
+    def recover(
+        self, signature: bytes, recovery_param: int, digest: bytes
+    ) -> Optional[bytes]:
+        ''' Recover the public key from the sig
+            http://www.secg.org/sec1-v2.pdf
+        '''
+        curve = ecdsa.SECP256k1.curve
+        G = ecdsa.SECP256k1.generator
+        order = ecdsa.SECP256k1.order
+        yp = (recovery_param % 2)
+        r, s = ecdsa.util.sigdecode_string(signature, order)
+        x = r + (recovery_param // 2) * order
+        alpha = ((x * x * x) + (curve.a() * x) + curve.b()) % curve.p()
+        beta = ecdsa.numbertheory.square_root_mod_prime(alpha, curve.p())
+        y = beta if (beta - yp) % 2 == 0 else curve.p() - beta
+        # generate R
+        R = ecdsa.ellipticcurve.Point(curve, x, y, order)
+        e = ecdsa.util.string_to_number(digest)
+        # compute Q
+        Q = (
+            ecdsa.numbertheory.inverse_mod(r, order)
+            * (s * R + (-e % order) * G)
+        )
+        # verify message
+        verifying_key = ecdsa.VerifyingKey.from_public_point(
+            Q, curve=ecdsa.SECP256k1
+        )
+        try:
+            verifying_key.verify_digest(
+                signature, digest, sigdecode=ecdsa.util.sigdecode_string
+            )
+        except ecdsa.keys.BadSignatureError:
+            return None
+        return verifying_key.to_string(encoding='compressed')
+
+
+class Secp256k1Backend(BaseCryptoBackend):
+    """
+    Native backend built on ``coincurve`` bindings for libsecp256k1. Library
+    context already contains precomputed tables for the generator point.
+    """
+    name = 'secp256k1'
+
+    def __init__(self):
+        import coincurve
+        self._coincurve = coincurve
+
+    def _normalize(
+        self, signature: bytes, recovery_param: int = 0
+    ) -> Tuple[bytes, int]:
+        """
+        libsecp256k1 accepts only signatures with low ``s`` value. Negating
+        ``s`` keeps the signature valid, but flips the recovery parameter.
+        """
+        r, s = ecdsa.util.sigdecode_string(signature, self.order)
+        if s > self.order // 2:
+            s = self.order - s
+            recovery_param ^= 1
+        return ecdsa.util.sigencode_string(r, s, self.order), recovery_param
+
+    def generate_private_key(self) -> bytes:
+        return self._coincurve.PrivateKey().secret
+
+    def public_key(self, private_key: bytes) -> bytes:
+        return self._coincurve.PublicKey.from_valid_secret(
+            private_key
+        ).format(compressed=True)
+
+    def nonce_point(self, k: int) -> Tuple[int, int]:
+        point = self._coincurve.PublicKey.from_valid_secret(
+            k.to_bytes(32, 'big')
+        ).format(compressed=False)
+        return (
+            int.from_bytes(point[1:33], 'big'),
+            int.from_bytes(point[33:], 'big')
+        )
+
+    def verify(
+        self, public_key: bytes, signature: bytes, digest: bytes
+    ) -> bool:
+        signature, _ = self._normalize(signature)
+        r, s = ecdsa.util.sigdecode_string(signature, self.order)
+        try:
+            return self._coincurve.PublicKey(public_key).verify(
+                ecdsa.util.sigencode_der(r, s, self.order),
+                digest,
+                hasher=None
+            )
+        except ValueError:
+            return False
+
+    def recover(
+        self, signature: bytes, recovery_param: int, digest: bytes
+    ) -> Optional[bytes]:
+        signature, recovery_param = self._normalize(signature, recovery_param)
+        try:
+            public_key = self._coincurve.PublicKey.from_signature_and_message(
+                signature + bytes([recovery_param]), digest, hasher=None
+            )
+        except ValueError:
+            return None
+        return public_key.format(compressed=True)
+
+
+BACKENDS = {
+    EcdsaBackend.name: EcdsaBackend,
+    Secp256k1Backend.name: Secp256k1Backend,
+}
+
+
+def get_backend(name: str = '') -> BaseCryptoBackend:
+    """
+    Returns backend with given name. If name is empty, returns the fastest
+    available one.
+    """
+    if name:
+        return BACKENDS[name]()
+
+    try:
+        return Secp256k1Backend()
+    except ImportError:
+        return EcdsaBackend()
+
+
+default_backend = get_backend(os.environ.get('AIOEOS_CRYPTO_BACKEND', ''))
@@ -30,6 +30,10 @@ class EosTxNetUsageExceededException(EosRpcException):
     """Not enough EOS were staked for NET"""
 
 
+class EosTxDuplicateException(EosRpcException):
+    """Transaction with the same ID was already submitted"""
+
+
 class EosRamUsageExceededException(EosRpcException):
     """Transaction requires more RAM than what's available on the account"""
 
@@ -41,6 +45,18 @@ class EosAssertMessageException(EosRpcException):
     """
 
 
+class EosTransactionExpiredException(EosRpcException):
+    """Transaction expired before it was included in a block"""
+
+
+class EosTransactionLifetimeExceededException(EosRpcException):
+    """Transaction expiration is further than chain's max lifetime"""
+
+
+class EosNoPayerAvailableException(EosRpcException):
+    """None of the paying accounts has enough resources for a transaction"""
+
+
 class EosSerializerException(Exception):
     """Base exception class for serializer errors"""
 
@@ -57,3 +73,7 @@ class EosSerializerAbiNameTooLongException(EosSerializerException):
 class EosSerializerAbiNameInvalidCharactersException(EosSerializerException):
     def __init__(self):
         super().__init__('Value contains invalid characters')
+
+
+class EosSerializerInvalidSymbolException(EosSerializerException):
+    """Symbol or asset is not in "4,EOS" or "1.0000 EOS" format"""
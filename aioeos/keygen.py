@@ -0,0 +1,159 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from aioeos.contracts import eosio
+from aioeos.keys import EosKey
+from aioeos.types import (
+    EosAction, EosAuthority, EosPermissionLevel
+)
+
+
+# (private key, public key) pair, private key is a raw 32 byte string and
+# public key is encoded in EOS format
+KeyRecord = Tuple[bytes, str]
+
+
+def _generate_batch(count: int) -> List[KeyRecord]:
+    backend = EosKey.backend
+    records = []
+    for _ in range(count):
+        private_key = backend.generate_private_key()
+        public_key = backend.public_key(private_key)
+        records.append(
+            (private_key, f'EOS{EosKey._check_encode(public_key)}')
+        )
+    return records
+
+
+def record_to_key(record: KeyRecord) -> EosKey:
+    """Creates EosKey from a generated record"""
+    private_key, _ = record
+    return EosKey(private_key=EosKey._check_encode(
+        b'\x80' + private_key, 'sha256x2'
+    ))
+
+
+class EosKeyGenerator:
+    """
+    Generates key pairs in a pool of worker processes, without blocking the
+    event loop. Keys are returned as compact ``(private key bytes, public
+    key)`` records, use ``record_to_key`` to get EosKey instance.
+
+    :param processes: number of worker processes, defaults to CPU count,
+    :param chunk_size: max number of keys generated by a worker at once
+    """
+
+    def __init__(
+        self, *, processes: Optional[int] = None, chunk_size: int = 256
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=self.processes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Shuts down worker processes"""
+        self._executor.shutdown()
+
+    def _chunks(self, count: int) -> List[int]:
+        return [
+            min(self.chunk_size, count - i)
+            for i in range(0, count, self.chunk_size)
+        ]
+
+    def generate(self, count: int) -> List[KeyRecord]:
+        """Generates ``count`` key pairs, blocks until all of them are ready"""
+        return [
+            record
+            for chunk in self._executor.map(
+                _generate_batch, self._chunks(count)
+            )
+            for record in chunk
+        ]
+
+    async def generate_async(self, count: int) -> List[KeyRecord]:
+        """Same as ``generate``, but doesn't block the event loop"""
+        return [
+            record
+            async for chunk in self.stream(count)
+            for record in chunk
+        ]
+
+    async def stream(self, count: int) -> AsyncIterator[List[KeyRecord]]:
+        """
+        Generates ``count`` key pairs, yielding them in chunks as soon as
+        they are ready, in order. At most one chunk per worker is in
+        progress at a time.
+        """
+        loop = asyncio.get_event_loop()
+        chunks = self._chunks(count)
+        pending = [
+            loop.run_in_executor(self._executor, _generate_batch, size)
+            for size in chunks[:self.processes]
+        ]
+        chunks = chunks[self.processes:]
+        try:
+            while pending:
+                records = await pending.pop(0)
+                if chunks:
+                    pending.append(loop.run_in_executor(
+                        self._executor, _generate_batch, chunks.pop(0)
+                    ))
+                yield records
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def key_authority(public_key: str, weight: int = 1) -> EosAuthority:
+    """Returns authority satisfied by a single key"""
+    return EosAuthority(
+        threshold=weight,
+        keys=[EosKey(public_key=public_key).to_key_weight(weight)]
+    )
+
+
+def newaccount_batches(
+    creator: str,
+    accounts: Iterable[Tuple[str, KeyRecord]],
+    *,
+    batch_size: int = 10,
+    authorization: List[EosPermissionLevel] = [],
+    extra_actions=None
+) -> Iterator[List[EosAction]]:
+    """
+    Turns ``(account name, key record)`` pairs into batches of ``newaccount``
+    actions, each batch is meant to be sent in a single transaction. Both
+    owner and active authorities are set to the generated key.
+
+    ``extra_actions`` is an optional callable taking account name and
+    returning list of actions added after ``newaccount``, eg. for buying RAM
+    and delegating resources to the new account.
+    """
+    batch: List[EosAction] = []
+    accounts_in_batch = 0
+    for account_name, (_, public_key) in accounts:
+        batch.append(eosio.newaccount(
+            creator,
+            account_name,
+            owner=key_authority(public_key),
+            authorization=authorization
+        ))
+        if extra_actions:
+            batch.extend(extra_actions(account_name))
+
+        accounts_in_batch += 1
+        if accounts_in_batch == batch_size:
+            yield batch
+            batch = []
+            accounts_in_batch = 0
+
+    if batch:
+        yield batch
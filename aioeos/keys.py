@@ -1,13 +1,103 @@
+from functools import lru_cache
 import re
 import hashlib
-import secrets
-
-import base58
-import ecdsa
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from aioeos.crypto import BaseCryptoBackend, default_backend
 from aioeos.types import EosKeyWeight
 
 
+B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# Base58 conversion is done on chunks of 10 digits, so that most of the
+# arithmetic is done on machine-sized integers instead of a big one. Each
+# chunk is converted using a table of all 2-digit combinations.
+_B58_CHUNK_DIGITS = 10
+_B58_CHUNK = 58 ** _B58_CHUNK_DIGITS
+_B58_PAIRS = [a + b for a in B58_ALPHABET for b in B58_ALPHABET]
+_B58_VALUES = {char: value for value, char in enumerate(B58_ALPHABET)}
+
+
+@lru_cache(maxsize=None)
+def _ripemd160() -> Any:
+    """
+    Returns RIPEMD-160 hasher to be copied. It's created on first use, as
+    OpenSSL 3 builds without legacy provider don't support it, which
+    shouldn't break the import.
+    """
+    return hashlib.new('rmd160')
+
+
+def b58encode(data: bytes) -> str:
+    """Encodes bytes to base58 string, using Bitcoin alphabet"""
+    number = int.from_bytes(data, 'big')
+    chunks = []
+    while number:
+        number, chunk = divmod(number, _B58_CHUNK)
+        chunks.append(chunk)
+
+    pairs = _B58_PAIRS
+    encoded = []
+    for chunk in reversed(chunks):
+        c4, c5 = divmod(chunk, 3364)
+        c3, c4 = divmod(c4, 3364)
+        c2, c3 = divmod(c3, 3364)
+        c1, c2 = divmod(c2, 3364)
+        encoded.append(
+            pairs[c1] + pairs[c2] + pairs[c3] + pairs[c4] + pairs[c5]
+        )
+
+    # each leading zero byte is encoded as '1'
+    zeros = len(data) - len(data.lstrip(b'\0'))
+    return '1' * zeros + ''.join(encoded).lstrip('1')
+
+
+def b58decode(value: str, length: int = 0) -> bytes:
+    """
+    Decodes base58 string to bytes. If ``length`` of decoded value is
+    known upfront, result is padded to it.
+    """
+    values = _B58_VALUES
+    try:
+        head = len(value) % _B58_CHUNK_DIGITS
+        number = 0
+        for char in value[:head]:
+            number = number * 58 + values[char]
+
+        for i in range(head, len(value), _B58_CHUNK_DIGITS):
+            chunk = 0
+            for char in value[i:i + _B58_CHUNK_DIGITS]:
+                chunk = chunk * 58 + values[char]
+            number = number * _B58_CHUNK + chunk
+    except KeyError as e:
+        raise ValueError(f'Invalid base58 character: {e}')
+
+    # each leading '1' is decoded as zero byte
+    zeros = len(value) - len(value.lstrip('1'))
+    if length:
+        try:
+            decoded = number.to_bytes(length, 'big')
+        except OverflowError:
+            raise ValueError(f'Decoded value is longer than {length} bytes')
+        # reject extra or missing '1's, so each value has one encoding
+        if len(decoded) - len(decoded.lstrip(b'\0')) != zeros:
+            raise ValueError('Non-canonical base58 encoding')
+        return decoded
+
+    size = (number.bit_length() + 7) // 8
+    return bytes(zeros) + number.to_bytes(size, 'big')
+
+
+def b58encode_many(values: Iterable[bytes]) -> List[str]:
+    """Encodes many values to base58"""
+    return [b58encode(value) for value in values]
+
+
+def b58decode_many(values: Iterable[str], length: int = 0) -> List[bytes]:
+    """Decodes many base58 strings"""
+    return [b58decode(value, length) for value in values]
+
+
 class EosKey:
     """
     EosKey instance.
@@ -16,23 +106,43 @@ class EosKey:
     - No kwargs - generates a new private key
     - Only private_key - public key is being derived from private key
     - Only public_key - EosKey instance has no private key
+
+    Pass ``hot=True`` for long-lived keys used for signing or verifying many
+    signatures, backend will precompute multiplication tables for the key.
+
+    Curve operations are delegated to ``backend``, see ``aioeos.crypto``.
+    Encoded keys are memoized and instances are hashable by public key, so
+    they can be used in sets and as dictionary keys.
     """
+    backend: BaseCryptoBackend = default_backend
 
-    def __init__(self, *, private_key: str = None, public_key: str = None):
+    def __init__(
+        self,
+        *,
+        private_key: str = None,
+        public_key: str = None,
+        hot: bool = False
+    ):
         assert not (private_key and public_key), 'Pass only 1 key'
+        self._private_key: Optional[bytes] = None
+        # memoized string representations of the key
+        self._encoded: Dict[str, str] = {}
         if private_key:
-            private_key = self._parse_key(private_key)
-            self._sk = ecdsa.SigningKey.from_string(
-                private_key, curve=ecdsa.SECP256k1
-            )
+            self._private_key = self._parse_key(private_key)
         elif not public_key:
-            entropy = ecdsa.util.PRNG(secrets.randbits(512))
-            self._sk = ecdsa.SigningKey.generate(
-                entropy=entropy, curve=ecdsa.SECP256k1
-            )
-        self._vk = public_key if public_key else self._sk.get_verifying_key()
+            self._private_key = self.backend.generate_private_key()
+
+        if public_key:
+            self._public_key = _parse_public_key_cached(public_key)
+        else:
+            assert self._private_key
+            self._public_key = self.backend.public_key(self._private_key)
 
-    def _parse_key(self, private_str):
+        if hot:
+            self.backend.precompute(self._public_key)
+
+    @staticmethod
+    def _parse_key(private_str):
         """
         EOS has two private key formats.
         - WIF - legacy format, has to start with 0x80 byte,
@@ -42,15 +152,32 @@ class EosKey:
         match = re.search('^PVT_([A-Za-z0-9]+)_([A-Za-z0-9]+)$', private_str)
         if match:
             key_type, key_string = match.groups()
-            return self._check_decode(key_string, key_type)
+            return EosKey._check_decode(key_string, key_type, 32)
 
         # fallback to WIF
-        private_key = self._check_decode(private_str, 'sha256x2')
+        private_key = EosKey._check_decode(private_str, 'sha256x2', 33)
         if private_key[0] != 0x80:
             raise ValueError('Invalid version')
         return private_key[1:]
 
-    def _calculate_checksum(self, key, key_type=''):
+    @staticmethod
+    def _parse_public_key(public_str):
+        """
+        EOS has two public key formats.
+        - legacy - EOS{base58 encoded key with checksum},
+        - PUB - PUB_{key type}_{base58 encoded key with checksum}
+        """
+        match = re.search('^PUB_([A-Za-z0-9]+)_([A-Za-z0-9]+)$', public_str)
+        if match:
+            key_type, key_string = match.groups()
+            return EosKey._check_decode(key_string, key_type, 33)
+
+        if not public_str.startswith('EOS'):
+            raise ValueError('Invalid public key prefix')
+        return EosKey._check_decode(public_str[3:], length=33)
+
+    @staticmethod
+    def _calculate_checksum(key, key_type=''):
         """
         Takes a private key, returns a checksum.
 
@@ -63,38 +190,35 @@ class EosKey:
             first_sha = hashlib.sha256(key).digest()
             return hashlib.sha256(first_sha).digest()[:4]
         elif key_type in ('', 'K1'):
-            r = hashlib.new('rmd160')
+            r = _ripemd160().copy()
             r.update(key + key_type.encode('utf-8'))
             return r.digest()[:4]
         else:
             raise TypeError('Unsupported key type {}'.format(key_type))
 
-    def _check_encode(self, key_buffer, key_type=''):
+    @staticmethod
+    def _check_encode(key_buffer, key_type=''):
         """
         Encodes the key to checksummed base58 format. ``key_type`` determines
         checksum type.
         """
-        # base58.b58encode only takes bytes, not bytearray, make sure we have
-        # the right type
         assert type(key_buffer) in (bytes, bytearray)
         if isinstance(key_buffer, bytearray):
             key_buffer = bytes(key_buffer)
 
-        checksum = self._calculate_checksum(key_buffer, key_type)
+        checksum = EosKey._calculate_checksum(key_buffer, key_type)
+        return b58encode(key_buffer + checksum)
 
-        # b58encode returns bytes, we always cast this to regular strings in
-        # a next call so let's do this here
-        return base58.b58encode(key_buffer + checksum).decode()
-
-    def _check_decode(self, key_string, key_type=''):
+    @staticmethod
+    def _check_decode(key_string, key_type='', length=0):
         """
         Decodes the key from checksummed base58 format, checks it against
         expected checksum and returns the value. ``key_type`` determines
-        checksum type.
+        checksum type, ``length`` is the expected size of value, if known.
         """
-        buffer = base58.b58decode(key_string)
+        buffer = b58decode(key_string, length + 4 if length else 0)
         key, checksum = buffer[:-4], buffer[-4:]
-        new_checksum = self._calculate_checksum(key, key_type)
+        new_checksum = EosKey._calculate_checksum(key, key_type)
 
         if checksum != new_checksum:
             raise ValueError(
@@ -103,35 +227,11 @@ class EosKey:
         return key
 
     def _recover_key(self, digest, signature, i):
-        ''' Recover the public key from the sig
-            http://www.secg.org/sec1-v2.pdf
-        '''
-        curve = ecdsa.SECP256k1.curve
-        G = ecdsa.SECP256k1.generator
-        order = ecdsa.SECP256k1.order
-        yp = (i % 2)
-        r, s = ecdsa.util.sigdecode_string(signature, order)
-        x = r + (i // 2) * order
-        alpha = ((x * x * x) + (curve.a() * x) + curve.b()) % curve.p()
-        beta = ecdsa.numbertheory.square_root_mod_prime(alpha, curve.p())
-        y = beta if (beta - yp) % 2 == 0 else curve.p() - beta
-        # generate R
-        R = ecdsa.ellipticcurve.Point(curve, x, y, order)
-        e = ecdsa.util.string_to_number(digest)
-        # compute Q
-        Q = (
-            ecdsa.numbertheory.inverse_mod(r, order)
-            * (s * R + (-e % order) * G)
-        )
-        # verify message
-        verifying_key = ecdsa.VerifyingKey.from_public_point(
-            Q, curve=ecdsa.SECP256k1
-        )
-        if not verifying_key.verify_digest(
-            signature, digest, sigdecode=ecdsa.util.sigdecode_string
-        ):
-            return None
-        return ecdsa.VerifyingKey.from_public_point(Q, curve=ecdsa.SECP256k1)
+        """
+        Recovers compressed public key from the signature, returns None if
+        signature is invalid
+        """
+        return self.backend.recover(signature, i, digest)
 
     def _recovery_pubkey_param(self, digest, signature):
         """
@@ -139,89 +239,106 @@ class EosKey:
         public key from the signature
         """
         for i in range(0, 4):
-            p = self._recover_key(digest, signature, i)
-            if p.to_string() == self._vk.to_string():
+            if self._recover_key(digest, signature, i) == self._public_key:
                 return i
 
     def to_public(self):
         """Returns compressed, base58 encoded public key prefixed with EOS"""
-        compressed = self._vk.to_string(encoding='compressed')
-        return f'EOS{self._check_encode(compressed)}'
+        if 'public' not in self._encoded:
+            self._encoded['public'] = (
+                f'EOS{self._check_encode(self._public_key)}'
+            )
+        return self._encoded['public']
 
     def to_wif(self):
         """Converts private key to legacy WIF format"""
-        private_key = b'\x80' + self._sk.to_string()
-        return self._check_encode(private_key, 'sha256x2')
+        if 'wif' not in self._encoded:
+            assert self._private_key, 'Private key is required'
+            private_key = b'\x80' + self._private_key
+            self._encoded['wif'] = self._check_encode(private_key, 'sha256x2')
+        return self._encoded['wif']
 
     def to_pvt(self, key_type='K1'):
         """Converts private key to PVT format"""
-        private_key = self._check_encode(self._sk.to_string(), key_type)
-        return f'PVT_{key_type}_{private_key}'
+        encoding = f'pvt_{key_type}'
+        if encoding not in self._encoded:
+            assert self._private_key, 'Private key is required'
+            private_key = self._check_encode(self._private_key, key_type)
+            self._encoded[encoding] = f'PVT_{key_type}_{private_key}'
+        return self._encoded[encoding]
 
     def sign(self, digest):
         """
         Signs sha256 hash with private key. Returns signature in format:
         ``SIG_K1_{digest}``
         """
-        cnt = 0
         if len(digest) != 32:
             raise ValueError("32 byte buffer required")
+        assert self._private_key, 'Private key is required'
 
-        # repeat until the signature is canonical
-        is_canonical = False
-        while not is_canonical:
-            # get deterministic k
-            sha_digest = hashlib.sha256(
-                digest + bytes([cnt] if cnt else [])
-            ).digest()
-
-            k = ecdsa.rfc6979.generate_k(
-                self._sk.curve.generator.order(),
-                self._sk.privkey.secret_multiplier,
-                hashlib.sha256,
-                sha_digest
-            )
-            # sign the message, returns der_signature
-            der_signature = self._sk.sign_digest(
-                digest, sigencode=ecdsa.util.sigencode_der, k=k
-            )
-
-            # decode der_signature
-            r, s = ecdsa.util.sigdecode_der(
-                der_signature, self._sk.curve.generator.order()
-            )
-            is_canonical = (
-                der_signature[3] == 32
-                and der_signature[5 + der_signature[3]] == 32
-            )
-            # try another one if not canonical
-            cnt += 1
-
-        # encode signature in string format and derive recovery parameter
-        sig = ecdsa.util.sigencode_string(
-            r, s, self._sk.curve.generator.order()
-        )
+        recovery_param, sig = self.backend.sign(self._private_key, digest)
 
         # 4 because it's compressed and 27 because it's compact (?)
         # https://github.com/EOSIO/eosjs-ecc/blob/master/src/signature.js#L216
-        i = self._recovery_pubkey_param(digest, sig) + 4 + 27
+        i = recovery_param + 4 + 27
         return f'SIG_K1_{self._check_encode(bytes([i]) + sig, "K1")}'
 
+    @staticmethod
+    def _decode_signature(encoded_sig) -> Tuple[int, bytes]:
+        """
+        Decodes signature in ``SIG_K1_{digest}`` format, returns a tuple
+        containing recovery parameter and signature.
+        """
+        _, key_type, signature = encoded_sig.split('_')
+        decoded = EosKey._check_decode(signature, key_type, 65)
+        return (decoded[0] - 27) & 3, decoded[1:]
+
+    @classmethod
+    def from_signature(cls, encoded_sig, digest) -> 'EosKey':
+        """
+        Recovers public key which was used to sign the digest. Returned
+        EosKey instance has no private key.
+        """
+        recovery_param, sig = cls._decode_signature(encoded_sig)
+        public_key = cls.backend.recover(sig, recovery_param, digest)
+        if not public_key:
+            raise ValueError('Invalid signature')
+
+        key = cls.__new__(cls)
+        key._private_key = None
+        key._encoded = {}
+        key._public_key = public_key
+        return key
+
     def verify(self, encoded_sig, digest) -> bool:
         """Verifies signature with private key"""
-        _, key_type, signature = encoded_sig.split('_')
         try:
-            sig = self._check_decode(signature, key_type)[1:]
-            self._vk.verify_digest(
-                sig, digest, sigdecode=ecdsa.util.sigdecode_string
-            )
-        except (ecdsa.keys.BadSignatureError, TypeError):
+            _, sig = self._decode_signature(encoded_sig)
+        except TypeError:
             return False
-        return True
+        return self.backend.verify(self._public_key, sig, digest)
 
     def to_key_weight(self, weight: int) -> EosKeyWeight:
         return EosKeyWeight(key=self.to_public(), weight=weight)
 
     def __eq__(self, other) -> bool:
-        assert isinstance(other, EosKey), 'Can compare only to EosKey instance'
-        return self.to_public() == other.to_public()
+        if not isinstance(other, EosKey):
+            return NotImplemented
+        return self._public_key == other._public_key
+
+    def __hash__(self) -> int:
+        return hash(self._public_key)
+
+
+@lru_cache(maxsize=4096)
+def _parse_public_key_cached(public_str: str) -> bytes:
+    """Public keys are usually parsed over and over again, cache them"""
+    return EosKey._parse_public_key(public_str)
+
+
+def recover_public_key(encoded_sig: str, digest: bytes) -> str:
+    """
+    Returns public key which was used to sign the digest, in the format
+    returned by ``EosKey.to_public``
+    """
+    return EosKey.from_signature(encoded_sig, digest).to_public()
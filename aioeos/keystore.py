@@ -0,0 +1,95 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from aioeos.authorization import (  # noqa
+    EosAuthorityEvaluator, EosPermissionCache, authority_from_dict
+)
+from aioeos.keys import EosKey, _parse_public_key_cached
+from aioeos.rpc import EosJsonRpc
+from aioeos.types import EosTransaction
+
+
+class EosKeyStore:
+    """
+    Set of keys indexed by public key. Given a transaction, keystore
+    figures out which of its keys are required to satisfy authorizations of
+    its actions and signs only with them. Authorities are checked with
+    ``EosAuthorityEvaluator``, account permissions come from a permission
+    cache, so there are no ``get_required_keys`` calls.
+
+    :param keys: keys with private keys,
+    :param permissions: permission cache used for resolving authorizations
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[EosKey] = (),
+        *,
+        permissions: Optional[EosPermissionCache] = None
+    ):
+        self.permissions = permissions or EosPermissionCache()
+        self.evaluator = EosAuthorityEvaluator(self.permissions)
+        self._keys: Dict[bytes, EosKey] = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, public_key: str):
+        return self.get(public_key) is not None
+
+    def add(self, key: EosKey):
+        """Adds a key, private key is required"""
+        assert key.to_wif(), 'Private key is required'
+        self._keys[_parse_public_key_cached(key.to_public())] = key
+
+    def remove(self, public_key: str):
+        """Removes key with given public key"""
+        self._keys.pop(_parse_public_key_cached(public_key), None)
+
+    def get(self, public_key: str) -> Optional[EosKey]:
+        """Returns key for given public key in any supported format"""
+        return self._keys.get(_parse_public_key_cached(public_key))
+
+    async def required_keys(self, transaction: EosTransaction) -> List[EosKey]:
+        """
+        Returns keys required to sign the transaction, raises ValueError if
+        the keystore can't satisfy one of its authorizations.
+        """
+        permissions = {
+            (authorization.actor, authorization.permission): authorization
+            for action in transaction.context_free_actions
+            + transaction.actions
+            for authorization in action.authorization
+        }
+        available_keys = [key.to_public() for key in self._keys.values()]
+
+        required: Set[str] = set()
+        for permission in permissions.values():
+            keys = await self.evaluator.satisfy(
+                permission, available_keys, delay_sec=transaction.delay_sec
+            )
+            if keys is None:
+                raise ValueError(
+                    f'Missing keys for {permission.actor}@'
+                    f'{permission.permission}'
+                )
+            required |= keys
+        return [
+            self._keys[_parse_public_key_cached(key)]
+            for key in sorted(required)
+        ]
+
+    async def sign_and_push_transaction(
+        self,
+        rpc: EosJsonRpc,
+        transaction: EosTransaction,
+        *,
+        context_free_bytes: bytes = bytes(32)
+    ):
+        """Signs transaction with required keys and pushes it"""
+        return await rpc.sign_and_push_transaction(
+            transaction,
+            context_free_bytes=context_free_bytes,
+            keys=await self.required_keys(transaction)
+        )
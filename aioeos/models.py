@@ -0,0 +1,246 @@
+"""
+Typed responses of the most used RPC endpoints, returned when ``typed`` is
+passed to ``EosJsonRpc.get_info``, ``get_account`` or ``get_block``.
+
+Models use ``__slots__`` and keep only known fields, so they take less
+memory than decoded dicts when cached, and attribute access is faster.
+Nested objects, such as permissions or block transactions, are converted on
+first access.
+"""
+import binascii
+from datetime import datetime, timezone
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar
+import zlib
+
+from aioeos.types import EosAuthority
+from aioeos.views import EosTransactionView
+
+
+T = TypeVar('T')
+
+
+def parse_time(value: str) -> datetime:
+    """Parses time returned by the node, which is always in UTC"""
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+class _LazyField:
+    """
+    Converts raw value of a field on first access. Raw value is dropped
+    once converted.
+    """
+
+    def __init__(self, name: str, convert: Callable[[Any], Any]):
+        self.slot = f'_{name}'
+        self.raw_slot = f'_{name}_raw'
+        self.convert = convert
+
+    def __get__(self, instance, owner=None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            pass
+        value = getattr(instance, self.raw_slot)
+        if value is not None:
+            value = self.convert(value)
+        setattr(instance, self.slot, value)
+        setattr(instance, self.raw_slot, None)
+        return value
+
+
+class EosResponse:
+    """
+    Base class of typed responses. Annotated fields are copied from the
+    response, missing ones are set to ``None``. Fields listed in ``_lazy``
+    are converted with given function on first access.
+    """
+    __slots__ = ()
+    _fields: ClassVar[tuple] = ()
+    _lazy: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    _lazy_fields: ClassVar[Dict[str, _LazyField]] = {}
+
+    def __init__(self, data: dict):
+        for name in self._fields:
+            setattr(self, name, data.get(name))
+        for name, field in self._lazy_fields.items():
+            setattr(self, field.raw_slot, data.get(name))
+
+    @classmethod
+    def from_list(cls: Type[T], items: List[dict]) -> List[T]:
+        return [cls(item) for item in items]  # type: ignore
+
+    def __repr__(self) -> str:
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in self._fields
+        )
+        return f'{type(self).__name__}({values})'
+
+
+def response_model(cls: Type[T]) -> Type[T]:
+    """
+    Recreates response class with ``__slots__`` for its annotated fields and
+    descriptors for lazy ones, same way as ``add_slots`` does it
+    """
+    names = [name for name in cls.__annotations__ if not name.startswith('_')]
+    lazy = cls._lazy  # type: ignore
+    fields = tuple(name for name in names if name not in lazy)
+    lazy_fields = {name: _LazyField(name, lazy[name]) for name in lazy}
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = fields + tuple(
+        slot
+        for field in lazy_fields.values()
+        for slot in (field.slot, field.raw_slot)
+    )
+    cls_dict['_fields'] = fields
+    cls_dict['_lazy_fields'] = lazy_fields
+    cls_dict.update(lazy_fields)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    metaclass: Any = type(cls)
+    model = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    model.__qualname__ = cls.__qualname__
+    return model
+
+
+@response_model
+class EosInfo(EosResponse):
+    """Response of ``get_info``"""
+    _lazy = {'head_block_time': parse_time}
+
+    server_version: str
+    chain_id: str
+    head_block_num: int
+    last_irreversible_block_num: int
+    last_irreversible_block_id: str
+    head_block_id: str
+    head_block_time: datetime
+    head_block_producer: str
+    virtual_block_cpu_limit: int
+    virtual_block_net_limit: int
+    block_cpu_limit: int
+    block_net_limit: int
+    server_version_string: str
+
+    @property
+    def chain_id_bytes(self) -> bytes:
+        return binascii.unhexlify(self.chain_id)
+
+
+@response_model
+class EosResourceLimit(EosResponse):
+    """CPU or NET usage of an account"""
+    used: int
+    available: int
+    max: int
+
+
+def _authority_from_dict(data: dict) -> EosAuthority:
+    # authorization module depends on rpc, which depends on models
+    from aioeos.authorization import authority_from_dict
+    return authority_from_dict(data)
+
+
+@response_model
+class EosPermissionInfo(EosResponse):
+    """Permission of an account, as returned by ``get_account``"""
+    _lazy = {'required_auth': _authority_from_dict}
+
+    perm_name: str
+    parent: str
+    required_auth: EosAuthority
+
+
+@response_model
+class EosAccountInfo(EosResponse):
+    """Response of ``get_account``"""
+    _lazy = {
+        'created': parse_time,
+        'last_code_update': parse_time,
+        'net_limit': EosResourceLimit,
+        'cpu_limit': EosResourceLimit,
+        'permissions': EosPermissionInfo.from_list
+    }
+
+    account_name: str
+    head_block_num: int
+    privileged: bool
+    last_code_update: datetime
+    created: datetime
+    core_liquid_balance: Optional[str]
+    ram_quota: int
+    ram_usage: int
+    net_weight: int
+    cpu_weight: int
+    net_limit: EosResourceLimit
+    cpu_limit: EosResourceLimit
+    permissions: List[EosPermissionInfo]
+    total_resources: Optional[dict]
+    self_delegated_bandwidth: Optional[dict]
+    refund_request: Optional[dict]
+    voter_info: Optional[dict]
+
+
+@response_model
+class EosTransactionReceipt(EosResponse):
+    """
+    Receipt of a transaction included in a block. Transaction is either its
+    ID, for deferred transactions, or packed transaction with signatures.
+    """
+    status: str
+    cpu_usage_us: int
+    net_usage_words: int
+    trx: Any
+
+    @property
+    def id(self) -> str:
+        return self.trx if isinstance(self.trx, str) else self.trx['id']
+
+    @property
+    def packed_trx(self) -> Optional[str]:
+        """
+        Hex encoded transaction, decompressed if needed. ``None`` for deferred
+        transactions.
+        """
+        if isinstance(self.trx, str):
+            return None
+        compression = self.trx.get('compression', 'none')
+        if compression in ('none', 0):
+            return self.trx['packed_trx']
+        if compression in ('zlib', 1):
+            return binascii.hexlify(zlib.decompress(
+                binascii.unhexlify(self.trx['packed_trx'])
+            )).decode()
+        raise ValueError(f'Unsupported compression: {compression}')
+
+    def view(self, payload_types=None) -> Optional[EosTransactionView]:
+        """Returns lazily decoded view of the transaction"""
+        if not self.packed_trx:
+            return None
+        return EosTransactionView.from_hex(self.packed_trx, payload_types)
+
+
+@response_model
+class EosBlock(EosResponse):
+    """Response of ``get_block``"""
+    _lazy = {
+        'timestamp': parse_time,
+        'transactions': EosTransactionReceipt.from_list
+    }
+
+    id: str
+    block_num: int
+    ref_block_prefix: int
+    timestamp: datetime
+    producer: str
+    confirmed: int
+    previous: str
+    transaction_mroot: str
+    action_mroot: str
+    schedule_version: int
+    new_producers: Optional[dict]
+    producer_signature: str
+    transactions: List[EosTransactionReceipt]
@@ -0,0 +1,181 @@
+import binascii
+import hashlib
+from typing import Dict, List, Sequence
+
+from aioeos import serializer
+from aioeos.keys import EosKey
+from aioeos.types import AbiBytes, EosTransaction
+
+
+# NET usage parameters of the default chain configuration
+FIXED_NET_OVERHEAD_OF_PACKED_TRX = 16
+BASE_PER_TRANSACTION_NET_USAGE = 12
+TRANSACTION_ID_NET_USAGE = 32
+CONTEXT_FREE_DISCOUNT_NET_USAGE_NUM = 20
+CONTEXT_FREE_DISCOUNT_NET_USAGE_DEN = 100
+
+# key type followed by 65 bytes of signature
+SIGNATURE_SIZE = 66
+
+_VARUINT = serializer.VarUIntSerializer()
+
+
+def signatures_size(signature_count: int) -> int:
+    """Returns size of packed list of signatures"""
+    return (
+        len(_VARUINT.serialize(signature_count))
+        + signature_count * SIGNATURE_SIZE
+    )
+
+
+def get_net_usage(
+    packed_size: int, prunable_size: int, delay_sec: int = 0
+) -> int:
+    """
+    Returns NET usage in bytes, computed the same way as the node does it
+    before executing a transaction. Prunable data, signatures and
+    context-free data, is billed at a discount.
+
+    :param packed_size: size of packed transaction,
+    :param prunable_size: size of packed signatures and context-free data,
+    :param delay_sec: transaction delay
+    """
+    # rounded up
+    discounted_size = -(
+        -prunable_size
+        * CONTEXT_FREE_DISCOUNT_NET_USAGE_NUM
+        // CONTEXT_FREE_DISCOUNT_NET_USAGE_DEN
+    )
+    usage = (
+        BASE_PER_TRANSACTION_NET_USAGE
+        + FIXED_NET_OVERHEAD_OF_PACKED_TRX
+        + packed_size
+        + discounted_size
+    )
+    if delay_sec:
+        # delayed transaction is charged for its retirement upfront
+        usage += BASE_PER_TRANSACTION_NET_USAGE + TRANSACTION_ID_NET_USAGE
+    return usage
+
+
+def estimate_net_usage_words(
+    transaction: EosTransaction,
+    signature_count: int = 1,
+    context_free_data: Sequence[bytes] = ()
+) -> int:
+    """
+    Returns NET usage in words of a transaction, action payloads have to be
+    binary or ABI objects
+    """
+    return EosPackedTransaction.from_transaction(
+        transaction, context_free_data
+    ).net_usage_words(signature_count)
+
+
+class EosPackedTransaction:
+    """
+    Serialized transaction together with its context-free data. Packed
+    bytes, ID and signing digests are computed once, so a transaction can
+    be indexed by ID and signed offline without serializing it again.
+
+    Changes made to the source transaction after packing are not reflected,
+    pack it again instead.
+
+    :param packed_bytes: serialized transaction,
+    :param context_free_data: context-free data, a list of binary blobs
+    """
+
+    def __init__(
+        self, packed_bytes: bytes, context_free_data: Sequence[bytes] = ()
+    ):
+        self.packed_bytes = packed_bytes
+        self.context_free_data = list(context_free_data)
+        self._id = ''
+        self._signing_digests: Dict[bytes, bytes] = {}
+
+    @classmethod
+    def from_transaction(
+        cls,
+        transaction: EosTransaction,
+        context_free_data: Sequence[bytes] = ()
+    ) -> 'EosPackedTransaction':
+        """Serializes transaction, action payloads have to be binary"""
+        return cls(serializer.serialize(transaction), context_free_data)
+
+    @property
+    def id(self) -> str:
+        """Hex encoded transaction ID, hash of serialized transaction"""
+        if not self._id:
+            self._id = hashlib.sha256(self.packed_bytes).hexdigest()
+        return self._id
+
+    @property
+    def packed_context_free_data(self) -> bytes:
+        """Serialized context-free data, empty if there is no data"""
+        if not self.context_free_data:
+            return b''
+        return serializer.serialize(
+            self.context_free_data, List[AbiBytes]
+        )
+
+    @property
+    def context_free_bytes(self) -> bytes:
+        """Hash of context-free data, 32 zero bytes if there is no data"""
+        if not self.context_free_data:
+            return bytes(32)
+        return hashlib.sha256(self.packed_context_free_data).digest()
+
+    @property
+    def delay_sec(self) -> int:
+        # expiration, ref_block_num and ref_block_prefix have fixed size,
+        # followed by max_net_usage_words and max_cpu_usage_ms
+        length, _ = _VARUINT.deserialize(self.packed_bytes[10:])
+        return _VARUINT.deserialize(self.packed_bytes[11 + length:])[1]
+
+    def prunable_size(self, signature_count: int = 1) -> int:
+        """
+        Returns size of signatures and context-free data, which can be pruned
+        from blocks, so the node bills only part of it
+        """
+        return signatures_size(signature_count) + len(
+            self.packed_context_free_data
+        )
+
+    def net_usage(self, signature_count: int = 1) -> int:
+        """
+        Returns NET usage in bytes the node bills for this transaction signed
+        with given number of signatures
+        """
+        return get_net_usage(
+            len(self.packed_bytes),
+            self.prunable_size(signature_count),
+            self.delay_sec
+        )
+
+    def net_usage_words(self, signature_count: int = 1) -> int:
+        """Returns NET usage in 8 byte words, as in transaction receipt"""
+        return (self.net_usage(signature_count) + 7) // 8
+
+    def signing_digest(self, chain_id: bytes) -> bytes:
+        """Returns digest which has to be signed for given chain"""
+        if chain_id not in self._signing_digests:
+            self._signing_digests[chain_id] = hashlib.sha256(b''.join((
+                chain_id, self.packed_bytes, self.context_free_bytes
+            ))).digest()
+        return self._signing_digests[chain_id]
+
+    def sign(self, chain_id: bytes, keys: Sequence[EosKey]) -> List[str]:
+        """Signs transaction for given chain with each key"""
+        digest = self.signing_digest(chain_id)
+        return [key.sign(digest) for key in keys]
+
+    def to_push_args(self, signatures: List[str]) -> dict:
+        """Returns payload of ``push_transaction`` request"""
+        return {
+            'signatures': signatures,
+            'compression': 0,
+            'packed_context_free_data': binascii.hexlify(
+                self.packed_context_free_data
+            ).decode(),
+            'packed_trx': binascii.hexlify(self.packed_bytes).decode()
+        }
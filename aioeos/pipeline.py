@@ -0,0 +1,204 @@
+import asyncio
+import binascii
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+import time
+from typing import List, Optional
+
+from aioeos import serializer
+from aioeos.keys import EosKey
+from aioeos.rpc import EosJsonRpc, get_signing_digest, sign_transaction
+from aioeos.signing import EosSigningPool
+from aioeos.types import EosTransaction
+
+
+@dataclass
+class EosPipelineStats:
+    """Throughput and latency statistics of a transaction pipeline"""
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    total_latency: float = 0
+    max_latency: float = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def pending(self) -> int:
+        return self.submitted - self.succeeded - self.failed
+
+    @property
+    def average_latency(self) -> float:
+        """Average time in seconds between submission and result"""
+        completed = self.succeeded + self.failed
+        return self.total_latency / completed if completed else 0
+
+    @property
+    def throughput(self) -> float:
+        """Successfully pushed transactions per second"""
+        elapsed = time.monotonic() - self.started_at
+        return self.succeeded / elapsed if elapsed else 0
+
+    def record(self, latency: float, success: bool):
+        if success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+@dataclass
+class _PipelineItem:
+    transaction: EosTransaction
+    keys: List[EosKey]
+    context_free_bytes: bytes
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class EosTransactionPipeline:
+    """
+    Submission queue for pushing large amounts of transactions. Transactions
+    are processed by a pool of workers, each one resolving action payloads,
+    signing and pushing the transaction the same way
+    ``EosJsonRpc.sign_and_push_transaction`` does.
+
+    Signing is CPU-bound, so it's offloaded to an executor to keep the event
+    loop responsive. Pass a ``ProcessPoolExecutor`` to make use of multiple
+    cores, by default loop's default executor is used. If a signing pool is
+    provided, transactions are serialized in the event loop and only signing
+    is done by the pool, which avoids sending keys with each transaction.
+
+    :param rpc: RPC client used for pushing transactions,
+    :param concurrency: number of transactions processed at the same time,
+    :param max_queue_size: number of queued transactions after which
+                           ``submit`` starts waiting for a free slot,
+    :param executor: executor used for serializing and signing,
+    :param signing_pool: signing pool holding all keys used for signing
+    """
+
+    def __init__(
+        self,
+        rpc: EosJsonRpc,
+        *,
+        concurrency: int = 8,
+        max_queue_size: int = 1000,
+        executor: Optional[Executor] = None,
+        signing_pool: Optional[EosSigningPool] = None
+    ):
+        assert concurrency > 0, 'Concurrency has to be a positive number'
+        self.rpc = rpc
+        self.concurrency = concurrency
+        self.max_queue_size = max_queue_size
+        self.executor = executor
+        self.signing_pool = signing_pool
+        self.stats = EosPipelineStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def start(self):
+        """Spawns workers, called automatically on first submission"""
+        if self._workers:
+            return
+        # lock is created lazily, so it's bound to the running loop
+        if not self._start_lock:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            # concurrent submissions wait for the first one to start workers
+            if self._workers:
+                return
+            # warm up chain ID cache so workers don't race to fetch it
+            await self.rpc.get_chain_id()
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._workers = [
+                asyncio.ensure_future(self._worker())
+                for _ in range(self.concurrency)
+            ]
+
+    async def close(self):
+        """Waits until queued transactions are processed and stops workers"""
+        if not self._workers:
+            return
+        assert self._queue
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self,
+        transaction: EosTransaction,
+        *,
+        keys: List[EosKey] = [],
+        context_free_bytes: bytes = bytes(32)
+    ) -> asyncio.Future:
+        """
+        Queues transaction for submission. Waits if the queue is full. Returns
+        a future resolved with RPC response once the transaction is pushed.
+        """
+        await self.start()
+        assert self._queue
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put(
+            _PipelineItem(transaction, keys, context_free_bytes, future)
+        )
+        self.stats.submitted += 1
+        return future
+
+    async def _worker(self):
+        while True:
+            item = await self._queue.get()
+            try:
+                response = await self._process(item)
+            except Exception as e:
+                self._complete(item, False)
+                if not item.future.done():
+                    item.future.set_exception(e)
+            else:
+                self._complete(item, True)
+                if not item.future.done():
+                    item.future.set_result(response)
+            finally:
+                self._queue.task_done()
+
+    def _complete(self, item: _PipelineItem, success: bool):
+        self.stats.record(time.monotonic() - item.submitted_at, success)
+
+    async def _process(self, item: _PipelineItem):
+        await self.rpc.resolve_action_payloads(item.transaction)
+        chain_id = await self.rpc.get_chain_id()
+
+        if self.signing_pool:
+            serialized_transaction = serializer.serialize(item.transaction)
+            digest = get_signing_digest(
+                chain_id, serialized_transaction, item.context_free_bytes
+            )
+            signatures = await self.signing_pool.sign_many_async(
+                [digest] * len(item.keys), item.keys
+            )
+        else:
+            signatures, serialized_transaction = (
+                await asyncio.get_event_loop().run_in_executor(
+                    self.executor,
+                    sign_transaction,
+                    chain_id,
+                    item.transaction,
+                    item.keys,
+                    item.context_free_bytes
+                )
+            )
+        return await self.rpc.push_transaction(
+            signatures=signatures,
+            serialized_transaction=(
+                binascii.hexlify(serialized_transaction).decode()
+            )
+        )
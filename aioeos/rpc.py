@@ -2,11 +2,15 @@ import base64
 import binascii
 from dataclasses import asdict
 import hashlib
-from typing import Any, List
+from json import dumps as json_dumps, loads as json_loads
+from keyword import iskeyword
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from aiohttp import ClientSession
 from aioeos import exceptions, serializer
 from aioeos.keys import EosKey
+from aioeos.models import EosAccountInfo, EosBlock, EosInfo
+from aioeos.packed import EosPackedTransaction
 from aioeos.types import EosTransaction, is_abi_object
 
 
@@ -16,11 +20,21 @@ ERROR_NAME_MAP = {
     'action_validate_exception': exceptions.EosActionValidateException,
     'tx_cpu_usage_exceeded': exceptions.EosTxCpuUsageExceededException,
     'tx_net_usage_exceeded': exceptions.EosTxNetUsageExceededException,
+    'tx_duplicate': exceptions.EosTxDuplicateException,
     'ram_usage_exceeded': exceptions.EosRamUsageExceededException,
     'eosio_assert_message_exception': exceptions.EosAssertMessageException,
 }
 
 
+def _abi_dict_factory(items: List[Tuple[str, Any]]) -> dict:
+    # fields named after Python keywords have a trailing underscore, eg.
+    # ``from_``, ABI uses the keyword itself
+    return {
+        k[:-1] if k.endswith('_') and iskeyword(k[:-1]) else k: v
+        for k, v in items
+    }
+
+
 def mixed_to_dict(payload: Any):
     """
     Recursively converts payload with mixed ABI objects and dicts to dict
@@ -28,31 +42,100 @@ def mixed_to_dict(payload: Any):
     if isinstance(payload, dict):
         return {k: mixed_to_dict(v) for k, v in payload.items()}
     if is_abi_object(type(payload)):
-        return asdict(payload)
+        return asdict(payload, dict_factory=_abi_dict_factory)
     return payload
 
 
+def get_signing_digest(
+    chain_id: bytes,
+    serialized_transaction: bytes,
+    context_free_bytes: bytes = bytes(32)
+) -> bytes:
+    """Returns digest of serialized transaction which has to be signed"""
+    return hashlib.sha256(
+        b''.join((chain_id, serialized_transaction, context_free_bytes))
+    ).digest()
+
+
+def sign_transaction(
+    chain_id: bytes,
+    transaction: EosTransaction,
+    keys: List[EosKey],
+    context_free_bytes: bytes = bytes(32)
+) -> Tuple[List[str], bytes]:
+    """
+    Serializes transaction and signs its digest with given keys. Returns a
+    tuple containing signatures and serialized transaction. All action
+    payloads need to be converted to binary format first.
+    """
+    serialized_transaction = serializer.serialize(transaction)
+    digest = get_signing_digest(
+        chain_id, serialized_transaction, context_free_bytes
+    )
+    return [key.sign(digest) for key in keys], serialized_transaction
+
+
 class EosJsonRpc:
-    def __init__(self, url):
+    """
+    Client of EOS node RPC API.
+
+    JSON encoding of requests and decoding of responses can be done with a
+    faster library, eg. ``orjson``, by passing its ``dumps`` and ``loads``.
+    Encoders returning bytes are supported.
+
+    :param url: URL of the node,
+    :param dumps: function encoding request payloads,
+    :param loads: function decoding response bodies
+    """
+
+    def __init__(
+        self,
+        url,
+        *,
+        dumps: Optional[Callable[[Any], Union[str, bytes]]] = None,
+        loads: Optional[Callable[[Union[str, bytes]], Any]] = None
+    ):
         self.URL = url
+        self.dumps = dumps or json_dumps
+        self.loads = loads or json_loads
         self._chain_id = None
 
-    async def post(self, endpoint, json={}):
-        async with ClientSession() as session:
+    def _serialize(self, value: Any) -> str:
+        data = self.dumps(value)
+        # aiohttp expects text, encoders like orjson return bytes
+        return data.decode() if isinstance(data, bytes) else data
+
+    async def post(self, endpoint, json={}, *, raw=False):
+        """
+        Sends request to the node, returns decoded response. If ``raw`` is
+        set, response body is returned as bytes without decoding it, unless
+        the request failed.
+        """
+        async with ClientSession(json_serialize=self._serialize) as session:
             async with session.post(
                 f'{self.URL}/v1{endpoint}',
                 json=json
             ) as res:
-                resp_dict = await res.json(content_type=None)
-
-                # Who needs HTTP status codes, am I right? :D
-                if resp_dict.get('code') == 500:
-                    error = resp_dict.get('error', {})
-                    raise ERROR_NAME_MAP.get(
-                        error.get('name'),
-                        exceptions.EosRpcException
-                    )(error)
-                return resp_dict
+                body = await res.read()
+                status = res.status
+
+        if raw:
+            if status >= 400:
+                self._raise_error(self.loads(body))
+            return body
+
+        resp_dict = self.loads(body)
+        # Who needs HTTP status codes, am I right? :D
+        if resp_dict.get('code') == 500:
+            self._raise_error(resp_dict)
+        return resp_dict
+
+    def _raise_error(self, resp_dict: dict):
+        error = resp_dict.get('error', {})
+        raise ERROR_NAME_MAP.get(
+            error.get('name'),
+            exceptions.EosRpcException
+        )(error)
 
     async def abi_json_to_bin(self, code, action, args):
         return await self.post(
@@ -70,12 +153,13 @@ class EosJsonRpc:
             }
         )
 
-    async def get_account(self, account_name: str):
-        return await self.post(
+    async def get_account(self, account_name: str, *, typed=False):
+        response = await self.post(
             '/chain/get_account', {
                 'account_name': account_name
             }
         )
+        return EosAccountInfo(response) if typed else response
 
     async def get_block_header_state(self, block_num_or_id):
         return await self.post(
@@ -84,12 +168,13 @@ class EosJsonRpc:
             }
         )
 
-    async def get_block(self, block_num_or_id):
-        return await self.post(
+    async def get_block(self, block_num_or_id, *, typed=False):
+        response = await self.post(
             '/chain/get_block', {
                 'block_num_or_id': block_num_or_id
             }
         )
+        return EosBlock(response) if typed else response
 
     async def get_code(self, account_name: str):
         return await self.post(
@@ -115,8 +200,9 @@ class EosJsonRpc:
             }
         )
 
-    async def get_info(self):
-        return await self.post('/chain/get_info')
+    async def get_info(self, *, typed=False):
+        response = await self.post('/chain/get_info')
+        return EosInfo(response) if typed else response
 
     async def get_chain_id(self):
         if not self._chain_id:
@@ -201,13 +287,10 @@ class EosJsonRpc:
             }
         )
 
-    async def sign_and_push_transaction(
-        self,
-        transaction: EosTransaction,
-        *,
-        context_free_bytes: bytes = bytes(32),
-        keys: List[EosKey] = []
-    ):
+    async def resolve_action_payloads(self, transaction: EosTransaction):
+        """
+        Converts dict action payloads to binary format using the RPC node
+        """
         for action in transaction.actions:
             if isinstance(action.data, dict):
                 abi_bin = await self.abi_json_to_bin(
@@ -215,30 +298,47 @@ class EosJsonRpc:
                 )
                 action.data = binascii.unhexlify(abi_bin['binargs'])
 
+    async def sign_and_push_transaction(
+        self,
+        transaction: EosTransaction,
+        *,
+        context_free_bytes: bytes = bytes(32),
+        keys: List[EosKey] = []
+    ):
+        await self.resolve_action_payloads(transaction)
         chain_id = await self.get_chain_id()
-        serialized_transaction = serializer.serialize(transaction)
-
-        digest = hashlib.sha256(
-            b''.join((chain_id, serialized_transaction, context_free_bytes))
-        ).digest()
+        signatures, serialized_transaction = sign_transaction(
+            chain_id, transaction, keys, context_free_bytes
+        )
 
         return await self.push_transaction(
-            signatures=[key.sign(digest) for key in keys],
+            signatures=signatures,
             serialized_transaction=(
                 binascii.hexlify(serialized_transaction).decode()
             )
         )
 
-    async def push_transaction(self, signatures, serialized_transaction):
+    async def push_transaction(
+        self, signatures, serialized_transaction, packed_context_free_data=''
+    ):
         return await self.post(
             '/chain/push_transaction', {
                 'signatures': signatures,
                 'compression': 0,
-                'packed_context_free_data': '',
+                'packed_context_free_data': packed_context_free_data,
                 'packed_trx': serialized_transaction
             }
         )
 
+    async def push_packed_transaction(
+        self, packed_transaction: EosPackedTransaction, signatures: List[str]
+    ):
+        """Pushes transaction signed offline, with its context-free data"""
+        return await self.post(
+            '/chain/push_transaction',
+            packed_transaction.to_push_args(signatures)
+        )
+
     async def get_db_size(self):
         return await self.post('/db_size/get')
 
@@ -0,0 +1,224 @@
+import asyncio
+from dataclasses import replace
+import time
+from typing import Dict, List, Optional, Sequence, Type
+
+from aioeos import exceptions
+from aioeos.account import EosAccount
+from aioeos.keys import EosKey
+from aioeos.rpc import EosJsonRpc
+from aioeos.types import EosTransaction
+
+
+# errors which mean that paying account ran out of given resource
+RESOURCE_EXCEPTIONS: Dict[Type[Exception], str] = {
+    exceptions.EosTxCpuUsageExceededException: 'cpu',
+    exceptions.EosTxNetUsageExceededException: 'net',
+    exceptions.EosRamUsageExceededException: 'ram'
+}
+
+
+class EosPayerResources:
+    """
+    Resources available to a paying account, as of the last ``get_account``
+    call, reduced by usage of transactions sent since then.
+
+    :param account: paying account
+    """
+
+    def __init__(self, account: EosAccount):
+        self.account = account
+        self.cpu_available = 0
+        self.net_available = 0
+        self.ram_available = 0
+        self.updated_at = 0.0
+        self.blocked_until = 0.0
+
+    def update(self, data: dict):
+        """Updates resources from ``get_account`` response"""
+        self.cpu_available = data['cpu_limit']['available']
+        self.net_available = data['net_limit']['available']
+        # negative RAM quota means unlimited RAM, eg. for privileged accounts
+        ram_quota = data['ram_quota']
+        self.ram_available = (
+            ram_quota - data['ram_usage'] if ram_quota >= 0 else 2 ** 63
+        )
+        self.updated_at = time.time()
+
+    def has_headroom(
+        self, cpu_us: int = 0, net_bytes: int = 0, ram_bytes: int = 0
+    ) -> bool:
+        """Checks whether account can pay for given resources right now"""
+        return (
+            self.blocked_until <= time.time()
+            and self.cpu_available > cpu_us
+            and self.net_available > net_bytes
+            and self.ram_available >= ram_bytes
+        )
+
+    def consume(
+        self, cpu_us: int = 0, net_bytes: int = 0, ram_bytes: int = 0
+    ):
+        """Subtracts resources used by a transaction, can be negative"""
+        self.cpu_available -= cpu_us
+        self.net_available -= net_bytes
+        self.ram_available -= ram_bytes
+
+    def block(self, resource: str, duration: float):
+        """Marks resource as exhausted and skips the account for a while"""
+        setattr(self, f'{resource}_available', 0)
+        self.blocked_until = time.time() + duration
+
+
+class EosPayerScheduler:
+    """
+    Spreads transactions across a set of paying accounts. Each transaction
+    is routed to the account with the most CPU left which can afford it,
+    that account's authorization is put first in the first action, so it
+    gets billed for CPU and NET.
+
+    Resources are taken from ``get_account``, refreshed after ``ttl``
+    seconds, and reduced locally by usage reported in push responses, so
+    concurrent transactions don't all pick the same account. Account which
+    fails with a CPU, NET or RAM usage error is skipped for ``cooldown``
+    seconds and the transaction is pushed with the next one.
+
+    :param rpc: RPC client,
+    :param accounts: paying accounts, with private keys,
+    :param permission: permission of paying accounts used for billing,
+    :param ttl: time in seconds after which resources are fetched again,
+    :param cooldown: time in seconds for which exhausted account is skipped
+    """
+
+    def __init__(
+        self,
+        rpc: EosJsonRpc,
+        accounts: Sequence[EosAccount],
+        *,
+        permission: str = 'active',
+        ttl: float = 30,
+        cooldown: float = 60
+    ):
+        assert accounts, 'Provide at least one paying account'
+        self.rpc = rpc
+        self.permission = permission
+        self.ttl = ttl
+        self.cooldown = cooldown
+        self.payers: Dict[str, EosPayerResources] = {
+            account.name: EosPayerResources(account) for account in accounts
+        }
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    async def refresh(self, force: bool = False):
+        """Fetches resources of accounts with stale data, all if forced"""
+        # lock is created lazily, so it's bound to the running loop
+        if not self._refresh_lock:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            now = time.time()
+            stale = [
+                payer for payer in self.payers.values()
+                if force or payer.updated_at + self.ttl < now
+            ]
+            responses = await asyncio.gather(*(
+                self.rpc.get_account(payer.account.name) for payer in stale
+            ))
+            for payer, response in zip(stale, responses):
+                payer.update(response)
+
+    async def acquire(
+        self, cpu_us: int = 0, net_bytes: int = 0, ram_bytes: int = 0
+    ) -> EosPayerResources:
+        """
+        Picks paying account for a transaction with given estimated usage and
+        reserves these resources
+        """
+        await self.refresh()
+        candidates = [
+            payer for payer in self.payers.values()
+            if payer.has_headroom(cpu_us, net_bytes, ram_bytes)
+        ]
+        if not candidates:
+            raise exceptions.EosNoPayerAvailableException(
+                f'No account can pay for {cpu_us} us of CPU, {net_bytes} '
+                f'bytes of NET and {ram_bytes} bytes of RAM'
+            )
+        payer = max(
+            candidates, key=lambda x: (x.cpu_available, x.net_available)
+        )
+        payer.consume(cpu_us, net_bytes, ram_bytes)
+        return payer
+
+    def assign(
+        self, transaction: EosTransaction, payer: EosPayerResources
+    ) -> EosTransaction:
+        """
+        Returns copy of transaction with payer's authorization first in the
+        first action
+        """
+        assert transaction.actions, 'Transaction has no actions'
+        level = payer.account.authorization(self.permission)
+        first_action = transaction.actions[0]
+        first_action = replace(first_action, authorization=[
+            level,
+            *(x for x in first_action.authorization if x != level)
+        ])
+        return replace(
+            transaction, actions=[first_action, *transaction.actions[1:]]
+        )
+
+    def report_error(self, payer: EosPayerResources, error: Exception):
+        """Blocks payer if error means that it ran out of resources"""
+        resource = RESOURCE_EXCEPTIONS.get(type(error))
+        if resource:
+            payer.block(resource, self.cooldown)
+
+    async def send(
+        self,
+        transaction: EosTransaction,
+        *,
+        keys: List[EosKey] = [],
+        cpu_us: int = 0,
+        net_bytes: int = 0,
+        ram_bytes: int = 0,
+        context_free_bytes: bytes = bytes(32)
+    ):
+        """
+        Signs transaction with given keys and key of the chosen payer and
+        pushes it, trying another payer on resource errors. Estimated usage
+        is reserved until the actual one is known.
+        """
+        last_error: Optional[Exception] = None
+        for _ in range(len(self.payers)):
+            try:
+                payer = await self.acquire(cpu_us, net_bytes, ram_bytes)
+            except exceptions.EosNoPayerAvailableException:
+                if last_error:
+                    raise last_error
+                raise
+
+            signing_keys = list(keys)
+            if payer.account.key not in signing_keys:
+                signing_keys.append(payer.account.key)
+            try:
+                response = await self.rpc.sign_and_push_transaction(
+                    self.assign(transaction, payer),
+                    keys=signing_keys,
+                    context_free_bytes=context_free_bytes
+                )
+            except tuple(RESOURCE_EXCEPTIONS) as e:
+                self.report_error(payer, e)
+                last_error = e
+                continue
+            except Exception:
+                payer.consume(-cpu_us, -net_bytes, -ram_bytes)
+                raise
+
+            receipt = response.get('processed', {}).get('receipt', {})
+            cpu_used = receipt.get('cpu_usage_us', cpu_us)
+            net_used = receipt.get('net_usage_words', 0) * 8 or net_bytes
+            payer.consume(cpu_used - cpu_us, net_used - net_bytes)
+            return response
+
+        assert last_error
+        raise last_error
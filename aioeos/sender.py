@@ -0,0 +1,221 @@
+import asyncio
+import binascii
+from datetime import datetime, timezone
+import hashlib
+import struct
+import time
+from typing import Dict, List, Optional, Tuple, Type
+
+from aioeos import exceptions
+from aioeos.keys import EosKey
+from aioeos.packed import EosPackedTransaction
+from aioeos.rpc import ERROR_NAME_MAP, EosJsonRpc, get_signing_digest
+from aioeos.tracker import EosTransactionTracker
+from aioeos.types import EosTransaction
+
+
+# errors caused by temporary node or network conditions, resubmitting the
+# same transaction a bit later can succeed
+RETRIABLE_ERROR_NAMES = ('deadline_exception', 'tx_cpu_usage_exceeded')
+RETRIABLE_EXCEPTIONS = tuple(
+    ERROR_NAME_MAP[name] for name in RETRIABLE_ERROR_NAMES
+)
+
+# default max_transaction_lifetime of nodeos, in seconds
+DEFAULT_MAX_TRANSACTION_LIFETIME = 3600
+
+# how often expirations of sent transactions are cleaned up, in seconds
+CLEANUP_INTERVAL = 60
+
+
+class EosSendResult:
+    """
+    Outcome of ``EosTransactionSender.send``.
+
+    :param transaction_id: hex encoded transaction ID,
+    :param response: response from ``push_transaction``, ``None`` if the
+                     transaction was confirmed without a successful push,
+    :param attempts: number of submissions,
+    :param expiration: expiration of the pushed transaction, which may be
+                       later than the one of given transaction
+    """
+
+    def __init__(
+        self,
+        transaction_id: str,
+        response: Optional[dict],
+        attempts: int,
+        expiration: datetime
+    ):
+        self.transaction_id = transaction_id
+        self.response = response
+        self.attempts = attempts
+        self.expiration = expiration
+
+
+class EosTransactionSender:
+    """
+    Pushes transactions making sure that each one has a unique ID and
+    resubmitting them when a transient error occurs.
+
+    Nodes reject a transaction if one with the same ID was already accepted,
+    which happens when identical actions are sent with the same TAPOS
+    fields. Sender remembers the latest expiration used for each payload,
+    that is packed transaction without expiration, and pushes identical
+    payloads with expiration staggered by a second. Given transaction is
+    left unchanged. Expiration is never pushed further than
+    ``max_transaction_lifetime`` from now, as nodes would reject it.
+
+    Transaction which failed with one of ``retriable_exceptions`` is pushed
+    again after a backoff, as long as it hasn't expired. If a tracker is
+    provided, sender waits for the transaction to show up in a block during
+    backoff, so it's never pushed again once its inclusion is confirmed.
+    Duplicate transaction error on resubmission means that one of the
+    previous attempts went through.
+
+    :param rpc: RPC client,
+    :param tracker: optional tracker used to detect inclusion,
+    :param retries: max number of resubmissions,
+    :param backoff: delay in seconds before first resubmission, doubled on
+                    each next one,
+    :param max_backoff: max delay in seconds between resubmissions,
+    :param retriable_exceptions: exceptions which trigger resubmission,
+    :param max_transaction_lifetime: chain's max transaction lifetime in
+                                     seconds
+    """
+
+    def __init__(
+        self,
+        rpc: EosJsonRpc,
+        *,
+        tracker: Optional[EosTransactionTracker] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10,
+        retriable_exceptions: Tuple[Type[Exception], ...] = (
+            RETRIABLE_EXCEPTIONS
+        ),
+        max_transaction_lifetime: int = DEFAULT_MAX_TRANSACTION_LIFETIME
+    ):
+        self.rpc = rpc
+        self.tracker = tracker
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retriable_exceptions = retriable_exceptions
+        self.max_transaction_lifetime = max_transaction_lifetime
+
+        # payload hash -> latest expiration timestamp used for it
+        self._expirations: Dict[bytes, int] = {}
+        self._next_cleanup = 0.0
+
+    def _make_unique(
+        self, transaction: EosTransaction
+    ) -> Tuple[EosPackedTransaction, datetime]:
+        """
+        Packs the transaction with expiration later than the one of every
+        identical transaction sent before. Returns packed transaction and its
+        expiration.
+        """
+        now = time.time()
+        if now >= self._next_cleanup:
+            # transactions which expired can't collide with new ones
+            self._expirations = {
+                payload: expiration
+                for payload, expiration in self._expirations.items()
+                if expiration >= now
+            }
+            self._next_cleanup = now + CLEANUP_INTERVAL
+
+        packed_bytes = EosPackedTransaction.from_transaction(
+            transaction
+        ).packed_bytes
+        # expiration is the leading field, packed as uint32 timestamp
+        payload = hashlib.sha256(packed_bytes[4:]).digest()
+        expiration = struct.unpack('<I', packed_bytes[:4])[0]
+        if payload in self._expirations:
+            expiration = max(expiration, self._expirations[payload] + 1)
+            if expiration > now + self.max_transaction_lifetime:
+                raise exceptions.EosTransactionLifetimeExceededException(
+                    'Too many identical transactions, expiration exceeds '
+                    f'max transaction lifetime of '
+                    f'{self.max_transaction_lifetime} seconds'
+                )
+            packed_bytes = struct.pack('<I', expiration) + packed_bytes[4:]
+
+        self._expirations[payload] = expiration
+        return (
+            EosPackedTransaction(packed_bytes),
+            datetime.fromtimestamp(expiration, timezone.utc)
+        )
+
+    async def _wait_for_inclusion(
+        self, transaction_id: str, expiration: datetime, delay: float
+    ) -> bool:
+        """Waits for given delay, returns True if transaction got included"""
+        if not self.tracker:
+            await asyncio.sleep(delay)
+            return False
+
+        tracked = self.tracker.track(transaction_id, expiration)
+        # asyncio.wait doesn't cancel pending futures on timeout
+        done, _ = await asyncio.wait([tracked.included], timeout=delay)
+        return bool(done) and not tracked.included.exception()
+
+    async def send(
+        self,
+        transaction: EosTransaction,
+        *,
+        keys: List[EosKey] = [],
+        context_free_bytes: bytes = bytes(32)
+    ) -> EosSendResult:
+        """Signs and pushes transaction, resubmitting it if necessary"""
+        await self.rpc.resolve_action_payloads(transaction)
+        chain_id = await self.rpc.get_chain_id()
+        packed_transaction, expiration = self._make_unique(transaction)
+        transaction_id = packed_transaction.id
+        digest = get_signing_digest(
+            chain_id, packed_transaction.packed_bytes, context_free_bytes
+        )
+        signatures = [key.sign(digest) for key in keys]
+        serialized_transaction = packed_transaction.packed_bytes
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.rpc.push_transaction(
+                    signatures=signatures,
+                    serialized_transaction=(
+                        binascii.hexlify(serialized_transaction).decode()
+                    )
+                )
+                return EosSendResult(
+                    transaction_id, response, attempt, expiration
+                )
+            except exceptions.EosTxDuplicateException:
+                if attempt == 1:
+                    raise
+                # one of the previous attempts was accepted after all
+                return EosSendResult(
+                    transaction_id, None, attempt, expiration
+                )
+            except self.retriable_exceptions:
+                if attempt > self.retries:
+                    raise
+
+                delay = min(
+                    self.backoff * 2 ** (attempt - 1), self.max_backoff
+                )
+                if await self._wait_for_inclusion(
+                    transaction_id, expiration, delay
+                ):
+                    return EosSendResult(
+                        transaction_id, None, attempt, expiration
+                    )
+
+                if expiration.timestamp() < time.time():
+                    raise exceptions.EosTransactionExpiredException(
+                        f'Transaction {transaction_id} expired at '
+                        f'{expiration}'
+                    )
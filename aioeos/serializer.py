@@ -2,9 +2,10 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 import inspect
 import struct
-from typing import Any, List, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 from aioeos import types, exceptions
+from aioeos.keys import EosKey, _parse_public_key_cached
 
 
 class BaseSerializer(ABC):
@@ -184,27 +185,122 @@ class AbiStringSerializer(BaseSerializer):
         return length, value.decode()
 
 
+class AbiSymbolSerializer(BasicTypeSerializer):
+    """
+    Serializer for ABI Symbol type, eg. ``4,EOS``. Encoded as 64 bit integer
+    with precision in the lowest byte, followed by up to 7 characters of
+    symbol code.
+    """
+
+    def __init__(self):
+        self.fmt = 'Q'
+
+    def serialize(self, value: str) -> bytes:
+        precision, code = value.split(',')
+        if len(code) > 7 or not code.isalpha() or not code.isupper():
+            raise exceptions.EosSerializerInvalidSymbolException(value)
+        return bytes([int(precision)]) + code.encode().ljust(7, b'\0')
+
+    def deserialize(self, value: bytes) -> Tuple[int, str]:
+        code = value[1:8].rstrip(b'\0').decode()
+        return 8, f'{value[0]},{code}'
+
+
+class AbiAssetSerializer(BasicTypeSerializer):
+    """
+    Serializer for ABI Asset type, eg. ``1.0000 EOS``. Encoded as 64 bit
+    amount followed by the symbol, precision is given by number of decimal
+    places.
+    """
+
+    def __init__(self):
+        self.fmt = 'q8s'
+
+    def serialize(self, value: str) -> bytes:
+        try:
+            amount, code = value.split(' ')
+        except ValueError:
+            raise exceptions.EosSerializerInvalidSymbolException(value)
+        _, _, fraction = amount.partition('.')
+        symbol = AbiSymbolSerializer().serialize(f'{len(fraction)},{code}')
+        return struct.pack(self.fmt, int(amount.replace('.', '')), symbol)
+
+    def deserialize(self, value: bytes) -> Tuple[int, str]:
+        length = struct.calcsize(self.fmt)
+        amount, symbol = struct.unpack_from(self.fmt, value)
+        precision = symbol[0]
+        code = symbol[1:].rstrip(b'\0').decode()
+        sign = '-' if amount < 0 else ''
+        digits = str(abs(amount)).rjust(precision + 1, '0')
+        if precision:
+            digits = f'{digits[:-precision]}.{digits[-precision:]}'
+        return length, f'{sign}{digits} {code}'
+
+
+class AbiPublicKeySerializer(BaseSerializer):
+    """
+    Serializer for ABI PublicKey type. Key type is encoded in the first byte,
+    only K1 keys are supported. Keys are always decoded in legacy EOS
+    format.
+    """
+
+    def serialize(self, value: str) -> bytes:
+        return b'\0' + _parse_public_key_cached(value)
+
+    def deserialize(self, value: bytes) -> Tuple[int, str]:
+        assert value[0] == 0, 'Only K1 keys are supported'
+        return 34, f'EOS{EosKey._check_encode(value[1:34])}'
+
+
 class AbiObjectSerializer(BaseSerializer):
+    """
+    Serializer for ABI objects. Serializers of fields are looked up once, on
+    first use, so nested objects don't resolve their types on every call.
+    """
+
     def __init__(self, abi_class: Type):
         self.abi_class = abi_class
+        self._fields: Optional[List[Tuple[str, BaseSerializer]]] = None
+        self._extensions: Set[str] = set()
+
+    @property
+    def fields(self) -> List[Tuple[str, BaseSerializer]]:
+        """Names of serializable fields together with their serializers"""
+        if self._fields is None:
+            dataclass_fields = self.abi_class.__dataclass_fields__
+            self._extensions = {
+                field
+                for field in self.abi_class._serializable_fields()
+                if dataclass_fields[field].metadata.get('binary_extension')
+            }
+            self._fields = [
+                (field, get_abi_type_serializer(dataclass_fields[field].type))
+                for field in self.abi_class._serializable_fields()
+            ]
+        return self._fields
 
     def serialize(self, value: types.BaseAbiObject) -> bytes:
         assert issubclass(value.__class__, self.abi_class)
-        return b''.join(
-            serialize(
-                getattr(value, field),
-                value.__dataclass_fields__[field].type,
-            )
-            for field in value._serializable_fields()
-        )
+        if value.__class__ is not self.abi_class:
+            return get_abi_type_serializer(value.__class__).serialize(value)
+        serialized = []
+        for field, field_serializer in self.fields:
+            field_value = getattr(value, field)
+            # missing binary extension ends serialized data
+            if field_value is None and field in self._extensions:
+                break
+            serialized.append(field_serializer.serialize(field_value))
+        return b''.join(serialized)
 
     def deserialize(self, value: bytes) -> Tuple[int, types.BaseAbiObject]:
         cursor = 0
         values = {}
-        for field in self.abi_class._serializable_fields():
-            length, values[field] = deserialize(
-                value[cursor:],
-                self.abi_class.__dataclass_fields__[field].type
+        for field, field_serializer in self.fields:
+            # binary extensions may be missing at the end of data
+            if cursor >= len(value) and field in self._extensions:
+                break
+            length, values[field] = field_serializer.deserialize(
+                value[cursor:]
             )
             cursor += length
         return cursor, self.abi_class(**values)
@@ -215,7 +311,7 @@ class AbiActionPayloadSerializer(BaseSerializer):
         assert not isinstance(value, dict), 'Convert data to ABI format first'
         if types.is_abi_object(type(value)):
             # mypy won't recognize that as a type check apparently
-            serializer = AbiObjectSerializer(type(value))
+            serializer = get_abi_type_serializer(type(value))
             value = serializer.serialize(value)  # type: ignore
         assert isinstance(value, bytes)
         return AbiBytesSerializer().serialize(value)
@@ -242,7 +338,11 @@ TYPE_MAPPING = {
     types.AbiActionPayload: AbiActionPayloadSerializer(),  # type: ignore
     types.TimePoint: AbiTimePointSerializer(),
     types.TimePointSec: AbiTimePointSecSerializer(),
-    str: AbiStringSerializer()
+    types.Symbol: AbiSymbolSerializer(),
+    types.Asset: AbiAssetSerializer(),
+    types.PublicKey: AbiPublicKeySerializer(),
+    str: AbiStringSerializer(),
+    bool: BasicTypeSerializer('?')
 }
 
 
@@ -283,16 +383,26 @@ class AbiListSerializer(BaseSerializer):
         return overall_length, values
 
 
+# serializers of lists and ABI objects, created once per type
+_serializers_cache: Dict[Any, BaseSerializer] = {}
+
+
 def get_abi_type_serializer(abi_type: Type) -> BaseSerializer:
     if abi_type in TYPE_MAPPING:
         return TYPE_MAPPING[abi_type]
-    elif getattr(abi_type, '_name', None) == 'List':
-        return AbiListSerializer(abi_type)
-    elif types.is_abi_object(abi_type):
-        return AbiObjectSerializer(abi_type)
+    elif abi_type in _serializers_cache:
+        return _serializers_cache[abi_type]
 
-    # if type is not supported, raise an Exception
-    raise exceptions.EosSerializerUnsupportedTypeException(abi_type)
+    serializer: BaseSerializer
+    if getattr(abi_type, '_name', None) == 'List':
+        serializer = AbiListSerializer(abi_type)
+    elif types.is_abi_object(abi_type):
+        serializer = AbiObjectSerializer(abi_type)
+    else:
+        # if type is not supported, raise an Exception
+        raise exceptions.EosSerializerUnsupportedTypeException(abi_type)
+    _serializers_cache[abi_type] = serializer
+    return serializer
 
 
 def serialize(value: Any, abi_type: Type = None) -> bytes:
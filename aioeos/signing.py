@@ -0,0 +1,183 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from aioeos.keys import EosKey, _parse_public_key_cached
+
+
+# keys loaded in a worker process, indexed by public key
+_worker_keys: Dict[str, EosKey] = {}
+
+# (signature, digest, public key) triple
+VerificationItem = Tuple[str, bytes, str]
+
+
+def _init_worker(private_keys: List[str]):
+    """Loads keys once, when worker process starts"""
+    for private_key in private_keys:
+        key = EosKey(private_key=private_key)
+        _worker_keys[key.to_public()] = key
+
+
+def _sign_batch(items: List[Tuple[str, bytes]]) -> List[str]:
+    return [
+        _worker_keys[public_key].sign(digest) for public_key, digest in items
+    ]
+
+
+def _verify_batch(items: List[VerificationItem]) -> List[bool]:
+    results = []
+    for signature, digest, public_key in items:
+        try:
+            _, sig = EosKey._decode_signature(signature)
+            public_key_bytes = _parse_public_key_cached(public_key)
+            results.append(
+                EosKey.backend.verify(public_key_bytes, sig, digest)
+            )
+        except (TypeError, ValueError):
+            results.append(False)
+    return results
+
+
+class EosSigningPool:
+    """
+    Signs digests in a pool of worker processes. Private keys are sent to
+    each worker once, when it starts, while signing requests carry only
+    public key and the digest. Requests are sent in chunks to reduce
+    inter-process communication overhead.
+
+    :param keys: keys used for signing, private keys are required,
+    :param processes: number of worker processes, defaults to CPU count,
+    :param chunk_size: max number of digests sent to a worker at once
+    """
+
+    def __init__(
+        self,
+        keys: List[EosKey],
+        *,
+        processes: Optional[int] = None,
+        chunk_size: int = 64
+    ):
+        self.chunk_size = chunk_size
+        self._public_keys = {key.to_public() for key in keys}
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=([key.to_wif() for key in keys],)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Shuts down worker processes"""
+        self._executor.shutdown()
+
+    def _chunks(
+        self,
+        digests: Sequence[bytes],
+        keys: Union[EosKey, Sequence[EosKey]]
+    ) -> List[List[Tuple[str, bytes]]]:
+        if isinstance(keys, EosKey):
+            keys = [keys] * len(digests)
+        assert len(keys) == len(digests), 'Provide a key for each digest'
+
+        items = []
+        for key, digest in zip(keys, digests):
+            public_key = key.to_public()
+            assert public_key in self._public_keys, 'Key is not in the pool'
+            items.append((public_key, digest))
+
+        return [
+            items[i:i + self.chunk_size]
+            for i in range(0, len(items), self.chunk_size)
+        ]
+
+    def sign_many(
+        self,
+        digests: Sequence[bytes],
+        keys: Union[EosKey, Sequence[EosKey]]
+    ) -> List[str]:
+        """
+        Signs digests, blocking until all of them are signed. ``keys`` is
+        either a single key used for all digests or a key for each digest.
+        Returns signatures in the same order as digests.
+        """
+        return [
+            signature
+            for chunk in self._executor.map(
+                _sign_batch, self._chunks(digests, keys)
+            )
+            for signature in chunk
+        ]
+
+    async def sign_many_async(
+        self,
+        digests: Sequence[bytes],
+        keys: Union[EosKey, Sequence[EosKey]]
+    ) -> List[str]:
+        """Same as ``sign_many``, but doesn't block the event loop"""
+        loop = asyncio.get_event_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, _sign_batch, chunk)
+            for chunk in self._chunks(digests, keys)
+        ))
+        return [signature for chunk in chunks for signature in chunk]
+
+    async def sign_async(self, digest: bytes, key: EosKey) -> str:
+        """Signs a single digest without blocking the event loop"""
+        signatures = await self.sign_many_async([digest], key)
+        return signatures[0]
+
+
+class EosSignatureVerifier:
+    """
+    Verifies many signatures against given public keys. Work is split into
+    chunks and run in an executor, pass a ``ProcessPoolExecutor`` to make use
+    of multiple cores. Without an executor, ``verify_many`` runs in the
+    current thread and ``verify_many_async`` uses loop's default executor.
+
+    :param executor: executor used for verification,
+    :param chunk_size: max number of signatures verified in a single task
+    """
+
+    def __init__(
+        self, *, executor: Optional[Executor] = None, chunk_size: int = 64
+    ):
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def _chunks(
+        self, items: Sequence[VerificationItem]
+    ) -> List[List[VerificationItem]]:
+        return [
+            list(items[i:i + self.chunk_size])
+            for i in range(0, len(items), self.chunk_size)
+        ]
+
+    def verify_many(self, items: Sequence[VerificationItem]) -> List[bool]:
+        """
+        Verifies (signature, digest, public key) triples, returns results
+        in the same order
+        """
+        if not self.executor:
+            return _verify_batch(list(items))
+        return [
+            result
+            for chunk in self.executor.map(_verify_batch, self._chunks(items))
+            for result in chunk
+        ]
+
+    async def verify_many_async(
+        self, items: Sequence[VerificationItem]
+    ) -> List[bool]:
+        """Same as ``verify_many``, but doesn't block the event loop"""
+        loop = asyncio.get_event_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _verify_batch, chunk)
+            for chunk in self._chunks(items)
+        ))
+        return [result for chunk in chunks for result in chunk]
@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Tuple
+
+from aioeos import serializer, types
+from aioeos.packed import EosPackedTransaction
+from aioeos.serializer import BaseSerializer, BasicTypeSerializer
+
+
+HEADER_FIELDS = ('expiration', 'ref_block_num', 'ref_block_prefix')
+
+
+class EosTransactionTemplate:
+    """
+    Transaction serialized once and reused for producing many transactions
+    which differ only in TAPOS fields and a few action payload fields.
+    Instead of serializing the whole transaction, ``render`` copies the
+    packed template and overwrites bytes at precomputed offsets.
+
+    Payloads of actions used by slots have to be ABI objects. Only
+    fixed-size fields (integers, names, timestamps) can be used as slots, as
+    other ones would change the layout of the transaction.
+
+    :param transaction: transaction used as a template, its current values
+                        are used as defaults,
+    :param slots: dictionary mapping slot name to a tuple of action index
+                  and payload field name
+    """
+
+    def __init__(
+        self,
+        transaction: types.EosTransaction,
+        slots: Dict[str, Tuple[int, str]] = {},
+    ):
+        assert not set(slots) & set(HEADER_FIELDS), 'Reserved slot name'
+        self.transaction = transaction
+        self._packed = serializer.serialize(transaction)
+
+        # slot name -> (offset, serializer, size)
+        self._slots: Dict[str, Tuple[int, BaseSerializer, int]] = {}
+
+        header_offsets = self._field_offsets(transaction, 0)
+        for field in HEADER_FIELDS:
+            self._add_slot(field, transaction, field, header_offsets[field])
+
+        action_offsets = self._action_payload_offsets(
+            header_offsets['actions']
+        )
+        for name, (index, field) in slots.items():
+            payload = transaction.actions[index].data
+            assert isinstance(payload, types.BaseAbiObject), (
+                'Action payload has to be an ABI object'
+            )
+            payload_offsets = self._field_offsets(
+                payload, action_offsets[index]
+            )
+            self._add_slot(name, payload, field, payload_offsets[field])
+
+    def _add_slot(
+        self, name: str, value: types.BaseAbiObject, field: str, offset: int
+    ):
+        field_serializer = dict(self._field_serializers(value))[field]
+        assert isinstance(field_serializer, BasicTypeSerializer), (
+            f'Field {field} has no fixed size'
+        )
+        size = len(field_serializer.serialize(getattr(value, field)))
+        self._slots[name] = (offset, field_serializer, size)
+
+    @staticmethod
+    def _field_serializers(
+        value: types.BaseAbiObject
+    ) -> List[Tuple[str, BaseSerializer]]:
+        """Returns fields of ABI object together with their serializers"""
+        object_serializer = serializer.get_abi_type_serializer(type(value))
+        assert isinstance(object_serializer, serializer.AbiObjectSerializer)
+        return object_serializer.fields
+
+    @classmethod
+    def _field_offsets(
+        cls, value: types.BaseAbiObject, offset: int
+    ) -> Dict[str, int]:
+        """Returns offsets of ABI object fields, starting from ``offset``"""
+        offsets = {}
+        for field, field_serializer in cls._field_serializers(value):
+            offsets[field] = offset
+            offset += len(field_serializer.serialize(getattr(value, field)))
+        return offsets
+
+    def _action_payload_offsets(self, offset: int) -> Dict[int, int]:
+        """Returns offsets of action payloads, without length prefix"""
+        actions = self.transaction.actions
+        offset += len(serializer.VarUIntSerializer().serialize(len(actions)))
+
+        offsets = {}
+        for index, action in enumerate(actions):
+            fields = self._field_offsets(action, offset)
+            data = serializer.serialize(
+                action.data, types.AbiActionPayload  # type: ignore
+            )
+            prefix_length, _ = serializer.VarUIntSerializer().deserialize(
+                data
+            )
+            offsets[index] = fields['data'] + prefix_length
+            offset = fields['data'] + len(data)
+        return offsets
+
+    @property
+    def slots(self):
+        """Names of slots accepted by ``render``"""
+        return tuple(self._slots)
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Returns serialized transaction with given slots replaced. Accepts
+        ``expiration``, ``ref_block_num``, ``ref_block_prefix`` and slots
+        defined in the constructor.
+        """
+        buffer = bytearray(self._packed)
+        for name, value in values.items():
+            offset, field_serializer, size = self._slots[name]
+            buffer[offset:offset + size] = field_serializer.serialize(value)
+        return bytes(buffer)
+
+    def render_packed(self, **values: Any) -> EosPackedTransaction:
+        """Same as ``render``, but returns a packed transaction"""
+        return EosPackedTransaction(self.render(**values))
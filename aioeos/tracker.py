@@ -0,0 +1,226 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from aioeos import exceptions
+from aioeos.models import parse_time
+from aioeos.rpc import EosJsonRpc
+
+
+class EosTrackedTransaction:
+    """
+    Pending transaction registered in ``EosTransactionTracker``.
+
+    ``included`` future resolves with block number once the transaction is
+    found in a block, ``irreversible`` once that block becomes irreversible.
+    Both fail with ``EosTransactionExpiredException`` if the transaction
+    wasn't included before its expiration.
+
+    ``included`` resolves only once, with the first block the transaction
+    was found in, which may still get dropped by a fork. ``block_num`` and
+    ``block_id`` always point to the current block containing the
+    transaction, ``None`` if it's back in pending state.
+    """
+
+    def __init__(self, transaction_id: str, expiration: datetime):
+        loop = asyncio.get_event_loop()
+        self.id = transaction_id
+        self.expiration = expiration
+        self.block_num: Optional[int] = None
+        self.block_id: Optional[str] = None
+        # IDs of all blocks the transaction was found in, by block number
+        self.blocks: Dict[int, str] = {}
+        self.included: asyncio.Future = loop.create_future()
+        self.irreversible: asyncio.Future = loop.create_future()
+
+    def _seen(self, block_num: int, block_id: str):
+        self.blocks[block_num] = block_id
+        self._update_block()
+        if not self.included.done():
+            self.included.set_result(block_num)
+
+    def _update_block(self):
+        if self.blocks:
+            self.block_num = min(self.blocks)
+            self.block_id = self.blocks[self.block_num]
+        else:
+            self.block_num = None
+            self.block_id = None
+
+    def _fail(self, exception: Exception):
+        for future in (self.included, self.irreversible):
+            if not future.done():
+                future.set_exception(exception)
+                # mark exception as retrieved, waiting on both is optional
+                future.exception()
+
+
+class EosTransactionTracker:
+    """
+    Tracks inclusion and irreversibility of pushed transactions. Instead of
+    polling transaction history for each transaction, tracker follows the
+    block stream once and matches block contents against all registered
+    transactions. Stream runs only while there are pending transactions.
+
+    Inclusion is reported as soon as the transaction appears in a block. If
+    that block gets dropped by a fork before becoming irreversible, tracker
+    rescans the chain from the replaced block and the transaction goes back
+    to pending state until it's found again or it expires.
+
+    Failed polls are retried after a backoff. Meanwhile, transactions which
+    weren't included before their expiration fail with the RPC error, as
+    it's not known whether they made it to a block.
+
+    :param rpc: RPC client used for fetching blocks,
+    :param poll_interval: time in seconds between checking for new blocks,
+    :param backoff: delay in seconds before retrying a failed poll, doubled
+                    on each next failure,
+    :param max_backoff: max delay in seconds between retries
+    """
+
+    def __init__(
+        self,
+        rpc: EosJsonRpc,
+        *,
+        poll_interval: float = 0.5,
+        backoff: float = 0.5,
+        max_backoff: float = 10
+    ):
+        self.rpc = rpc
+        self.poll_interval = poll_interval
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._pending: Dict[str, EosTrackedTransaction] = {}
+        self._last_block_num: Optional[int] = None
+        self._task: Optional[asyncio.Future] = None
+
+    def track(
+        self,
+        transaction_id: str,
+        expiration: datetime,
+        *,
+        block_num_hint: Optional[int] = None
+    ) -> EosTrackedTransaction:
+        """
+        Registers transaction for tracking. ``block_num_hint`` is the first
+        block which can contain the transaction, by default tracker starts
+        with the current head block.
+        """
+        tracked = self._pending.get(transaction_id)
+        if tracked:
+            return tracked
+
+        tracked = EosTrackedTransaction(transaction_id, expiration)
+        self._pending[transaction_id] = tracked
+        if block_num_hint and self._last_block_num is not None:
+            self._last_block_num = min(
+                self._last_block_num, block_num_hint - 1
+            )
+        elif block_num_hint:
+            self._last_block_num = block_num_hint - 1
+
+        if not self._task or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return tracked
+
+    async def close(self):
+        """Stops following the block stream"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self):
+        errors = 0
+        try:
+            while self._pending:
+                try:
+                    await self._poll()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    errors += 1
+                    delay = min(
+                        self.backoff * 2 ** (errors - 1), self.max_backoff
+                    )
+                    self._process_expired(datetime.now(timezone.utc), e)
+                else:
+                    errors = 0
+                    delay = self.poll_interval
+                if self._pending:
+                    await asyncio.sleep(delay)
+        finally:
+            self._last_block_num = None
+
+    async def _poll(self):
+        info = await self.rpc.get_info()
+        head_block_num = info['head_block_num']
+        if self._last_block_num is None:
+            self._last_block_num = head_block_num - 1
+
+        for block_num in range(self._last_block_num + 1, head_block_num + 1):
+            block = await self.rpc.get_block(block_num)
+            self._process_block(block)
+            self._last_block_num = block_num
+
+        await self._process_irreversible(info['last_irreversible_block_num'])
+        self._process_expired(parse_time(info['head_block_time']))
+
+    def _process_block(self, block: dict):
+        for receipt in block.get('transactions', []):
+            trx = receipt['trx']
+            # deferred transactions are represented by their id only
+            transaction_id = trx if isinstance(trx, str) else trx['id']
+            tracked = self._pending.get(transaction_id)
+            if tracked:
+                tracked._seen(block['block_num'], block['id'])
+
+    async def _process_irreversible(self, last_irreversible_block_num: int):
+        block_ids: Dict[int, str] = {}
+        for tracked in list(self._pending.values()):
+            for block_num in sorted(tracked.blocks):
+                if block_num > last_irreversible_block_num:
+                    break
+
+                # make sure the block wasn't replaced by a fork in the meantime
+                if block_num not in block_ids:
+                    block = await self.rpc.get_block(block_num)
+                    block_ids[block_num] = block['id']
+
+                if block_ids[block_num] == tracked.blocks[block_num]:
+                    break
+
+                # replacement block may contain the transaction, rescan it
+                del tracked.blocks[block_num]
+                self._rewind(block_num - 1)
+
+            tracked._update_block()
+            if (
+                tracked.block_num is None
+                or tracked.block_num > last_irreversible_block_num
+            ):
+                continue
+
+            del self._pending[tracked.id]
+            tracked.irreversible.set_result(tracked.block_num)
+
+    def _rewind(self, block_num: int):
+        if self._last_block_num is not None:
+            self._last_block_num = min(self._last_block_num, block_num)
+
+    def _process_expired(
+        self, head_block_time: datetime, error: Optional[Exception] = None
+    ):
+        """
+        Fails transactions not included before ``head_block_time``, with
+        ``error`` if given
+        """
+        for tracked in list(self._pending.values()):
+            if tracked.block_num is not None:
+                continue
+            if tracked.expiration.timestamp() >= head_block_time.timestamp():
+                continue
+
+            del self._pending[tracked.id]
+            tracked._fail(error or exceptions.EosTransactionExpiredException(
+                f'Transaction {tracked.id} expired at {tracked.expiration}'
+            ))
@@ -1,7 +1,7 @@
 from .abi import (
     UInt8, UInt16, UInt32, UInt64, Int8, Int16, Int32, Int64, VarUInt, Float32,
-    Float64, TimePointSec, TimePoint, Name, AbiBytes, BaseAbiObject,
-    is_abi_object
+    Float64, TimePointSec, TimePoint, Name, AbiBytes, Symbol, Asset, PublicKey,
+    BaseAbiObject, binary_extension, is_abi_object, add_slots
 )  # noqa
 
 from .authority import (
@@ -18,7 +18,8 @@ __all__ = [
     # base ABI types
     'UInt8', 'UInt16', 'UInt32', 'UInt64', 'Int8', 'Int16', 'Int32', 'Int64',
     'VarUInt', 'Float32', 'Float64', 'TimePointSec', 'TimePoint', 'Name',
-    'AbiBytes', 'BaseAbiObject', 'is_abi_object',
+    'AbiBytes', 'Symbol', 'Asset', 'PublicKey', 'BaseAbiObject',
+    'binary_extension', 'is_abi_object', 'add_slots',
 
     # authority
     'EosPermissionLevel', 'EosKeyWeight', 'EosPermissionLevelWeight',
@@ -1,13 +1,13 @@
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import inspect
-from typing import Any, ClassVar, Dict, NewType, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, NewType, Type, TypeVar, TYPE_CHECKING
 
 
 # EOS ABI types
-# TODO: implement bool, uint128, int128, float128, block_timestamp_type,
-# symbol, symbol_code, asset, checksum160, checksum256, checksum512,
-# public_key, private_key, signature, extended_asset
+# TODO: implement uint128, int128, float128, block_timestamp_type,
+# symbol_code, checksum160, checksum256, checksum512, private_key, signature,
+# extended_asset
 if TYPE_CHECKING:
     UInt8 = int
     UInt16 = int
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
     TimePoint = datetime
     Name = str
     AbiBytes = bytes
+    Symbol = str
+    Asset = str
+    PublicKey = str
 else:
     # Our runtime logic depends on these being new types, but this makes mypy
     # require explicit casting
@@ -42,6 +45,13 @@ else:
     TimePoint = NewType('TimePoint', datetime)
     AbiBytes = NewType('AbiBytes', bytes)
 
+    # symbol in "4,EOS" format, asset in "1.0000 EOS" format
+    Symbol = NewType('Symbol', str)
+    Asset = NewType('Asset', str)
+
+    # public key in any format accepted by EosKey
+    PublicKey = NewType('PublicKey', str)
+
     # this type is weird because it's like int, but it has no fixed size
     VarUInt = NewType('VarUInt', int)
 
@@ -49,13 +59,58 @@ else:
 @dataclass
 class BaseAbiObject:
     __dataclass_fields__: ClassVar[Dict]
+    __slots__ = ()
 
     @classmethod
     def _serializable_fields(cls):
         return (x.name for x in fields(cls))
 
 
+def binary_extension() -> Any:
+    """
+    Declares a trailing field of an ABI class as a binary extension, ``$``
+    suffixed in ABI. Extensions may be missing at the end of serialized data,
+    in which case they're set to ``None``.
+    """
+    return field(default=None, metadata={'binary_extension': True})
+
+
 def is_abi_object(obj: Any) -> bool:
     """Object is an ABI object if it's a subclass of BaseAbiObject"""
     is_class = inspect.isclass(obj)
     return is_class and issubclass(obj, BaseAbiObject)
+
+
+T = TypeVar('T')
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """
+    Recreates a dataclass with ``__slots__`` containing its fields, so
+    instances have no ``__dict__`` and take much less memory. Apply it on top
+    of ``@dataclass``. Instances still work with ``dataclasses.asdict`` and
+    the serializer.
+    """
+    inherited = {
+        name
+        for base in cls.__mro__[1:]
+        for name in getattr(base, '__slots__', ())
+    }
+    field_names = tuple(
+        field.name for field in fields(cls)  # type: ignore
+        if field.name not in inherited
+    )
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    # default values are kept by __init__, class attributes would conflict
+    # with slot descriptors
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    metaclass: Any = type(cls)
+    slotted_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
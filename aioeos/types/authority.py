@@ -1,33 +1,38 @@
 from dataclasses import dataclass, field
 from typing import List
 
-from .abi import AbiBytes, BaseAbiObject, UInt16, UInt32, Name
+from .abi import BaseAbiObject, PublicKey, UInt16, UInt32, Name, add_slots
 
 
+@add_slots
 @dataclass
 class EosPermissionLevel(BaseAbiObject):
     actor: Name
     permission: Name
 
 
+@add_slots
 @dataclass
 class EosKeyWeight(BaseAbiObject):
-    key: AbiBytes
+    key: PublicKey
     weight: UInt16
 
 
+@add_slots
 @dataclass
 class EosPermissionLevelWeight(BaseAbiObject):
     permission: EosPermissionLevel
     weight: UInt16
 
 
+@add_slots
 @dataclass
 class EosWaitWeight(BaseAbiObject):
     wait_sec: UInt32
     weight: UInt16
 
 
+@add_slots
 @dataclass
 class EosAuthority(BaseAbiObject):
     threshold: UInt32 = 1
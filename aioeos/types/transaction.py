@@ -3,7 +3,8 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Union
 
 from .abi import (
-    AbiBytes, BaseAbiObject, UInt8, UInt16, UInt32, VarUInt, Name, TimePointSec
+    AbiBytes, BaseAbiObject, UInt8, UInt16, UInt32, VarUInt, Name,
+    TimePointSec, add_slots
 )
 from .authority import EosPermissionLevel
 
@@ -11,6 +12,7 @@ from .authority import EosPermissionLevel
 AbiActionPayload = Union[Dict[str, Any], AbiBytes, BaseAbiObject]
 
 
+@add_slots
 @dataclass
 class EosAction(BaseAbiObject):
     account: Name
@@ -19,12 +21,14 @@ class EosAction(BaseAbiObject):
     data: AbiActionPayload
 
 
+@add_slots
 @dataclass
 class EosExtension(BaseAbiObject):
     extension_type: UInt16
     data: AbiBytes
 
 
+@add_slots
 @dataclass
 class EosTransaction(BaseAbiObject):
     # TAPOS fields
@@ -0,0 +1,219 @@
+"""
+Lazily decoded views over packed transactions and actions. Offsets of
+fields are computed in a single pass over the buffer, but values are decoded
+only when accessed, which makes scanning blocks for specific actions cheap.
+"""
+import binascii
+from functools import lru_cache
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from aioeos import serializer, types
+from aioeos.types.transaction import EosExtension
+
+
+_NAME = serializer.AbiNameSerializer()
+_VARUINT = serializer.VarUIntSerializer()
+_PERMISSION_LEVEL_SIZE = 16
+
+# names used for filtering are packed once
+_pack_name = lru_cache(maxsize=1024)(_NAME.serialize)
+
+# (account, action name) -> ABI class of action payload
+PayloadTypes = Dict[Tuple[str, str], Type]
+
+
+def _read_varuint(buffer: bytes, offset: int) -> Tuple[int, int]:
+    """Returns offset after VarUInt and its value"""
+    length, value = _VARUINT.deserialize(buffer[offset:offset + 10])
+    return offset + length, value
+
+
+class EosActionView:
+    """
+    Packed action which decodes its fields on access.
+
+    :param buffer: buffer containing the action,
+    :param offset: offset of the action in the buffer,
+    :param payload_types: ABI classes used for decoding payloads
+    """
+    __slots__ = (
+        '_buffer', '_offset', '_data_offset', '_end', '_payload_types'
+    )
+
+    def __init__(
+        self,
+        buffer: bytes,
+        offset: int = 0,
+        payload_types: Optional[PayloadTypes] = None
+    ):
+        self._buffer = buffer
+        self._offset = offset
+        self._payload_types = payload_types
+
+        # skip account and name, then authorization list
+        offset, count = _read_varuint(buffer, offset + 16)
+        offset += count * _PERMISSION_LEVEL_SIZE
+        offset, data_length = _read_varuint(buffer, offset)
+        self._data_offset = offset
+        self._end = offset + data_length
+
+    @property
+    def size(self) -> int:
+        """Size of packed action in bytes"""
+        return self._end - self._offset
+
+    @property
+    def account(self) -> str:
+        return _NAME.deserialize(
+            self._buffer[self._offset:self._offset + 8]
+        )[1]
+
+    @property
+    def name(self) -> str:
+        return _NAME.deserialize(
+            self._buffer[self._offset + 8:self._offset + 16]
+        )[1]
+
+    def matches(self, account: str, name: str = '') -> bool:
+        """
+        Checks account and optionally action name, comparing packed names
+        without decoding them
+        """
+        if self._buffer[self._offset:self._offset + 8] != _pack_name(account):
+            return False
+        return not name or self._buffer[
+            self._offset + 8:self._offset + 16
+        ] == _pack_name(name)
+
+    @property
+    def authorization(self) -> List[types.EosPermissionLevel]:
+        return serializer.deserialize(
+            self._buffer[self._offset + 16:self._data_offset],
+            List[types.EosPermissionLevel]
+        )[1]
+
+    @property
+    def data(self) -> bytes:
+        """Raw action payload"""
+        return self._buffer[self._data_offset:self._end]
+
+    def decode_data(self, abi_class: Optional[Type] = None) -> Any:
+        """
+        Decodes payload as given ABI class, or one registered in payload
+        types for this action. Returns raw payload if class is unknown.
+        """
+        if not abi_class and self._payload_types:
+            abi_class = self._payload_types.get((self.account, self.name))
+        if not abi_class:
+            return self.data
+        return serializer.deserialize(self.data, abi_class)[1]
+
+    def to_action(self) -> types.EosAction:
+        """Decodes the whole action"""
+        return types.EosAction(
+            account=self.account,
+            name=self.name,
+            authorization=self.authorization,
+            data=self.decode_data()
+        )
+
+
+class EosTransactionView:
+    """
+    Packed transaction which decodes its fields on access. Actions are
+    available as ``EosActionView`` objects.
+
+    :param buffer: serialized transaction,
+    :param payload_types: ABI classes used for decoding action payloads
+    """
+    __slots__ = (
+        '_buffer', '_header_offsets', 'context_free_actions', 'actions',
+        '_extensions_offset'
+    )
+
+    def __init__(
+        self, buffer: bytes, payload_types: Optional[PayloadTypes] = None
+    ):
+        self._buffer = buffer
+
+        # expiration, ref_block_num and ref_block_prefix have fixed size
+        offset = 10
+        offset, _ = _read_varuint(buffer, offset)
+        delay_sec_offset = offset + 1
+        offset, _ = _read_varuint(buffer, delay_sec_offset)
+        self._header_offsets = (10, delay_sec_offset)
+
+        self.context_free_actions: List[EosActionView] = []
+        self.actions: List[EosActionView] = []
+        for actions in (self.context_free_actions, self.actions):
+            offset, count = _read_varuint(buffer, offset)
+            for _ in range(count):
+                action = EosActionView(buffer, offset, payload_types)
+                actions.append(action)
+                offset += action.size
+        self._extensions_offset = offset
+
+    @classmethod
+    def from_hex(
+        cls, packed_trx: str, payload_types: Optional[PayloadTypes] = None
+    ) -> 'EosTransactionView':
+        """Creates view from hex encoded transaction, eg. from a block"""
+        return cls(binascii.unhexlify(packed_trx), payload_types)
+
+    @property
+    def id(self) -> str:
+        return hashlib.sha256(self._buffer).hexdigest()
+
+    @property
+    def expiration(self):
+        return serializer.deserialize(
+            self._buffer[0:4], types.TimePointSec
+        )[1]
+
+    @property
+    def ref_block_num(self) -> int:
+        return serializer.deserialize(self._buffer[4:6], types.UInt16)[1]
+
+    @property
+    def ref_block_prefix(self) -> int:
+        return serializer.deserialize(self._buffer[6:10], types.UInt32)[1]
+
+    @property
+    def max_net_usage_words(self) -> int:
+        return _read_varuint(self._buffer, self._header_offsets[0])[1]
+
+    @property
+    def max_cpu_usage_ms(self) -> int:
+        return self._buffer[self._header_offsets[1] - 1]
+
+    @property
+    def delay_sec(self) -> int:
+        return _read_varuint(self._buffer, self._header_offsets[1])[1]
+
+    def find_actions(
+        self, account: str, name: str = ''
+    ) -> List[EosActionView]:
+        """Returns actions of given contract, optionally with given name"""
+        return [
+            action for action in self.actions if action.matches(account, name)
+        ]
+
+    def to_transaction(self) -> types.EosTransaction:
+        """Decodes the whole transaction"""
+        return types.EosTransaction(
+            expiration=self.expiration,
+            ref_block_num=self.ref_block_num,
+            ref_block_prefix=self.ref_block_prefix,
+            max_net_usage_words=self.max_net_usage_words,
+            max_cpu_usage_ms=self.max_cpu_usage_ms,
+            delay_sec=self.delay_sec,
+            context_free_actions=[
+                action.to_action() for action in self.context_free_actions
+            ],
+            actions=[action.to_action() for action in self.actions],
+            transaction_extensions=serializer.deserialize(
+                self._buffer[self._extensions_offset:],
+                List[EosExtension]
+            )[1]
+        )
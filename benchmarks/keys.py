@@ -0,0 +1,63 @@
+"""
+Measures signing and verification throughput of EosKey, for each available
+crypto backend, with and without precomputation (``hot=True``).
+
+Usage::
+
+    $ python benchmarks/keys.py [iterations]
+"""
+import hashlib
+import sys
+import time
+
+from aioeos import crypto, EosKey
+
+
+PRIVATE_KEY = '5JeaxignXEg3mGwvgmwxG6w6wHcRp9ooPw81KjrP2ah6TWSECDN'
+
+
+def measure(function, items):
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def benchmark(backend_name, hot, iterations):
+    # make sure tables computed by previous runs aren't reused
+    EosKey.backend = crypto.get_backend(backend_name)
+    key = EosKey(private_key=PRIVATE_KEY, hot=hot)
+    verifying_key = EosKey(public_key=key.to_public(), hot=hot)
+
+    digests = [
+        hashlib.sha256(str(i).encode()).digest() for i in range(iterations)
+    ]
+    signatures = dict(zip(digests, map(key.sign, digests)))
+
+    signing = measure(key.sign, digests)
+    verification = measure(
+        lambda digest: verifying_key.verify(signatures[digest], digest),
+        digests
+    )
+    mode = 'hot' if hot else 'default'
+    print(
+        f'{backend_name:>10} {mode:>8}: {signing:10.1f} signatures/s, '
+        f'{verification:10.1f} verifications/s'
+    )
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for backend_name in crypto.BACKENDS:
+        try:
+            crypto.get_backend(backend_name)
+        except ImportError:
+            print(f'{backend_name:>10}: not available')
+            continue
+
+        for hot in (False, True):
+            benchmark(backend_name, hot, iterations)
+
+
+if __name__ == '__main__':
+    main()
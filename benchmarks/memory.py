@@ -0,0 +1,92 @@
+"""
+Measures memory used by decoded ABI objects, for a workload resembling a
+number of full blocks, and compares slotted types with regular dataclasses.
+
+Usage::
+
+    $ python benchmarks/memory.py [actions]
+"""
+from dataclasses import field, fields, make_dataclass
+import sys
+import tracemalloc
+from typing import List
+
+from aioeos import types
+
+
+def without_slots(cls, namespace):
+    """Returns regular dataclass with the same fields"""
+    return make_dataclass(
+        cls.__name__,
+        [
+            (f.name, namespace.get(f.name, f.type), field(default=None))
+            for f in fields(cls)
+        ],
+        bases=(types.BaseAbiObject,)
+    )
+
+
+def make_types(slotted):
+    if slotted:
+        return types.EosPermissionLevel, types.EosAction, types.EosTransaction
+
+    permission_level = without_slots(types.EosPermissionLevel, {})
+    action = without_slots(
+        types.EosAction, {'authorization': List[permission_level]}
+    )
+    transaction = without_slots(
+        types.EosTransaction, {'actions': List[action]}
+    )
+    return permission_level, action, transaction
+
+
+def build(count, slotted):
+    """Builds transactions with 10 actions each, like in a busy block"""
+    permission_level, action, transaction = make_types(slotted)
+    return [
+        transaction(
+            expiration=None,
+            ref_block_num=i & 0xffff,
+            ref_block_prefix=i,
+            max_net_usage_words=0,
+            max_cpu_usage_ms=0,
+            delay_sec=0,
+            context_free_actions=[],
+            actions=[
+                action(
+                    account='eosio.token',
+                    name='transfer',
+                    authorization=[
+                        permission_level(actor='eosio', permission='active')
+                    ],
+                    data=b'\x00' * 32
+                )
+                for _ in range(10)
+            ],
+            transaction_extensions=[]
+        )
+        for i in range(count // 10)
+    ]
+
+
+def measure(count, slotted):
+    tracemalloc.start()
+    transactions = build(count, slotted)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del transactions
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, slotted in (('dataclass', False), ('slotted', True)):
+        size = measure(count, slotted)
+        print(
+            f'{name:>10}: {size / 2 ** 20:8.1f} MiB, '
+            f'{size / count:6.0f} bytes per action'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+import pytest
+
+from aioeos import (
+    EosAuthority, EosKey, EosPermissionLevel, EosPermissionLevelWeight,
+    EosWaitWeight
+)
+from aioeos.authorization import EosAuthorityEvaluator, EosPermissionCache
+
+
+@pytest.fixture
+def keys():
+    return [EosKey() for _ in range(3)]
+
+
+@pytest.fixture
+def cache(keys):
+    cache = EosPermissionCache()
+    cache.put('aioeos.test1', 'active', EosAuthority(
+        threshold=1, keys=[keys[0].to_key_weight(1)]
+    ))
+    return cache
+
+
+def account_weight(actor, weight):
+    return EosPermissionLevelWeight(
+        permission=EosPermissionLevel(actor=actor, permission='active'),
+        weight=weight
+    )
+
+
+async def test_permission_cache(rpc, mocker, keys):
+    async def get_account(account_name):
+        return {
+            'account_name': account_name,
+            'permissions': [
+                {
+                    'perm_name': 'active',
+                    'parent': 'owner',
+                    'required_auth': {
+                        'threshold': 1,
+                        'keys': [{'key': keys[0].to_public(), 'weight': 1}],
+                        'accounts': [{
+                            'permission': {
+                                'actor': 'aioeos.test2',
+                                'permission': 'active'
+                            },
+                            'weight': 1
+                        }],
+                        'waits': [{'wait_sec': 10, 'weight': 1}]
+                    }
+                }
+            ]
+        }
+
+    get_account_mock = mocker.patch.object(
+        rpc, 'get_account', side_effect=get_account
+    )
+    cache = EosPermissionCache(rpc)
+    authority = await cache.get('aioeos.test1', 'active')
+    assert authority.keys[0].key == keys[0].to_public()
+    assert authority.accounts[0].permission.actor == 'aioeos.test2'
+    assert authority.waits[0].wait_sec == 10
+    assert await cache.get('aioeos.test1', 'owner') is None
+
+    await cache.get('aioeos.test1', 'active')
+    assert get_account_mock.call_count == 2
+
+    cache.invalidate('aioeos.test1')
+    assert cache.get_cached('aioeos.test1', 'active') is None
+
+
+def test_evaluate_minimal_keys(cache, keys):
+    evaluator = EosAuthorityEvaluator(cache)
+    authority = EosAuthority(
+        threshold=4,
+        keys=[keys[0].to_key_weight(2), keys[1].to_key_weight(2)],
+        accounts=[account_weight('aioeos.test1', 2)]
+    )
+    public_keys = [key.to_public() for key in keys]
+
+    # key 0 satisfies both key weight and account permission
+    assert evaluator.evaluate(authority, public_keys) == {public_keys[0]}
+    assert evaluator.evaluate(authority, public_keys[1:]) is None
+
+    permission = EosPermissionLevel(actor='aioeos.test1', permission='active')
+    assert evaluator.evaluate(permission, public_keys) == {public_keys[0]}
+    assert evaluator.evaluate(permission, public_keys[1:]) is None
+
+
+def test_evaluate_waits(cache, keys):
+    evaluator = EosAuthorityEvaluator(cache)
+    authority = EosAuthority(
+        threshold=2,
+        keys=[keys[1].to_key_weight(1)],
+        waits=[EosWaitWeight(wait_sec=3600, weight=1)]
+    )
+    public_key = keys[1].to_public()
+
+    assert evaluator.evaluate(authority, [public_key]) is None
+    assert evaluator.evaluate(
+        authority, [public_key], delay_sec=3600
+    ) == {public_key}
+
+
+def test_evaluate_depth(cache, keys):
+    cache.put('aioeos.test2', 'active', EosAuthority(
+        threshold=1, accounts=[account_weight('aioeos.test1', 1)]
+    ))
+    authority = EosAuthority(
+        threshold=1, accounts=[account_weight('aioeos.test2', 1)]
+    )
+    public_keys = [keys[0].to_public()]
+
+    evaluator = EosAuthorityEvaluator(cache)
+    assert evaluator.evaluate(authority, public_keys) == set(public_keys)
+    evaluator = EosAuthorityEvaluator(cache, max_depth=1)
+    assert evaluator.evaluate(authority, public_keys) is None
+
+
+async def test_satisfy_fetches_permissions(rpc, mocker, keys):
+    async def get_account(account_name):
+        return {
+            'account_name': account_name,
+            'permissions': [{
+                'perm_name': 'active',
+                'parent': 'owner',
+                'required_auth': {
+                    'threshold': 1,
+                    'keys': [{'key': keys[2].to_public(), 'weight': 1}],
+                    'accounts': [],
+                    'waits': []
+                }
+            }]
+        }
+
+    mocker.patch.object(rpc, 'get_account', side_effect=get_account)
+    evaluator = EosAuthorityEvaluator(EosPermissionCache(rpc))
+    authority = EosAuthority(
+        threshold=1, accounts=[account_weight('aioeos.test3', 1)]
+    )
+    assert await evaluator.is_satisfied(authority, [keys[2].to_public()])
+    assert not await evaluator.is_satisfied(authority, [keys[0].to_public()])
@@ -0,0 +1,104 @@
+from aioeos import EosTransaction, exceptions, serializer
+from aioeos.batching import EosActionBatcher
+from aioeos.contracts import eosio_token
+from aioeos.packed import estimate_net_usage_words
+
+
+def make_transfers(count, memo=''):
+    return [
+        eosio_token.transfer('eosio', 'eosio.token', f'{i}.0000 EOS', memo)
+        for i in range(count)
+    ]
+
+
+def test_max_actions():
+    batcher = EosActionBatcher(max_actions=4)
+    transactions = list(batcher.plan(make_transfers(10)))
+    assert [len(x.actions) for x in transactions] == [4, 4, 2]
+    assert [
+        action.data.quantity for x in transactions for action in x.actions
+    ] == [f'{i}.0000 EOS' for i in range(10)]
+
+
+def test_max_size():
+    actions = make_transfers(20, 'x' * 50)
+    batcher = EosActionBatcher(max_size=500)
+    transactions = list(batcher.plan(actions))
+    assert len(transactions) > 1
+    for transaction in transactions:
+        size = len(serializer.serialize(transaction))
+        assert batcher.packed_size(transaction.actions) == size
+        assert size <= 500
+    # no room left for the first action of the next batch
+    for transaction, next_transaction in zip(transactions, transactions[1:]):
+        assert batcher.packed_size(
+            transaction.actions + next_transaction.actions[:1]
+        ) > 500
+
+
+def test_max_cpu_and_template():
+    template = EosTransaction(ref_block_num=1, ref_block_prefix=2)
+    batcher = EosActionBatcher(
+        max_cpu_us=1000,
+        cpu_estimator=lambda action: 400,
+        template=template
+    )
+    transactions = list(batcher.plan(make_transfers(5)))
+    assert [len(x.actions) for x in transactions] == [2, 2, 1]
+    assert transactions[0].ref_block_prefix == 2
+    assert template.actions == []
+
+    # action over the limit still gets its own transaction
+    batcher = EosActionBatcher(max_size=10)
+    assert len(list(batcher.plan(make_transfers(2)))) == 2
+
+
+def test_max_net_usage_words():
+    actions = make_transfers(20)
+    batcher = EosActionBatcher(max_net_usage_words=40)
+    transactions = list(batcher.plan(actions))
+    assert len(transactions) > 1
+    for transaction in transactions:
+        assert batcher.net_usage_words(transaction.actions) == (
+            estimate_net_usage_words(transaction)
+        )
+        assert batcher.net_usage_words(transaction.actions) <= 40
+
+
+async def test_send_isolates_failures():
+    sent = []
+
+    async def send(transaction):
+        sent.append(len(transaction.actions))
+        for action in transaction.actions:
+            if action.data.quantity == '5.0000 EOS':
+                raise exceptions.EosAssertMessageException('overdrawn')
+        return {'transaction_id': len(sent)}
+
+    batcher = EosActionBatcher(max_actions=8)
+    results = await batcher.send(make_transfers(10), send)
+    assert [len(x.actions) for x in results] == [4, 1, 1, 2, 2]
+    assert [x.succeeded for x in results] == [True, True, False, True, True]
+    assert results[2].actions[0].data.quantity == '5.0000 EOS'
+    assert isinstance(
+        results[2].error, exceptions.EosAssertMessageException
+    )
+    assert sent == [8, 4, 4, 2, 1, 1, 2, 2]
+
+
+async def test_send_returns_other_errors():
+    sent = []
+
+    async def send(transaction):
+        sent.append(len(transaction.actions))
+        if transaction.actions[0].data.quantity == '0.0000 EOS':
+            raise exceptions.EosDeadlineException()
+        return {'transaction_id': len(sent)}
+
+    batcher = EosActionBatcher(max_actions=2)
+    results = await batcher.send(make_transfers(5), send, concurrency=2)
+    assert [len(x.actions) for x in results] == [2, 2, 1]
+    assert [x.succeeded for x in results] == [False, True, True]
+    assert isinstance(results[0].error, exceptions.EosDeadlineException)
+    # batch isn't split on errors other than isolated ones
+    assert sorted(sent) == [1, 2, 2]
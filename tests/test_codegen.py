@@ -0,0 +1,229 @@
+from dataclasses import fields
+from typing import List
+
+import pytest
+
+from aioeos import codegen, exceptions, serializer, types
+from aioeos.contracts import eosio_token
+
+
+TOKEN_ABI = {
+    'version': 'eosio::abi/1.1',
+    'types': [],
+    'structs': [
+        {
+            'name': 'account',
+            'base': '',
+            'fields': [{'name': 'balance', 'type': 'asset'}]
+        },
+        {
+            'name': 'transfer',
+            'base': '',
+            'fields': [
+                {'name': 'from', 'type': 'name'},
+                {'name': 'to', 'type': 'name'},
+                {'name': 'quantity', 'type': 'asset'},
+                {'name': 'memo', 'type': 'string'}
+            ]
+        }
+    ],
+    'actions': [
+        {'name': 'transfer', 'type': 'transfer', 'ricardian_contract': ''}
+    ],
+    'tables': [
+        {
+            'name': 'accounts',
+            'type': 'account',
+            'index_type': 'i64',
+            'key_names': [],
+            'key_types': []
+        }
+    ]
+}
+
+CONTRACT_ABI = {
+    'version': 'eosio::abi/1.1',
+    'types': [{'new_type_name': 'account_name', 'type': 'name'}],
+    'structs': [
+        {
+            'name': 'permission_level',
+            'base': '',
+            'fields': [
+                {'name': 'actor', 'type': 'name'},
+                {'name': 'permission', 'type': 'name'}
+            ]
+        },
+        {
+            'name': 'base_entry',
+            'base': '',
+            'fields': [{'name': 'owner', 'type': 'account_name'}]
+        },
+        {
+            'name': 'entry',
+            'base': 'base_entry',
+            'fields': [
+                {'name': 'levels', 'type': 'permission_level[]'},
+                {'name': 'memo', 'type': 'string$'}
+            ]
+        },
+        {
+            'name': 'commit',
+            'base': '',
+            'fields': [{'name': 'hash', 'type': 'checksum256'}]
+        }
+    ],
+    'actions': [
+        {'name': 'add.entry', 'type': 'entry', 'ricardian_contract': ''},
+        {'name': 'commit', 'type': 'commit', 'ricardian_contract': ''}
+    ],
+    'tables': []
+}
+
+
+def test_generated_module():
+    source = codegen.EosAbi(TOKEN_ABI, 'eosio.token').render()
+    module = {}
+    exec(compile(source, 'eosio_token.py', 'exec'), module)
+
+    action = module['transfer']('eosio', 'eosio.token', '1.0000 EOS', '')
+    expected = eosio_token.transfer('eosio', 'eosio.token', '1.0000 EOS')
+    assert (action.account, action.name) == ('eosio.token', 'transfer')
+    assert serializer.serialize(action.data) == (
+        serializer.serialize(expected.data)
+    )
+    assert module['PAYLOAD_TYPES'] == {
+        ('eosio.token', 'transfer'): module['Transfer']
+    }
+    assert module['TABLE_TYPES'] == {'accounts': module['Account']}
+
+
+def test_runtime_classes():
+    abi = codegen.EosAbi({'account_name': 'contract', 'abi': CONTRACT_ABI})
+    assert abi.account == 'contract'
+
+    entry = abi.get_class('entry')
+    assert entry.__name__ == 'Entry'
+    assert issubclass(entry, abi.get_class('base_entry'))
+    assert [(field.name, field.type) for field in fields(entry)] == [
+        ('owner', types.Name),
+        ('levels', List[types.EosPermissionLevel]),
+        ('memo', str)
+    ]
+
+    # checksum256 has no serializer
+    assert set(abi.classes) == {'permission_level', 'base_entry', 'entry'}
+    assert abi.classes['permission_level'] is types.EosPermissionLevel
+    assert abi.unsupported == {'commit': 'unsupported type checksum256'}
+    with pytest.raises(exceptions.EosSerializerUnsupportedTypeException):
+        abi.get_class('commit')
+    assert abi.payload_types() == {('contract', 'add.entry'): entry}
+
+    action = abi.action('add.entry', owner='eosio', levels=[], memo='a')
+    assert action.data == entry(owner='eosio', levels=[], memo='a')
+    _, decoded = serializer.deserialize(
+        serializer.serialize(action.data), entry
+    )
+    assert decoded == action.data
+
+    source = abi.render()
+    assert '# skipped commit: unsupported type checksum256' in source
+    assert 'class Entry(BaseEntry):' in source
+    assert '    memo: str = binary_extension()' in source
+    assert (
+        'def add_entry(owner, levels, memo=None, authorization=[])' in source
+    )
+
+
+def test_binary_extension():
+    abi = codegen.EosAbi({'account_name': 'contract', 'abi': CONTRACT_ABI})
+    entry = abi.get_class('entry')
+    old_row = entry(owner='eosio', levels=[])
+    assert old_row.memo is None
+
+    # rows serialized before the extension was added don't contain it
+    serialized = serializer.serialize(old_row)
+    assert serialized == serializer.serialize(
+        abi.get_class('base_entry')(owner='eosio')
+    ) + b'\x00'
+    assert serializer.deserialize(serialized, entry) == (
+        len(serialized), old_row
+    )
+
+    new_row = entry(owner='eosio', levels=[], memo='a')
+    serialized = serializer.serialize(new_row)
+    assert serializer.deserialize(serialized, entry)[1] == new_row
+
+    # generated module declares the extension too
+    module: dict = {}
+    exec(abi.render(), module)
+    assert serializer.deserialize(serialized[:-2], module['Entry']) == (
+        len(serialized) - 2, module['Entry'](owner='eosio', levels=[])
+    )
+    assert module['add_entry']('eosio', []).data.memo is None
+
+
+def test_binary_extension_in_base():
+    abi = codegen.EosAbi({
+        'structs': [
+            {
+                'name': 'base',
+                'base': '',
+                'fields': [{'name': 'memo', 'type': 'string$'}]
+            },
+            {
+                'name': 'derived',
+                'base': 'base',
+                'fields': [{'name': 'amount', 'type': 'asset'}]
+            }
+        ],
+        'actions': [{'name': 'add', 'type': 'derived'}]
+    }, 'contract')
+
+    # extension has to be the last field, derived struct is skipped
+    assert set(abi.classes) == {'base'}
+    assert 'derived' in abi.unsupported
+    source = abi.render()
+    assert '# skipped derived: ' in source
+    assert 'def add(' not in source
+
+
+def test_binary_abi():
+    abi_def = codegen.AbiDef(
+        version='eosio::abi/1.1',
+        types=[],
+        structs=[
+            codegen.AbiStructDef(
+                name=struct['name'],
+                base=struct['base'],
+                fields=[
+                    codegen.AbiFieldDef(**field) for field in struct['fields']
+                ]
+            )
+            for struct in TOKEN_ABI['structs']
+        ],
+        actions=[codegen.AbiActionDef(**TOKEN_ABI['actions'][0])],
+        tables=[codegen.AbiTableDef(**TOKEN_ABI['tables'][0])]
+    )
+    # ricardian clauses, error messages, extensions and variants are skipped
+    binary_abi = serializer.serialize(abi_def) + b'\x00\x00\x00\x00'
+    assert codegen.load_abi(binary_abi) == TOKEN_ABI
+    assert codegen.EosAbi(binary_abi, 'eosio.token').render() == (
+        codegen.EosAbi(TOKEN_ABI, 'eosio.token').render()
+    )
+
+
+def test_main(tmp_path, mocker):
+    abi_path = tmp_path / 'eosio.token.abi'
+    abi_path.write_text(str(TOKEN_ABI).replace("'", '"'))
+    output_path = tmp_path / 'eosio_token.py'
+    codegen.main([str(abi_path), '-o', str(output_path)])
+    assert output_path.read_text() == (
+        codegen.EosAbi(TOKEN_ABI, 'eosio.token').render()
+    )
+
+    async def fetch_abi(url, account):
+        return {'account_name': account, 'abi': TOKEN_ABI}
+
+    mocker.patch.object(codegen, 'fetch_abi', side_effect=fetch_abi)
+    codegen.main(['mytoken', '-o', str(output_path)])
+    assert "('mytoken', 'transfer'): Transfer" in output_path.read_text()
@@ -1,77 +1,95 @@
-from aioeos import EosAction
+from aioeos import EosAction, EosPermissionLevel, EosTransaction, serializer
+from aioeos.contracts import eosio, eosio_msig, eosio_token
+from aioeos.rpc import mixed_to_dict
 from aioeos.types import EosAuthority
-from aioeos.contracts import eosio, eosio_token
 
 
 def test_eosio_token_transfer():
-    assert (
-        eosio_token.transfer(
-            'myaddress', 'otheraddress', '1.0000 EOS'
-        ) == EosAction(
-            account='eosio.token',
-            name='transfer',
-            authorization=[],
-            data={
-                'from': 'myaddress',
-                'to': 'otheraddress',
-                'quantity': '1.0000 EOS',
-                'memo': ''
-            }
+    action = eosio_token.transfer('myaddress', 'otheraddress', '1.0000 EOS')
+    assert action == EosAction(
+        account='eosio.token',
+        name='transfer',
+        authorization=[],
+        data=eosio_token.Transfer(
+            from_='myaddress',
+            to='otheraddress',
+            quantity='1.0000 EOS',
+            memo=''
         )
     )
+    assert mixed_to_dict(action.data) == {
+        'from': 'myaddress',
+        'to': 'otheraddress',
+        'quantity': '1.0000 EOS',
+        'memo': ''
+    }
+    assert serializer.serialize(
+        eosio_token.transfer('eosio', 'eosio.token', '1.0000 EOS').data
+    ).hex() == (
+        '0000000000ea3055' '00a6823403ea3055'
+        '102700000000000004454f5300000000' '00'
+    )
 
 
 def test_eosio_token_close():
     assert (
         eosio_token.close(
-            'myaddress', 'EOS'
+            'myaddress', '4,EOS'
         ) == EosAction(
             account='eosio.token',
             name='close',
             authorization=[],
-            data={
-                'owner': 'myaddress',
-                'symbol': 'EOS'
-            }
+            data=eosio_token.Close(owner='myaddress', symbol='4,EOS')
         )
     )
 
 
+def test_eosio_token_actions():
+    assert eosio_token.create('eosio', '100.0000 EOS').data == (
+        eosio_token.Create(issuer='eosio', maximum_supply='100.0000 EOS')
+    )
+    assert eosio_token.issue('eosio', '1.0000 EOS').name == 'issue'
+    assert eosio_token.retire('1.0000 EOS', 'memo').data.memo == 'memo'
+    assert serializer.serialize(
+        eosio_token.open('myaddress', '4,EOS', 'myaddress').data
+    )[8:16] == b'\x04EOS\x00\x00\x00\x00'
+
+
 def test_eosio_newaccount(main_account):
     authority = EosAuthority(
         threshold=1,
         keys=[main_account.key.to_key_weight(1)]
     )
-    assert (
-        eosio.newaccount(
-            main_account.name, 'eosio2', owner=authority
-        ) == EosAction(
-            account='eosio',
-            name='newaccount',
-            authorization=[],
-            data={
-                'creator': main_account.name,
-                'name': 'eosio2',
-                'owner': authority,
-                'active': authority
-            }
+    action = eosio.newaccount(main_account.name, 'eosio2', owner=authority)
+    assert action == EosAction(
+        account='eosio',
+        name='newaccount',
+        authorization=[],
+        data=eosio.NewAccount(
+            creator=main_account.name,
+            name='eosio2',
+            owner=authority,
+            active=authority
         )
     )
 
+    # public keys are serialized locally
+    serialized = serializer.serialize(action.data)
+    _, deserialized = serializer.deserialize(serialized, eosio.NewAccount)
+    assert deserialized == action.data
+
 
 def test_eosio_buyrambytes():
     assert (
         eosio.buyrambytes(
-            'eosio', 'eosio2', '1000'
+            'eosio', 'eosio2', 1000
         ) == EosAction(
             account='eosio',
             name='buyrambytes',
             authorization=[],
-            data={
-                'payer': 'eosio',
-                'receiver': 'eosio2',
-                'bytes': '1000'
-            }
+            data=eosio.BuyRamBytes(
+                payer='eosio', receiver='eosio2', bytes=1000
+            )
         )
     )
 
@@ -79,36 +97,31 @@ def test_eosio_buyrambytes():
 def test_eosio_sellram():
     assert (
         eosio.sellram(
-            'eosio', '1000'
+            'eosio', 1000
         ) == EosAction(
             account='eosio',
             name='sellram',
             authorization=[],
-            data={
-                'account': 'eosio',
-                'bytes': '1000'
-            }
+            data=eosio.SellRam(account='eosio', bytes=1000)
         )
     )
 
 
 def test_eosio_delegatebw():
-    assert (
-        eosio.delegatebw(
-            'eosio', 'eosio2', '1.0000 EOS', '2.0000 EOS',
-        ) == EosAction(
-            account='eosio',
-            name='delegatebw',
-            authorization=[],
-            data={
-                'from': 'eosio',
-                'receiver': 'eosio2',
-                'stake_net_quantity': '1.0000 EOS',
-                'stake_cpu_quantity': '2.0000 EOS',
-                'transfer': False
-            }
+    action = eosio.delegatebw('eosio', 'eosio2', '1.0000 EOS', '2.0000 EOS')
+    assert action == EosAction(
+        account='eosio',
+        name='delegatebw',
+        authorization=[],
+        data=eosio.DelegateBw(
+            from_='eosio',
+            receiver='eosio2',
+            stake_net_quantity='1.0000 EOS',
+            stake_cpu_quantity='2.0000 EOS',
+            transfer=False
         )
     )
+    assert serializer.serialize(action.data)[-1:] == b'\x00'
 
 
 def test_eosio_undelegatebw():
@@ -119,11 +132,59 @@ def test_eosio_undelegatebw():
             account='eosio',
             name='undelegatebw',
             authorization=[],
-            data={
-                'from': 'eosio',
-                'receiver': 'eosio2',
-                'unstake_net_quantity': '1.0000 EOS',
-                'unstake_cpu_quantity': '2.0000 EOS',
-            }
+            data=eosio.UndelegateBw(
+                from_='eosio',
+                receiver='eosio2',
+                unstake_net_quantity='1.0000 EOS',
+                unstake_cpu_quantity='2.0000 EOS'
+            )
+        )
+    )
+
+
+def test_eosio_auth_actions(main_account):
+    authority = EosAuthority(keys=[main_account.key.to_key_weight(1)])
+    action = eosio.updateauth('eosio2', 'transfer', 'active', authority)
+    assert action.data.auth == authority
+    assert serializer.serialize(action.data)
+
+    assert eosio.linkauth(
+        'eosio2', 'eosio.token', 'transfer', 'transfer'
+    ).data.type == 'transfer'
+    assert eosio.unlinkauth('eosio2', 'eosio.token', 'transfer').data == (
+        eosio.UnlinkAuth(account='eosio2', code='eosio.token', type='transfer')
+    )
+    assert eosio.deleteauth('eosio2', 'transfer').name == 'deleteauth'
+
+
+def test_eosio_voteproducer():
+    action = eosio.voteproducer('eosio2', ['producer2', 'producer1'])
+    assert action.data.producers == ['producer1', 'producer2']
+    assert action.data.proxy == ''
+    assert eosio.regproxy('eosio2').data.isproxy
+    assert eosio.refund('eosio2').data.owner == 'eosio2'
+
+
+def test_eosio_msig():
+    level = EosPermissionLevel(actor='eosio2', permission='active')
+    trx = EosTransaction(
+        actions=[eosio_token.transfer('eosio2', 'eosio3', '1.0000 EOS')]
+    )
+    action = eosio_msig.propose('eosio2', 'proposal1', [level], trx)
+    assert action.data.trx == trx
+    serialized = serializer.serialize(action.data)
+    assert serialized.endswith(serializer.serialize(trx))
+
+    assert eosio_msig.approve('eosio2', 'proposal1', level).data.level == (
+        level
+    )
+    assert eosio_msig.unapprove('eosio2', 'proposal1', level).name == (
+        'unapprove'
+    )
+    assert eosio_msig.cancel('eosio2', 'proposal1', 'eosio2').data == (
+        eosio_msig.Cancel(
+            proposer='eosio2', proposal_name='proposal1', canceler='eosio2'
         )
     )
+    assert eosio_msig.exec('eosio2', 'proposal1', 'eosio2').name == 'exec'
+    assert eosio_msig.invalidate('eosio2').data.account == 'eosio2'
@@ -0,0 +1,72 @@
+import hashlib
+
+import pytest
+
+from aioeos import crypto, EosKey
+
+
+@pytest.fixture(params=['ecdsa', 'secp256k1'])
+def backend(request):
+    if request.param == 'secp256k1':
+        pytest.importorskip('coincurve')
+    return crypto.get_backend(request.param)
+
+
+@pytest.fixture
+def digests():
+    return [
+        hashlib.sha256(f'message {i}'.encode()).digest() for i in range(16)
+    ]
+
+
+def test_backend_keys(backend):
+    private_key = backend.generate_private_key()
+    assert len(private_key) == 32
+    public_key = backend.public_key(private_key)
+    assert public_key == crypto.EcdsaBackend().public_key(private_key)
+
+
+def test_backend_signatures(backend, digests):
+    """All backends have to produce the same signatures"""
+    reference = crypto.EcdsaBackend()
+    private_key = reference.generate_private_key()
+    public_key = reference.public_key(private_key)
+    other_key = reference.public_key(reference.generate_private_key())
+
+    for digest in digests:
+        recovery_param, signature = backend.sign(private_key, digest)
+        assert (recovery_param, signature) == reference.sign(
+            private_key, digest
+        )
+        assert backend.verify(public_key, signature, digest)
+        assert not backend.verify(other_key, signature, digest)
+        assert backend.recover(signature, recovery_param, digest) == (
+            public_key
+        )
+
+
+def test_eos_key_backend(backend, monkeypatch):
+    monkeypatch.setattr(EosKey, 'backend', backend)
+    key = EosKey(
+        private_key='5JeaxignXEg3mGwvgmwxG6w6wHcRp9ooPw81KjrP2ah6TWSECDN'
+    )
+    assert key.to_public() == (
+        'EOS8VhvYTcUMwp9jFD8UWRMPgWsGQoqBfpBvrjjfMCouqRH9JF5qW'
+    )
+    digest = hashlib.sha256(b'aioeos').digest()
+    signature = key.sign(digest)
+    assert EosKey(public_key=key.to_public()).verify(signature, digest)
+
+
+def test_hot_key(backend, monkeypatch, digests):
+    monkeypatch.setattr(EosKey, 'backend', backend)
+    key = EosKey(hot=True)
+    public_key = EosKey(public_key=key.to_public(), hot=True)
+    if isinstance(backend, crypto.EcdsaBackend):
+        assert key._public_key in backend._precomputed
+
+    for digest in digests:
+        signature = key.sign(digest)
+        assert signature == EosKey(private_key=key.to_wif()).sign(digest)
+        assert public_key.verify(signature, digest)
+        assert not EosKey().verify(signature, digest)
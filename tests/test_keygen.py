@@ -0,0 +1,53 @@
+import pytest
+
+from aioeos import EosKey
+from aioeos.keygen import (
+    EosKeyGenerator, key_authority, newaccount_batches, record_to_key
+)
+
+
+@pytest.fixture
+def generator():
+    with EosKeyGenerator(processes=2, chunk_size=3) as generator:
+        yield generator
+
+
+def test_generate(generator):
+    records = generator.generate(7)
+    assert len(records) == 7
+    assert len({public_key for _, public_key in records}) == 7
+
+    for record in records:
+        private_key, public_key = record
+        assert len(private_key) == 32
+        key = record_to_key(record)
+        assert key.to_public() == public_key
+        assert key == EosKey(public_key=public_key)
+
+
+async def test_stream(generator):
+    chunks = [chunk async for chunk in generator.stream(8)]
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    assert len(await generator.generate_async(5)) == 5
+
+
+def test_newaccount_batches(main_account):
+    key = EosKey()
+    records = [(bytes(32), key.to_public())] * 5
+    names = [f'aioeos.acc{i}' for i in range(1, 6)]
+
+    batches = list(newaccount_batches(
+        'aioeos.test1',
+        zip(names, records),
+        batch_size=2,
+        authorization=[main_account.authorization('active')],
+        extra_actions=lambda name: [name]
+    ))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+
+    action = batches[0][0]
+    assert action.name == 'newaccount'
+    assert action.data.name == 'aioeos.acc1'
+    assert action.data.owner == key_authority(key.to_public())
+    assert action.data.active == action.data.owner
+    assert batches[0][1] == 'aioeos.acc1'
@@ -1,4 +1,15 @@
+import hashlib
+import os
+import subprocess
+import sys
+
+import base58
+import pytest
+
 from aioeos import EosKey
+from aioeos.keys import (
+    b58decode, b58decode_many, b58encode, b58encode_many, recover_public_key
+)
 
 
 def test_eos_key_creating():
@@ -37,3 +48,114 @@ def test_eos_key_restore():
     pvt_key = EosKey(private_key=pvt_private)
     assert pvt_key.to_public() == pvt_public
     assert pvt_key.to_pvt() == pvt_private
+
+
+def test_eos_key_recovery_param():
+    """Recovery parameter has to match the one found by key recovery"""
+    key = EosKey()
+    for i in range(16):
+        digest = hashlib.sha256(f'message {i}'.encode()).digest()
+        signature = key.sign(digest)
+        _, key_type, encoded = signature.split('_')
+        decoded = key._check_decode(encoded, key_type)
+        assert decoded[0] - 4 - 27 == key._recovery_pubkey_param(
+            digest, decoded[1:]
+        )
+        assert key.verify(signature, digest)
+
+
+def test_eos_key_public_formats():
+    key = EosKey()
+    public_key = EosKey(public_key=key.to_public())
+    assert public_key == key
+    assert EosKey(
+        public_key=f'PUB_K1_{key._check_encode(key._public_key, "K1")}'
+    ) == key
+
+    with pytest.raises(ValueError):
+        EosKey(public_key='XYZ' + key.to_public()[3:])
+
+    # public key can't sign
+    with pytest.raises(AssertionError):
+        public_key.sign(bytes(32))
+
+
+def test_recover_public_key():
+    key = EosKey()
+    digest = hashlib.sha256(b'deposit').digest()
+    signature = key.sign(digest)
+    assert recover_public_key(signature, digest) == key.to_public()
+
+    recovered = EosKey.from_signature(signature, digest)
+    assert recovered == key
+    assert recovered.verify(signature, digest)
+
+    # different digest recovers a different key
+    other_digest = hashlib.sha256(b'withdrawal').digest()
+    assert recover_public_key(signature, other_digest) != key.to_public()
+
+
+def test_eos_key_hashable():
+    key = EosKey()
+    public_key = EosKey(public_key=key.to_public())
+    assert len({key, public_key, EosKey()}) == 2
+    assert {key: 1}[public_key] == 1
+    assert key != key.to_public()
+
+    # encodings are memoized
+    assert key.to_public() is key.to_public()
+    assert key.to_wif() is key.to_wif()
+    assert key.to_pvt() is key.to_pvt()
+    assert public_key.to_public() == key.to_public()
+
+
+def test_b58_codec():
+    values = [b'', bytes(3), bytes(2) + b'\x01', os.urandom(37)] + [
+        bytes(i % 3) + os.urandom(i) for i in range(1, 80)
+    ]
+    encoded = b58encode_many(values)
+    assert encoded == [base58.b58encode(value).decode() for value in values]
+    assert b58decode_many(encoded) == values
+
+    # fixed length decoding pads with zeros
+    assert b58decode(b58encode(bytes(2) + b'\x05'), 3) == bytes(2) + b'\x05'
+
+    with pytest.raises(ValueError):
+        b58decode('0OIl')
+    with pytest.raises(ValueError):
+        b58decode(b58encode(b'\xff' * 40), 37)
+
+    # leading '1's have to match leading zero bytes
+    with pytest.raises(ValueError):
+        b58decode('1' + b58encode(bytes(2) + b'\x05'), 3)
+    with pytest.raises(ValueError):
+        b58decode(b58encode(bytes(2) + b'\x05')[1:], 3)
+
+
+def test_non_canonical_public_key():
+    public_key = EosKey().to_public()
+    with pytest.raises(ValueError):
+        EosKey(public_key='EOS11' + public_key[3:])
+
+
+def test_public_key_encoding_is_computed():
+    key = EosKey()
+    public_key = EosKey(public_key=key.to_public())
+    assert not public_key._encoded
+    assert public_key.to_public() == key.to_public()
+
+
+def test_import_without_ripemd160():
+    # OpenSSL 3 without legacy provider has no RIPEMD-160
+    script = (
+        'import hashlib\n'
+        'new = hashlib.new\n'
+        'def fail(name, *args):\n'
+        '    if name == "rmd160":\n'
+        '        raise ValueError("unsupported hash type")\n'
+        '    return new(name, *args)\n'
+        'hashlib.new = fail\n'
+        'import aioeos\n'
+        'aioeos.EosJsonRpc("http://127.0.0.1:8888")\n'
+    )
+    subprocess.run([sys.executable, '-c', script], check=True)
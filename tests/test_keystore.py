@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+from aioeos import (
+    EosAction, EosAuthority, EosKey, EosPermissionLevel,
+    EosPermissionLevelWeight, EosTransaction
+)
+from aioeos.keystore import EosKeyStore, EosPermissionCache
+
+
+@pytest.fixture
+def keys():
+    return [EosKey() for _ in range(4)]
+
+
+def make_transaction(*authorizations):
+    return EosTransaction(
+        expiration=datetime.fromisoformat('2019-11-12T12:50:48.000+00:00'),
+        actions=[
+            EosAction(
+                account='aioeos.test1',
+                name='test',
+                authorization=list(authorizations),
+                data=b'\x03'
+            )
+        ]
+    )
+
+
+async def test_keystore_required_keys(main_account, keys):
+    cache = EosPermissionCache()
+    cache.put('aioeos.test1', 'active', EosAuthority(
+        threshold=2,
+        keys=[keys[0].to_key_weight(1), keys[1].to_key_weight(1)],
+    ))
+    cache.put('aioeos.test2', 'active', EosAuthority(
+        threshold=3,
+        keys=[keys[2].to_key_weight(1), keys[3].to_key_weight(3)],
+        accounts=[
+            EosPermissionLevelWeight(
+                permission=EosPermissionLevel(
+                    actor='aioeos.test1', permission='active'
+                ),
+                weight=2
+            )
+        ]
+    ))
+    keystore = EosKeyStore(keys, permissions=cache)
+    assert len(keystore) == 4
+    assert keys[0].to_public() in keystore
+    assert main_account.key.to_public() not in keystore
+
+    test1 = EosPermissionLevel(actor='aioeos.test1', permission='active')
+    test2 = EosPermissionLevel(actor='aioeos.test2', permission='active')
+
+    required = await keystore.required_keys(make_transaction(test1))
+    assert set(required) == {keys[0], keys[1]}
+
+    # heaviest key is enough
+    required = await keystore.required_keys(make_transaction(test2))
+    assert required == [keys[3]]
+
+    # nested account permission
+    keystore.remove(keys[3].to_public())
+    required = await keystore.required_keys(make_transaction(test2))
+    assert set(required) == {keys[0], keys[1], keys[2]}
+
+    keystore.remove(keys[1].to_public())
+    with pytest.raises(ValueError):
+        await keystore.required_keys(make_transaction(test1, test2))
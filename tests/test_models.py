@@ -0,0 +1,146 @@
+import binascii
+from datetime import datetime, timezone
+import zlib
+
+import pytest
+
+from aioeos.models import EosAccountInfo, EosBlock, EosInfo
+from aioeos.types import EosAuthority, EosKeyWeight
+
+
+INFO = {
+    'server_version': 'd4b0e33b',
+    'chain_id': '00aabbbccc',
+    'head_block_num': 100,
+    'last_irreversible_block_num': 90,
+    'head_block_time': '2020-04-10T12:00:00.500',
+    'head_block_producer': 'eosio',
+    'unknown_field': 1
+}
+
+ACCOUNT = {
+    'account_name': 'eostest12345',
+    'created': '2020-04-10T12:00:00.000',
+    'ram_quota': 10000,
+    'ram_usage': 3000,
+    'cpu_limit': {'used': 10, 'available': 990, 'max': 1000},
+    'net_limit': {'used': 20, 'available': 980, 'max': 1000},
+    'permissions': [
+        {
+            'perm_name': 'active',
+            'parent': 'owner',
+            'required_auth': {
+                'threshold': 1,
+                'keys': [
+                    {
+                        'key': 'EOS6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGY'
+                               'qET5GDW5CV',
+                        'weight': 1
+                    }
+                ]
+            }
+        }
+    ]
+}
+
+PACKED_TRX = (
+    'a8aaca5d03000400000000000000011032561960aaa833000000000090b1ca0150'
+    'c810216395315500000000a8ed3232010300'
+)
+
+
+def test_info():
+    info = EosInfo(INFO)
+    assert info.head_block_num == 100
+    assert info.chain_id_bytes == b'\x00\xaa\xbb\xbc\xcc'
+    assert info.head_block_time == datetime(
+        2020, 4, 10, 12, 0, 0, 500000, tzinfo=timezone.utc
+    )
+    assert info.block_cpu_limit is None
+    assert not hasattr(info, '__dict__')
+    assert not hasattr(info, 'unknown_field')
+    assert repr(info).startswith("EosInfo(server_version='d4b0e33b'")
+
+
+def test_account():
+    account = EosAccountInfo(ACCOUNT)
+    assert account._permissions_raw is not None
+    permission = account.permissions[0]
+    # raw value is dropped once converted, result is cached
+    assert account._permissions_raw is None
+    assert account.permissions[0] is permission
+
+    assert permission.perm_name == 'active'
+    assert permission.required_auth == EosAuthority(
+        threshold=1,
+        keys=[
+            EosKeyWeight(
+                key='EOS6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV',
+                weight=1
+            )
+        ]
+    )
+    assert account.cpu_limit.available == 990
+    assert account.net_limit.max == 1000
+    assert account.created.year == 2020
+    assert account.last_code_update is None
+
+
+def test_block():
+    block = EosBlock({
+        'id': 'abcd',
+        'block_num': 3,
+        'timestamp': '2020-04-10T12:00:00.000',
+        'transactions': [
+            {
+                'status': 'executed',
+                'cpu_usage_us': 100,
+                'net_usage_words': 12,
+                'trx': {'id': 'efgh', 'packed_trx': PACKED_TRX}
+            },
+            {
+                'status': 'executed',
+                'cpu_usage_us': 200,
+                'net_usage_words': 0,
+                'trx': 'ijkl'
+            }
+        ]
+    })
+    receipt, deferred = block.transactions
+    assert receipt.id == 'efgh'
+    assert receipt.view().actions[0].matches('aioeos.test1', 'test')
+    assert deferred.id == 'ijkl'
+    assert deferred.packed_trx is None and deferred.view() is None
+
+
+def test_compressed_receipt():
+    compressed = binascii.hexlify(
+        zlib.compress(binascii.unhexlify(PACKED_TRX))
+    ).decode()
+    receipt = EosBlock({
+        'transactions': [{
+            'status': 'executed',
+            'trx': {
+                'id': 'efgh', 'compression': 'zlib', 'packed_trx': compressed
+            }
+        }]
+    }).transactions[0]
+    assert receipt.packed_trx == PACKED_TRX
+    assert receipt.view().actions[0].matches('aioeos.test1', 'test')
+
+    receipt.trx['compression'] = 'lzma'
+    with pytest.raises(ValueError):
+        receipt.packed_trx
+
+
+async def test_typed_responses(rpc, mocker):
+    async def post(endpoint, json={}):
+        return {'/chain/get_info': INFO, '/chain/get_account': ACCOUNT}[
+            endpoint
+        ]
+
+    mocker.patch.object(rpc, 'post', side_effect=post)
+    assert (await rpc.get_info())['head_block_num'] == 100
+    assert (await rpc.get_info(typed=True)).head_block_num == 100
+    account = await rpc.get_account('eostest12345', typed=True)
+    assert account.ram_quota == 10000
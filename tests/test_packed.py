@@ -0,0 +1,112 @@
+import binascii
+from datetime import datetime
+import hashlib
+
+from aioeos import EosAction, EosPermissionLevel, EosTransaction
+from aioeos.contracts import eosio_token
+from aioeos.packed import EosPackedTransaction, estimate_net_usage_words
+
+
+PACKED_TRX = (
+    'a8aaca5d03000400000000000000011032561960aaa833000000000090b1ca0150'
+    'c810216395315500000000a8ed3232010300'
+)
+CHAIN_ID = binascii.unhexlify('00aabbbccc')
+
+
+def make_packed_transaction(main_account, context_free_data=()):
+    return EosPackedTransaction.from_transaction(
+        EosTransaction(
+            expiration=datetime.fromisoformat(
+                '2019-11-12T12:50:48.000+00:00'
+            ),
+            ref_block_num=3,
+            ref_block_prefix=4,
+            actions=[
+                EosAction(
+                    account='aioeos.test1',
+                    name='test',
+                    authorization=[main_account.authorization('active')],
+                    data=b'\x03'
+                )
+            ]
+        ),
+        context_free_data
+    )
+
+
+def test_packed_transaction(main_account):
+    packed = make_packed_transaction(main_account)
+    assert binascii.hexlify(packed.packed_bytes).decode() == PACKED_TRX
+    assert packed.id == hashlib.sha256(packed.packed_bytes).hexdigest()
+    assert packed.context_free_bytes == bytes(32)
+    assert packed.signing_digest(CHAIN_ID) == hashlib.sha256(
+        CHAIN_ID + packed.packed_bytes + bytes(32)
+    ).digest()
+    assert packed.sign(CHAIN_ID, [main_account.key]) == [
+        'SIG_K1_Kh65eZiWa3DCMT5UjnZf9tNtG8P4DBgULd1Tq15Hg37LfDTn8jtW6e7YtdB3'
+        'EuANcCC64s445URAkRt27rjWr8WYqZweLH'
+    ]
+    assert packed.to_push_args(['sig']) == {
+        'signatures': ['sig'],
+        'compression': 0,
+        'packed_context_free_data': '',
+        'packed_trx': PACKED_TRX
+    }
+
+
+def test_packed_transaction_context_free_data(main_account):
+    packed = make_packed_transaction(main_account, [b'ab', b'c'])
+    assert packed.packed_context_free_data == b'\x02\x02ab\x01c'
+    assert packed.context_free_bytes == hashlib.sha256(
+        b'\x02\x02ab\x01c'
+    ).digest()
+    # context-free data doesn't change ID, but changes signing digest
+    assert packed.id == make_packed_transaction(main_account).id
+    assert packed.signing_digest(CHAIN_ID) != (
+        make_packed_transaction(main_account).signing_digest(CHAIN_ID)
+    )
+    assert packed.to_push_args([])['packed_context_free_data'] == (
+        '020261620163'
+    )
+
+
+async def test_push_packed_transaction(rpc, mocker, main_account):
+    async def post(endpoint, json={}):
+        return {'endpoint': endpoint, 'json': json}
+
+    mocker.patch.object(rpc, 'post', side_effect=post)
+    packed = make_packed_transaction(main_account)
+    response = await rpc.push_packed_transaction(packed, ['sig'])
+    assert response['endpoint'] == '/chain/push_transaction'
+    assert response['json']['packed_trx'] == PACKED_TRX
+    assert response['json']['signatures'] == ['sig']
+
+
+def test_net_usage(main_account):
+    packed = make_packed_transaction(main_account)
+    assert len(packed.packed_bytes) == 51
+    assert packed.delay_sec == 0
+    # 1 byte of signature count and 66 bytes of signature, 20% billed
+    assert packed.prunable_size() == 67
+    assert packed.net_usage() == 12 + 16 + 51 + 14
+    assert packed.net_usage_words() == 12
+    assert packed.net_usage_words(signature_count=3) == 15
+
+    with_data = make_packed_transaction(main_account, [b'a' * 100])
+    assert with_data.prunable_size() == 67 + 102
+    assert with_data.net_usage() == 12 + 16 + 51 + 34
+
+
+def test_net_usage_transfer():
+    # transfer with empty memo is billed 16 words by the node
+    transaction = EosTransaction(actions=[
+        eosio_token.transfer(
+            'eosio', 'eosio.token', '1.0000 EOS',
+            authorization=[EosPermissionLevel('eosio', 'active')]
+        )
+    ])
+    assert estimate_net_usage_words(transaction) == 16
+
+    transaction.delay_sec = 10
+    assert estimate_net_usage_words(transaction) == 16 + 6
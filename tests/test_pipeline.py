@@ -0,0 +1,151 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from aioeos import exceptions, EosAction, EosTransaction
+from aioeos.pipeline import EosTransactionPipeline
+from aioeos.signing import EosSigningPool
+
+
+@pytest.fixture
+def ar():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+def transaction(main_account):
+    return EosTransaction(
+        expiration=datetime.fromisoformat('2019-11-12T12:50:48.000+00:00'),
+        ref_block_num=3,
+        ref_block_prefix=4,
+        actions=[
+            EosAction(
+                account='aioeos.test1',
+                name='test',
+                authorization=[main_account.authorization('active')],
+                data=b'\x03'
+            )
+        ]
+    )
+
+
+async def test_pipeline_push(rpc, ar, main_account, transaction):
+    ar.post(
+        f'{rpc.URL}/v1/chain/get_info',
+        payload={'chain_id': '00aabbbccc'}
+    )
+    ar.post(
+        f'{rpc.URL}/v1/chain/push_transaction',
+        payload={'code': 200},
+        repeat=True
+    )
+
+    async with EosTransactionPipeline(
+        rpc, concurrency=2, max_queue_size=2,
+        executor=ThreadPoolExecutor(max_workers=2)
+    ) as pipeline:
+        futures = [
+            await pipeline.submit(transaction, keys=[main_account.key])
+            for _ in range(5)
+        ]
+
+    assert all(future.done() for future in futures)
+    assert [future.result() for future in futures] == [{'code': 200}] * 5
+    assert pipeline.stats.submitted == 5
+    assert pipeline.stats.succeeded == 5
+    assert pipeline.stats.pending == 0
+    assert pipeline.stats.average_latency > 0
+    assert pipeline.stats.throughput > 0
+
+    push_requests = ar.requests[
+        ('POST', URL('http://127.0.0.1:8888/v1/chain/push_transaction'))
+    ]
+    assert len(push_requests) == 5
+    assert push_requests[0].kwargs['json']['packed_trx'] == (
+        'a8aaca5d03000400000000000000011032561960aaa833000000000090b1ca0150'
+        'c810216395315500000000a8ed3232010300'
+    )
+    assert push_requests[0].kwargs['json']['signatures'] == [
+        'SIG_K1_Kh65eZiWa3DCMT5UjnZf9tNtG8P4DBgULd1Tq15Hg37LfDTn8jtW6e7YtdB3'
+        'EuANcCC64s445URAkRt27rjWr8WYqZweLH'
+    ]
+
+
+async def test_pipeline_failure(rpc, ar, main_account, transaction):
+    ar.post(
+        f'{rpc.URL}/v1/chain/get_info',
+        payload={'chain_id': '00aabbbccc'}
+    )
+    ar.post(
+        f'{rpc.URL}/v1/chain/push_transaction',
+        payload={'code': 500, 'error': {'name': 'deadline_exception'}}
+    )
+
+    pipeline = EosTransactionPipeline(rpc)
+    future = await pipeline.submit(transaction, keys=[main_account.key])
+    await pipeline.close()
+
+    with pytest.raises(exceptions.EosDeadlineException):
+        future.result()
+    assert pipeline.stats.failed == 1
+    assert pipeline.stats.succeeded == 0
+
+
+async def test_pipeline_concurrent_submit(rpc, ar, main_account, transaction):
+    ar.post(
+        f'{rpc.URL}/v1/chain/get_info',
+        payload={'chain_id': '00aabbbccc'}
+    )
+    ar.post(
+        f'{rpc.URL}/v1/chain/push_transaction',
+        payload={'code': 200},
+        repeat=True
+    )
+
+    pipeline = EosTransactionPipeline(rpc, concurrency=2)
+    futures = await asyncio.gather(*(
+        pipeline.submit(transaction, keys=[main_account.key])
+        for _ in range(4)
+    ))
+    assert len(pipeline._workers) == 2
+    workers = list(pipeline._workers)
+    await pipeline.close()
+
+    assert all(worker.done() for worker in workers)
+    assert [future.result() for future in futures] == [{'code': 200}] * 4
+    assert pipeline.stats.submitted == 4
+    assert pipeline.stats.succeeded == 4
+
+
+async def test_pipeline_signing_pool(rpc, ar, main_account, transaction):
+    ar.post(
+        f'{rpc.URL}/v1/chain/get_info',
+        payload={'chain_id': '00aabbbccc'}
+    )
+    ar.post(
+        f'{rpc.URL}/v1/chain/push_transaction',
+        payload={'code': 200},
+        repeat=True
+    )
+
+    with EosSigningPool([main_account.key], processes=1) as signing_pool:
+        async with EosTransactionPipeline(
+            rpc, signing_pool=signing_pool
+        ) as pipeline:
+            future = await pipeline.submit(
+                transaction, keys=[main_account.key]
+            )
+    assert future.result() == {'code': 200}
+
+    push_request = ar.requests[
+        ('POST', URL('http://127.0.0.1:8888/v1/chain/push_transaction'))
+    ][0]
+    assert push_request.kwargs['json']['signatures'] == [
+        'SIG_K1_Kh65eZiWa3DCMT5UjnZf9tNtG8P4DBgULd1Tq15Hg37LfDTn8jtW6e7YtdB3'
+        'EuANcCC64s445URAkRt27rjWr8WYqZweLH'
+    ]
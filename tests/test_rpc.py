@@ -2,12 +2,13 @@ import asyncio
 import binascii
 from dataclasses import dataclass
 from datetime import datetime
+import json
 
 from aioresponses import aioresponses
 import pytest
 from yarl import URL
 
-from aioeos import exceptions, EosAction, EosTransaction
+from aioeos import exceptions, EosAction, EosJsonRpc, EosTransaction
 from aioeos.types import BaseAbiObject, UInt8
 
 
@@ -60,6 +61,41 @@ async def test_error_mapping(rpc, ar):
     assert await rpc.post('/mock') == payload
 
 
+async def test_json_codec(ar):
+    decoded = []
+
+    def loads(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    rpc = EosJsonRpc(
+        'http://127.0.0.1:8888',
+        dumps=lambda value: json.dumps(value).encode(),
+        loads=loads
+    )
+    # encoders returning bytes are supported
+    assert rpc._serialize({'a': 1}) == '{"a": 1}'
+
+    mock_url = f'{rpc.URL}/v1/mock'
+    ar.post(mock_url, payload={'ok': 'yes'})
+    assert await rpc.post('/mock', {'a': 1}) == {'ok': 'yes'}
+    assert decoded == [b'{"ok": "yes"}']
+
+
+async def test_raw_response(rpc, ar):
+    mock_url = f'{rpc.URL}/v1/mock'
+    ar.post(mock_url, body=b'{"ok": "yes"}')
+    assert await rpc.post('/mock', raw=True) == b'{"ok": "yes"}'
+
+    ar.post(
+        mock_url,
+        status=500,
+        payload={'code': 500, 'error': {'name': 'tx_duplicate'}}
+    )
+    with pytest.raises(exceptions.EosTxDuplicateException):
+        await rpc.post('/mock', raw=True)
+
+
 async def test_abi_json_to_bin(rpc, mock_post):
     await rpc.abi_json_to_bin('eosio.token', 'send', {})
     mock_post.assert_called_with(
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from aioeos import EosAccount, EosAction, EosTransaction, exceptions
+from aioeos.scheduler import EosPayerScheduler
+
+
+def account_data(cpu, net, ram_quota=10000, ram_usage=5000):
+    return {
+        'cpu_limit': {'used': 0, 'available': cpu, 'max': cpu},
+        'net_limit': {'used': 0, 'available': net, 'max': net},
+        'ram_quota': ram_quota,
+        'ram_usage': ram_usage
+    }
+
+
+@pytest.fixture
+def payers():
+    return [EosAccount(name) for name in ('payer1', 'payer2', 'payer3')]
+
+
+@pytest.fixture
+def accounts(rpc, mocker):
+    """Maps account names to get_account responses"""
+    data = {
+        'payer1': account_data(1000, 5000),
+        'payer2': account_data(5000, 5000),
+        'payer3': account_data(3000, 5000, ram_quota=-1)
+    }
+
+    async def get_account(account_name):
+        return data[account_name]
+
+    mocker.patch.object(rpc, 'get_account', side_effect=get_account)
+    return data
+
+
+@pytest.fixture
+def transaction(main_account):
+    return EosTransaction(actions=[
+        EosAction(
+            account='aioeos.test1',
+            name='test',
+            authorization=[main_account.authorization('active')],
+            data=b'\x03'
+        )
+    ])
+
+
+async def test_acquire(rpc, accounts, payers):
+    scheduler = EosPayerScheduler(rpc, payers)
+    payer = await scheduler.acquire(cpu_us=2500)
+    assert payer.account.name == 'payer2'
+    assert payer.cpu_available == 2500
+
+    # payer2 has less CPU left after the reservation
+    assert (await scheduler.acquire(cpu_us=100)).account.name == 'payer3'
+    assert scheduler.payers['payer3'].ram_available == 2 ** 63
+    assert (await scheduler.acquire(ram_bytes=6000)).account.name == (
+        'payer3'
+    )
+    with pytest.raises(exceptions.EosNoPayerAvailableException):
+        await scheduler.acquire(cpu_us=4000)
+
+    # resources are fetched again once stale
+    accounts['payer1'] = account_data(9000, 5000)
+    await scheduler.refresh(force=True)
+    assert (await scheduler.acquire()).account.name == 'payer1'
+
+
+async def test_send(rpc, mocker, accounts, payers, main_account, transaction):
+    pushed = []
+
+    async def sign_and_push_transaction(transaction, *, keys, **kwargs):
+        pushed.append((transaction, keys))
+        if transaction.actions[0].authorization[0].actor == 'payer2':
+            raise exceptions.EosTxCpuUsageExceededException()
+        return {
+            'processed': {
+                'receipt': {'cpu_usage_us': 300, 'net_usage_words': 12}
+            }
+        }
+
+    mocker.patch.object(
+        rpc,
+        'sign_and_push_transaction',
+        side_effect=sign_and_push_transaction
+    )
+    scheduler = EosPayerScheduler(rpc, payers)
+    response = await scheduler.send(
+        transaction, keys=[main_account.key], cpu_us=200, net_bytes=100
+    )
+    assert response['processed']['receipt']['cpu_usage_us'] == 300
+
+    first, second = pushed
+    assert first[0].actions[0].authorization == [
+        payers[1].authorization('active'),
+        main_account.authorization('active')
+    ]
+    assert first[1] == [main_account.key, payers[1].key]
+    assert second[0].actions[0].authorization[0].actor == 'payer3'
+    # source transaction is left untouched
+    assert len(transaction.actions[0].authorization) == 1
+
+    # payer2 is skipped until cooldown passes, usage of payer3 is updated
+    assert not scheduler.payers['payer2'].has_headroom()
+    assert scheduler.payers['payer3'].cpu_available == 2700
+    assert scheduler.payers['payer3'].net_available == 5000 - 96
+
+
+def test_created_outside_loop(rpc, accounts, payers):
+    # lock is bound to the loop running refresh, not the one at creation
+    scheduler = EosPayerScheduler(rpc, payers)
+
+    async def acquire_many():
+        return await asyncio.gather(*(
+            scheduler.acquire(cpu_us=100) for _ in range(3)
+        ))
+
+    assert len(asyncio.run(acquire_many())) == 3
@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aioeos import exceptions, EosAction, EosTransaction
+from aioeos.sender import EosTransactionSender
+
+
+@pytest.fixture
+def transaction(main_account):
+    return EosTransaction(
+        expiration=datetime.now(timezone.utc).replace(microsecond=0)
+        + timedelta(minutes=2),
+        ref_block_num=3,
+        ref_block_prefix=4,
+        actions=[
+            EosAction(
+                account='aioeos.test1',
+                name='test',
+                authorization=[main_account.authorization('active')],
+                data=b'\x03'
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def push(mocker, rpc):
+    """Returns a list of results for consecutive push_transaction calls"""
+    results = []
+
+    async def get_chain_id():
+        return bytes(32)
+
+    async def push_transaction(signatures, serialized_transaction):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    mocker.patch.object(rpc, 'get_chain_id', side_effect=get_chain_id)
+    mocker.patch.object(rpc, 'push_transaction', side_effect=push_transaction)
+    return results
+
+
+async def test_unique_transaction_ids(rpc, push, main_account, transaction):
+    sender = EosTransactionSender(rpc)
+    push.extend([{'ok': 1}, {'ok': 2}])
+    expiration = transaction.expiration
+
+    first = await sender.send(transaction, keys=[main_account.key])
+    second = await sender.send(transaction, keys=[main_account.key])
+    assert first.transaction_id != second.transaction_id
+    assert first.response == {'ok': 1}
+    assert second.response == {'ok': 2}
+    assert first.expiration == expiration
+    assert second.expiration == expiration + timedelta(seconds=1)
+    # staggered expiration is set on a copy
+    assert transaction.expiration == expiration
+
+
+async def test_concurrent_sends(rpc, push, main_account, transaction):
+    sender = EosTransactionSender(rpc, backoff=0)
+    push.extend([exceptions.EosDeadlineException(), {'ok': 1}, {'ok': 2}])
+    expiration = transaction.expiration
+
+    results = await asyncio.gather(*(
+        sender.send(transaction, keys=[main_account.key]) for _ in range(2)
+    ))
+    assert len({result.transaction_id for result in results}) == 2
+    assert sorted(result.expiration for result in results) == [
+        expiration, expiration + timedelta(seconds=1)
+    ]
+    assert transaction.expiration == expiration
+
+
+async def test_many_identical_transactions(
+    rpc, push, main_account, transaction
+):
+    sender = EosTransactionSender(rpc)
+    push.extend({'ok': i} for i in range(1000))
+    expiration = transaction.expiration
+
+    results = await asyncio.gather(*(
+        sender.send(transaction, keys=[main_account.key])
+        for _ in range(1000)
+    ))
+    assert len({result.transaction_id for result in results}) == 1000
+    assert max(result.expiration for result in results) == (
+        expiration + timedelta(seconds=999)
+    )
+
+
+async def test_max_transaction_lifetime(rpc, push, main_account, transaction):
+    # transaction expires in 2 minutes, leaving room for about 60 more
+    sender = EosTransactionSender(rpc, max_transaction_lifetime=180)
+    push.extend({'ok': i} for i in range(100))
+    results = []
+    with pytest.raises(exceptions.EosTransactionLifetimeExceededException):
+        for _ in range(100):
+            results.append(
+                await sender.send(transaction, keys=[main_account.key])
+            )
+    assert 59 <= len(results) <= 62
+
+
+async def test_retry(rpc, push, main_account, transaction):
+    sender = EosTransactionSender(rpc, backoff=0)
+    push.extend([
+        exceptions.EosDeadlineException(),
+        exceptions.EosTxCpuUsageExceededException(),
+        {'ok': 1}
+    ])
+    result = await sender.send(transaction, keys=[main_account.key])
+    assert result.response == {'ok': 1}
+    assert result.attempts == 3
+
+
+async def test_retry_limit(rpc, push, main_account, transaction):
+    sender = EosTransactionSender(rpc, retries=1, backoff=0)
+    push.extend([
+        exceptions.EosDeadlineException(),
+        exceptions.EosDeadlineException()
+    ])
+    with pytest.raises(exceptions.EosDeadlineException):
+        await sender.send(transaction, keys=[main_account.key])
+
+
+async def test_non_retriable_error(rpc, push, main_account, transaction):
+    sender = EosTransactionSender(rpc, backoff=0)
+    push.append(exceptions.EosAssertMessageException())
+    with pytest.raises(exceptions.EosAssertMessageException):
+        await sender.send(transaction, keys=[main_account.key])
+
+
+async def test_duplicate_after_retry(rpc, push, main_account, transaction):
+    sender = EosTransactionSender(rpc, backoff=0)
+    push.extend([
+        exceptions.EosDeadlineException(),
+        exceptions.EosTxDuplicateException()
+    ])
+    result = await sender.send(transaction, keys=[main_account.key])
+    assert result.response is None
+    assert result.attempts == 2
+
+
+async def test_no_resubmission_after_inclusion(
+    rpc, push, mocker, main_account, transaction
+):
+    tracked = mocker.Mock()
+    tracked.included = asyncio.get_event_loop().create_future()
+    tracked.included.set_result(10)
+    tracker = mocker.Mock()
+    tracker.track.return_value = tracked
+    sender = EosTransactionSender(rpc, tracker=tracker, backoff=0)
+    push.append(exceptions.EosDeadlineException())
+
+    result = await sender.send(transaction, keys=[main_account.key])
+    assert result.response is None
+    tracker.track.assert_called_once_with(
+        result.transaction_id, transaction.expiration
+    )
+    assert rpc.push_transaction.call_count == 1
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import List
 
 import pytest
 
@@ -257,3 +259,59 @@ def test_eos_transaction_serializer():
     length, decoded = serializer.deserialize(encoded, types.EosTransaction)
     assert decoded == transaction
     assert len(encoded) == length
+
+
+def test_asset_serializer():
+    s = serializer.AbiAssetSerializer()
+    for asset in ('1.0000 EOS', '-0.0001 EOS', '5 ABC', '123.45 TOKEN'):
+        serialized = s.serialize(asset)
+        assert len(serialized) == 16
+        assert s.deserialize(serialized) == (16, asset)
+    assert s.serialize('1.0000 EOS') == (
+        b'\x10\x27\x00\x00\x00\x00\x00\x00\x04EOS\x00\x00\x00\x00'
+    )
+
+    with pytest.raises(exceptions.EosSerializerInvalidSymbolException):
+        s.serialize('1.0000EOS')
+    with pytest.raises(exceptions.EosSerializerInvalidSymbolException):
+        s.serialize('1.0000 eos')
+
+
+def test_symbol_serializer():
+    s = serializer.AbiSymbolSerializer()
+    assert s.serialize('4,EOS') == b'\x04EOS\x00\x00\x00\x00'
+    assert s.deserialize(b'\x04EOS\x00\x00\x00\x00') == (8, '4,EOS')
+
+
+def test_public_key_serializer(main_account):
+    public_key = main_account.key.to_public()
+    serialized = serializer.serialize(public_key, types.PublicKey)
+    assert len(serialized) == 34 and serialized[0] == 0
+    assert serializer.deserialize(serialized, types.PublicKey) == (
+        34, public_key
+    )
+
+
+def test_bool_serializer():
+    assert serializer.serialize(True) == b'\x01'
+    assert serializer.deserialize(b'\x00', bool) == (1, False)
+
+
+def test_serializers_are_cached():
+    list_type = List[types.EosPermissionLevel]
+    s = serializer.get_abi_type_serializer(list_type)
+    assert serializer.get_abi_type_serializer(list_type) is s
+    assert serializer.get_abi_type_serializer(types.EosAction) is (
+        serializer.get_abi_type_serializer(types.EosAction)
+    )
+
+
+def test_abi_object_serializer_subclass():
+    @dataclass
+    class ExtendedLevel(types.EosPermissionLevel):
+        extra: types.UInt8
+
+    value = ExtendedLevel(actor='eosio', permission='active', extra=3)
+    s = serializer.AbiObjectSerializer(types.EosPermissionLevel)
+    assert s.serialize(value) == serializer.serialize(value)
+    assert s.serialize(value)[-1:] == b'\x03'
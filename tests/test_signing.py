@@ -0,0 +1,84 @@
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+
+import pytest
+
+from aioeos import EosKey
+from aioeos.signing import EosSignatureVerifier, EosSigningPool
+
+
+@pytest.fixture
+def keys():
+    return [EosKey(), EosKey()]
+
+
+@pytest.fixture
+def pool(keys):
+    with EosSigningPool(keys, processes=2, chunk_size=3) as pool:
+        yield pool
+
+
+@pytest.fixture
+def digests():
+    return [
+        hashlib.sha256(f'message {i}'.encode()).digest() for i in range(8)
+    ]
+
+
+def test_sign_many(pool, keys, digests):
+    assert pool.sign_many(digests, keys[0]) == [
+        keys[0].sign(digest) for digest in digests
+    ]
+
+    # key for each digest
+    alternating = [keys[i % 2] for i in range(len(digests))]
+    signatures = pool.sign_many(digests, alternating)
+    assert signatures == [
+        key.sign(digest) for key, digest in zip(alternating, digests)
+    ]
+
+
+def test_sign_many_validation(pool, keys, digests):
+    with pytest.raises(AssertionError):
+        pool.sign_many(digests, EosKey())
+
+    with pytest.raises(AssertionError):
+        pool.sign_many(digests, keys)
+
+
+async def test_sign_async(pool, keys, digests):
+    assert await pool.sign_async(digests[0], keys[1]) == (
+        keys[1].sign(digests[0])
+    )
+    assert await pool.sign_many_async(digests, keys[1]) == [
+        keys[1].sign(digest) for digest in digests
+    ]
+
+
+@pytest.fixture
+def verification_items(keys, digests):
+    items = [
+        (keys[0].sign(digest), digest, keys[0].to_public())
+        for digest in digests
+    ]
+    # wrong key, wrong digest and malformed signature
+    items.append((items[0][0], digests[0], keys[1].to_public()))
+    items.append((items[0][0], digests[1], keys[0].to_public()))
+    items.append(('SIG_XX_abc', digests[0], keys[0].to_public()))
+    return items
+
+
+def test_verify_many(verification_items, digests):
+    expected = [True] * len(digests) + [False] * 3
+    assert EosSignatureVerifier().verify_many(verification_items) == expected
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        verifier = EosSignatureVerifier(executor=executor, chunk_size=3)
+        assert verifier.verify_many(verification_items) == expected
+
+
+async def test_verify_many_async(verification_items, digests):
+    verifier = EosSignatureVerifier(chunk_size=4)
+    assert await verifier.verify_many_async(verification_items) == (
+        [True] * len(digests) + [False] * 3
+    )
@@ -0,0 +1,85 @@
+import binascii
+
+from aioeos import serializer
+from aioeos.codegen import AbiDef, AbiFieldDef, AbiStructDef, AbiTableDef
+from aioeos.contracts import eosio_token
+from aioeos.tables import EosTableReader, decode_rows
+
+
+def hex_row(value):
+    return binascii.hexlify(serializer.serialize(value)).decode()
+
+
+def test_decode_rows():
+    rows = [
+        eosio_token.Create(issuer='eosio', maximum_supply='1.0000 EOS'),
+        eosio_token.Create(issuer='eosio2', maximum_supply='2.0000 EOS')
+    ]
+    assert decode_rows(
+        [hex_row(row) for row in rows], eosio_token.Create
+    ) == rows
+    assert decode_rows(
+        [{'data': hex_row(rows[0]), 'payer': 'eosio'}], eosio_token.Create
+    ) == [{'data': rows[0], 'payer': 'eosio'}]
+
+
+async def test_table_reader(rpc, mocker):
+    abi = AbiDef(
+        version='eosio::abi/1.1',
+        types=[],
+        structs=[
+            AbiStructDef(
+                name='account',
+                base='',
+                fields=[AbiFieldDef(name='balance', type='asset')]
+            )
+        ],
+        actions=[],
+        tables=[
+            AbiTableDef(
+                name='accounts',
+                index_type='i64',
+                key_names=[],
+                key_types=[],
+                type='account'
+            )
+        ]
+    )
+    balances = ['1.0000 EOS', '2.0000 TKN', '3.0000 ABC']
+    requests = []
+
+    async def get_raw_abi(account_name):
+        return {
+            'account_name': account_name,
+            'abi': serializer.serialize(abi) + bytes(4)
+        }
+
+    async def get_table_rows(
+        code, scope, table, *, lower_bound='', limit=10, json=True, **kwargs
+    ):
+        requests.append((code, scope, table, lower_bound, limit, json))
+        start = int(lower_bound or 0)
+        rows = balances[start:start + limit]
+        balance_serializer = serializer.AbiAssetSerializer()
+        return {
+            'rows': [
+                binascii.hexlify(balance_serializer.serialize(x)).decode()
+                for x in rows
+            ],
+            'more': start + limit < len(balances),
+            'next_key': str(start + limit)
+        }
+
+    mocker.patch.object(rpc, 'get_raw_abi', side_effect=get_raw_abi)
+    mocker.patch.object(rpc, 'get_table_rows', side_effect=get_table_rows)
+
+    reader = EosTableReader(rpc, 'eosio.token')
+    response = await reader.get_rows('eosio', 'accounts')
+    assert [row.balance for row in response['rows']] == balances
+    assert type(response['rows'][0]).__name__ == 'Account'
+    assert requests[0] == ('eosio.token', 'eosio', 'accounts', '', 10, False)
+
+    rows = reader.iter_rows('eosio', 'accounts', limit=2)
+    assert [row.balance async for row in rows] == balances
+    assert [request[3] for request in requests[1:]] == ['', '2']
+    assert rpc.get_raw_abi.call_count == 1
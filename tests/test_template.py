@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+from aioeos import serializer, types
+from aioeos.template import EosTransactionTemplate
+
+
+@dataclass
+class Payout(types.BaseAbiObject):
+    sender: types.Name
+    receiver: types.Name
+    amount: types.UInt64
+    memo: str
+
+
+def make_transaction(receiver='receiver1', amount=1, **kwargs):
+    return types.EosTransaction(
+        expiration=kwargs.get(
+            'expiration', datetime(2020, 4, 10, tzinfo=timezone.utc)
+        ),
+        ref_block_num=kwargs.get('ref_block_num', 1),
+        ref_block_prefix=kwargs.get('ref_block_prefix', 2),
+        actions=[
+            types.EosAction(
+                account='eosio',
+                name='noop',
+                authorization=[],
+                data=b'\x01\x02'
+            ),
+            types.EosAction(
+                account='payouts',
+                name='payout',
+                authorization=[
+                    types.EosPermissionLevel(
+                        actor='payouts', permission='active'
+                    )
+                ],
+                data=Payout(
+                    sender='payouts',
+                    receiver=receiver,
+                    amount=amount,
+                    memo='payout memo'
+                )
+            )
+        ]
+    )
+
+
+def test_template_render():
+    template = EosTransactionTemplate(
+        make_transaction(),
+        slots={'receiver': (1, 'receiver'), 'amount': (1, 'amount')}
+    )
+    assert template.render() == serializer.serialize(make_transaction())
+
+    expiration = datetime(2020, 4, 11, tzinfo=timezone.utc)
+    rendered = template.render(
+        expiration=expiration,
+        ref_block_num=65535,
+        ref_block_prefix=1234567,
+        receiver='receiver2',
+        amount=1000
+    )
+    assert rendered == serializer.serialize(make_transaction(
+        receiver='receiver2',
+        amount=1000,
+        expiration=expiration,
+        ref_block_num=65535,
+        ref_block_prefix=1234567
+    ))
+    assert set(template.slots) == {
+        'expiration', 'ref_block_num', 'ref_block_prefix', 'receiver', 'amount'
+    }
+
+    packed = template.render_packed(amount=5)
+    assert packed.packed_bytes == serializer.serialize(
+        make_transaction(amount=5)
+    )
+
+
+def test_template_validation():
+    with pytest.raises(AssertionError):
+        EosTransactionTemplate(make_transaction(), slots={'memo': (1, 'memo')})
+
+    with pytest.raises(AssertionError):
+        EosTransactionTemplate(make_transaction(), slots={'data': (0, 'a')})
+
+    with pytest.raises(KeyError):
+        EosTransactionTemplate(make_transaction()).render(receiver='test')
@@ -0,0 +1,157 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from aioeos import exceptions
+from aioeos.tracker import EosTransactionTracker
+
+
+@pytest.fixture
+def chain(mocker, rpc):
+    """Simulates a chain producing one block per get_info call"""
+    state = {
+        'infos': [
+            {
+                'head_block_num': 10,
+                'last_irreversible_block_num': 5,
+                'head_block_time': '2020-04-10T10:00:00.000'
+            },
+            {
+                'head_block_num': 11,
+                'last_irreversible_block_num': 10,
+                'head_block_time': '2020-04-10T10:00:05.000'
+            }
+        ],
+        'blocks': {
+            10: {
+                'block_num': 10,
+                'id': 'block10',
+                'transactions': [
+                    {'status': 'executed', 'trx': {'id': 'tx1'}},
+                    {'status': 'executed', 'trx': 'deferred1'}
+                ]
+            },
+            11: {'block_num': 11, 'id': 'block11', 'transactions': []}
+        }
+    }
+
+    async def get_info():
+        if len(state['infos']) > 1:
+            return state['infos'].pop(0)
+        return state['infos'][0]
+
+    async def get_block(block_num):
+        return state['blocks'][block_num]
+
+    mocker.patch.object(rpc, 'get_info', side_effect=get_info)
+    mocker.patch.object(rpc, 'get_block', side_effect=get_block)
+    return state
+
+
+async def test_tracker(rpc, chain):
+    tracker = EosTransactionTracker(rpc, poll_interval=0)
+    expiration = datetime(2020, 4, 10, 10, 2, tzinfo=timezone.utc)
+    tx1 = tracker.track('tx1', expiration)
+    deferred = tracker.track('deferred1', expiration)
+    expired = tracker.track(
+        'tx2', datetime(2020, 4, 10, 10, 0, 3, tzinfo=timezone.utc)
+    )
+    assert tracker.track('tx1', expiration) is tx1
+
+    assert await tx1.included == 10
+    assert await tx1.irreversible == 10
+    assert await deferred.irreversible == 10
+    assert tx1.block_id == 'block10'
+
+    with pytest.raises(exceptions.EosTransactionExpiredException):
+        await expired.included
+
+    # nothing left to track, block stream should stop
+    await tracker._task
+    assert not tracker._pending
+    rpc.get_block.assert_any_call(11)
+
+
+async def test_tracker_fork(rpc, chain):
+    chain['blocks'][10]['id'] = 'forked'
+    tracker = EosTransactionTracker(rpc, poll_interval=0)
+    tx1 = tracker.track(
+        'tx1', datetime(2020, 4, 10, 10, 0, 3, tzinfo=timezone.utc)
+    )
+
+    async def replace_block(block_num):
+        # block 10 from the fork is replaced once it's irreversible
+        return {'block_num': 10, 'id': 'block10', 'transactions': []}
+
+    assert await tx1.included == 10
+    rpc.get_block.side_effect = replace_block
+
+    # transaction is back to pending state and expires
+    with pytest.raises(exceptions.EosTransactionExpiredException):
+        await tx1.irreversible
+    assert tx1.block_num is None
+    await tracker.close()
+
+
+async def test_tracker_fork_reinclusion(rpc, chain):
+    chain['blocks'][10]['id'] = 'forked'
+    chain['blocks'][12] = {
+        'block_num': 12,
+        'id': 'block12',
+        'transactions': [{'status': 'executed', 'trx': {'id': 'tx1'}}]
+    }
+    chain['infos'][1] = {
+        'head_block_num': 12,
+        'last_irreversible_block_num': 12,
+        'head_block_time': '2020-04-10T10:00:10.000'
+    }
+    tracker = EosTransactionTracker(rpc, poll_interval=0)
+    tx1 = tracker.track(
+        'tx1', datetime(2020, 4, 10, 10, 0, 3, tzinfo=timezone.utc)
+    )
+
+    # included in a block which gets dropped by a fork
+    assert await tx1.included == 10
+    chain['blocks'][10] = {
+        'block_num': 10, 'id': 'block10', 'transactions': []
+    }
+
+    # transaction reappears in a later block, which becomes irreversible
+    assert await tx1.irreversible == 12
+    assert tx1.block_id == 'block12'
+    assert tx1.blocks == {12: 'block12'}
+    await tracker.close()
+
+
+async def test_tracker_rpc_error(rpc, mocker):
+    async def get_info():
+        raise exceptions.EosRpcException()
+
+    mocker.patch.object(rpc, 'get_info', side_effect=get_info)
+    tracker = EosTransactionTracker(rpc, backoff=0)
+    pending = tracker.track(
+        'tx2', datetime(2100, 1, 1, tzinfo=timezone.utc)
+    )
+    expired = tracker.track('tx1', datetime.now(timezone.utc))
+
+    # only expired transaction fails, as its inclusion is unknown
+    with pytest.raises(exceptions.EosRpcException):
+        await expired.irreversible
+    assert not pending.included.done()
+    await tracker.close()
+
+
+async def test_tracker_retries_failed_poll(rpc, chain):
+    get_info = rpc.get_info.side_effect
+    failures = [exceptions.EosRpcException(), ConnectionError()]
+
+    async def flaky_get_info():
+        if failures:
+            raise failures.pop(0)
+        return await get_info()
+
+    rpc.get_info.side_effect = flaky_get_info
+    tracker = EosTransactionTracker(rpc, poll_interval=0, backoff=0)
+    tx1 = tracker.track('tx1', datetime(2100, 1, 1, tzinfo=timezone.utc))
+    assert await tx1.irreversible == 10
+    assert rpc.get_info.call_count == 4
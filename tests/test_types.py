@@ -0,0 +1,50 @@
+from dataclasses import asdict, dataclass
+import pickle
+
+from aioeos import serializer, types
+from aioeos.rpc import mixed_to_dict
+
+
+@types.add_slots
+@dataclass
+class Transfer(types.BaseAbiObject):
+    sender: types.Name
+    amount: types.UInt64 = 0
+
+
+@types.add_slots
+@dataclass
+class MemoTransfer(Transfer):
+    memo: str = ''
+
+
+def test_slotted_abi_objects():
+    action = types.EosAction(
+        account='eosio.token',
+        name='transfer',
+        authorization=[
+            types.EosPermissionLevel(actor='sender', permission='active')
+        ],
+        data=Transfer(sender='sender', amount=5)
+    )
+    assert not hasattr(action, '__dict__')
+    assert not hasattr(action.authorization[0], '__dict__')
+    assert not hasattr(types.EosTransaction(), '__dict__')
+    assert mixed_to_dict(action) == asdict(action)
+    assert asdict(action)['data'] == {'sender': 'sender', 'amount': 5}
+    assert pickle.loads(pickle.dumps(action)) == action
+
+    transaction = types.EosTransaction(actions=[action])
+    serialized = serializer.serialize(transaction)
+    _, deserialized = serializer.deserialize(serialized, types.EosTransaction)
+    assert serializer.serialize(deserialized) == serialized
+
+
+def test_slotted_subclass():
+    transfer = MemoTransfer(sender='sender', memo='memo')
+    assert not hasattr(transfer, '__dict__')
+    assert MemoTransfer.__slots__ == ('memo',)
+    assert transfer.amount == 0
+    assert serializer.serialize(transfer) == (
+        serializer.serialize(Transfer(sender='sender')) + b'\x04memo'
+    )
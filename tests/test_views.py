@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from aioeos import serializer, types
+from aioeos.views import EosActionView, EosTransactionView
+
+
+@dataclass
+class Transfer(types.BaseAbiObject):
+    sender: types.Name
+    receiver: types.Name
+    amount: types.UInt64
+
+
+def permission_level(actor, permission='active'):
+    return types.EosPermissionLevel(actor=actor, permission=permission)
+
+
+def make_transaction():
+    return types.EosTransaction(
+        expiration=datetime(2020, 4, 10, tzinfo=timezone.utc),
+        ref_block_num=1,
+        ref_block_prefix=2,
+        max_net_usage_words=300,
+        max_cpu_usage_ms=5,
+        delay_sec=200,
+        context_free_actions=[
+            types.EosAction(
+                account='eosio.null', name='nonce', authorization=[],
+                data=b'\x01'
+            )
+        ],
+        actions=[
+            types.EosAction(
+                account='eosio',
+                name='noop',
+                authorization=[permission_level('alice')],
+                data=b''
+            ),
+            types.EosAction(
+                account='eosio.token',
+                name='transfer',
+                authorization=[
+                    permission_level('alice'),
+                    permission_level('bob', 'owner')
+                ],
+                data=Transfer(sender='alice', receiver='bob', amount=10)
+            )
+        ]
+    )
+
+
+def test_transaction_view():
+    transaction = make_transaction()
+    packed = serializer.serialize(transaction)
+    view = EosTransactionView(
+        packed, payload_types={('eosio.token', 'transfer'): Transfer}
+    )
+
+    assert view.expiration == transaction.expiration
+    assert view.ref_block_num == 1
+    assert view.ref_block_prefix == 2
+    assert view.max_net_usage_words == 300
+    assert view.max_cpu_usage_ms == 5
+    assert view.delay_sec == 200
+    assert len(view.context_free_actions) == 1
+    assert [action.name for action in view.actions] == ['noop', 'transfer']
+
+    transfers = view.find_actions('eosio.token', 'transfer')
+    assert len(transfers) == 1
+    assert transfers[0].account == 'eosio.token'
+    assert transfers[0].authorization == transaction.actions[1].authorization
+    assert transfers[0].decode_data() == transaction.actions[1].data
+    assert view.find_actions('eosio.token', 'issue') == []
+    assert len(view.find_actions('eosio')) == 1
+
+    # other actions are kept in binary format
+    assert view.actions[0].decode_data() == b''
+    assert serializer.serialize(view.to_transaction()) == packed
+    assert view.to_transaction().actions[1].data == Transfer(
+        sender='alice', receiver='bob', amount=10
+    )
+    assert EosTransactionView.from_hex(packed.hex()).id == view.id
+
+
+def test_action_view():
+    action = make_transaction().actions[1]
+    packed = b'\xff' + serializer.serialize(action)
+    view = EosActionView(packed, 1)
+    assert view.size == len(packed) - 1
+    assert view.name == 'transfer'
+    assert view.data == serializer.serialize(action.data)
+    assert view.decode_data(Transfer) == action.data